@@ -0,0 +1,107 @@
+"""
+Cost of matching certification phrases against the catalog
+
+Replays the section and pattern stages of CertificationExtractor with the
+previous linear scan and with the indexed lookup, checks that both return
+identical certifications for every resume, and reports the timings.
+
+Usage:
+    python -m benchmarks.certification_matcher_benchmark
+"""
+import random
+
+from benchmarks.timing import best_of
+from utils.certification_extractor import CertificationExtractor
+from utils.parser import ParsedDocument
+
+RESUME_COUNTS = [1, 10, 50]
+REPEATS = 3
+
+FILLER = [
+    'designed', 'scalable', 'services', 'team', 'delivered', 'platform', 'migration',
+    'engineer', 'professional', 'associate', 'developer', 'administrator', 'certified',
+    'cloud', 'data', 'security', 'network', 'project', 'management', 'expert', 'master',
+]
+
+
+def build_resume(extractor: CertificationExtractor, rng: random.Random, lines: int) -> str:
+    certifications = sorted(extractor.all_certifications)
+    body = []
+    for _ in range(lines):
+        words = rng.sample(FILLER, rng.randint(4, 10))
+        if rng.random() < 0.3:
+            words.insert(rng.randrange(len(words)), rng.choice(certifications))
+        body.append(' '.join(words) + rng.choice([',', '.', '', ' - 2021']))
+    certs = ', '.join(rng.sample(certifications, 8))
+    return 'Experience\n' + '\n'.join(body) + '\n\nCertifications\n' + certs + '\n'
+
+
+def linear_match(extractor: CertificationExtractor, phrase_clean: str):
+    # Catalog (file) order, which decides the first related certification
+    for cert in extractor._ordered_certifications:
+        if phrase_clean in cert.lower() or cert.lower() in phrase_clean:
+            return cert
+    return None
+
+
+def run_stages(extractor: CertificationExtractor, texts: list) -> list:
+    results = []
+    for text in texts:
+        document = ParsedDocument(text)
+        found = set()
+        found.update(extractor._extract_from_certification_sections(document))
+        found.update(extractor._extract_with_certification_patterns(document))
+        results.append(found)
+    return results
+
+
+def collect_phrases(extractor: CertificationExtractor, texts: list) -> list:
+    phrases = []
+    original = extractor._match_certification
+
+    def recording_match(phrase_clean):
+        phrases.append(phrase_clean)
+        return original(phrase_clean)
+
+    extractor._match_certification = recording_match
+    try:
+        run_stages(extractor, texts)
+    finally:
+        del extractor._match_certification
+    return phrases
+
+
+def match_all(match, phrases: list) -> list:
+    return [match(phrase) for phrase in phrases]
+
+
+def main():
+    rng = random.Random(7)
+    indexed = CertificationExtractor()
+    linear = CertificationExtractor()
+    linear._match_certification = lambda phrase_clean: linear_match(linear, phrase_clean)
+
+    print(f"{'resumes':>8} {'lines':>6} {'phrases':>8} {'linear ms':>10} {'indexed ms':>11} "
+          f"{'match speedup':>14} {'stage speedup':>14}")
+    for count in RESUME_COUNTS:
+        for lines in (40, 200):
+            texts = [build_resume(indexed, rng, lines) for _ in range(count)]
+            linear_stage_time, linear_results = best_of(REPEATS, run_stages, linear, texts)
+            indexed_stage_time, indexed_results = best_of(REPEATS, run_stages, indexed, texts)
+            if linear_results != indexed_results:
+                raise SystemExit('Indexed certification matching diverged from the linear scan')
+
+            phrases = collect_phrases(indexed, texts)
+            linear_time, linear_matches = best_of(REPEATS, match_all, linear._match_certification, phrases)
+            indexed_time, indexed_matches = best_of(REPEATS, match_all, indexed._match_certification, phrases)
+            if linear_matches != indexed_matches:
+                raise SystemExit('Indexed certification matching diverged from the linear scan')
+
+            print(f"{count:>8} {lines:>6} {len(phrases):>8} {linear_time * 1000:>10.1f} "
+                  f"{indexed_time * 1000:>11.1f} {linear_time / indexed_time:>13.1f}x "
+                  f"{linear_stage_time / indexed_stage_time:>13.1f}x")
+    print('Outputs identical for all resumes')
+
+
+if __name__ == '__main__':
+    main()
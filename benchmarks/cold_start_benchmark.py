@@ -0,0 +1,144 @@
+"""
+Cold-start benchmark for the Lambda entry point
+
+Each sample runs in a fresh interpreter, like a new Lambda container:
+import lambda_handler, then serve the first /analyze request through the
+Mangum handler with a fake Textract client. The run fails (exit status 1)
+if the import exceeds its budget or if a module that is meant to load
+lazily was imported at startup.
+
+Usage:
+    python -m benchmarks.cold_start_benchmark
+    python -m benchmarks.cold_start_benchmark --samples 10 --import-budget-ms 900
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# Modules that must stay off the import path of lambda_handler
+DEFERRED_MODULES = ('boto3', 'botocore.client', 'pypdf', 'jinja2')
+
+DEFAULT_IMPORT_BUDGET_MS = 1000.0
+DEFAULT_FIRST_REQUEST_BUDGET_MS = 1000.0
+
+
+def api_gateway_event(filename: str, content: bytes) -> dict:
+    """Build an API Gateway proxy event posting one file to /analyze"""
+    import base64
+
+    boundary = 'cold-start-boundary'
+    body = (
+        f'--{boundary}\r\n'
+        f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        'Content-Type: image/png\r\n\r\n'
+    ).encode('utf-8') + content + f'\r\n--{boundary}--\r\n'.encode('utf-8')
+    return {
+        'resource': '/analyze',
+        'path': '/analyze',
+        'httpMethod': 'POST',
+        'headers': {'content-type': f'multipart/form-data; boundary={boundary}', 'host': 'bench'},
+        'multiValueHeaders': {},
+        'queryStringParameters': {'use_cache': 'false'},
+        'multiValueQueryStringParameters': None,
+        'requestContext': {'resourcePath': '/analyze', 'httpMethod': 'POST', 'stage': 'bench'},
+        'body': base64.b64encode(body).decode('ascii'),
+        'isBase64Encoded': True,
+    }
+
+
+def child():
+    """Measure one cold start in this (fresh) interpreter and print it as JSON"""
+    import logging
+
+    logging.disable(logging.CRITICAL)
+    start = time.perf_counter()
+    import lambda_handler
+    import_done = time.perf_counter()
+    eagerly_imported = [name for name in DEFERRED_MODULES if name in sys.modules]
+
+    from benchmarks.corpus import FakeTextractClient, build_corpus
+    import main
+    import utils.textract_service as textract_module
+
+    entry = build_corpus(documents_per_length=1)[1]
+    main.textract_service = textract_module.TextractService(
+        textract_client=FakeTextractClient.for_corpus([entry])
+    )
+    event = api_gateway_event(entry['name'], entry['document_bytes'])
+
+    request_start = time.perf_counter()
+    response = lambda_handler.lambda_handler(event, None)
+    first_request_done = time.perf_counter()
+    lambda_handler.lambda_handler(event, None)
+    warm_request_done = time.perf_counter()
+
+    print(json.dumps({
+        'import_ms': (import_done - start) * 1000,
+        'first_request_ms': (first_request_done - request_start) * 1000,
+        'warm_request_ms': (warm_request_done - first_request_done) * 1000,
+        'status': response['statusCode'],
+        'eagerly_imported': eagerly_imported,
+    }))
+
+
+def run_sample() -> dict:
+    env = dict(os.environ)
+    # Keep credentials lookups local, as in a container with an execution role
+    env.setdefault('AWS_ACCESS_KEY_ID', 'bench')
+    env.setdefault('AWS_SECRET_ACCESS_KEY', 'bench')
+    env.setdefault('AWS_DEFAULT_REGION', 'ap-southeast-2')
+    with tempfile.TemporaryDirectory() as store_dir:
+        # A fresh analysis store per sample, outside the working tree
+        env.setdefault('ANALYSIS_STORE_PATH', os.path.join(store_dir, 'analyses.db'))
+        output = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.cold_start_benchmark', '--child'],
+            env=env, check=True, capture_output=True, text=True
+        ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--samples', type=int, default=5)
+    parser.add_argument('--import-budget-ms', type=float,
+                        default=float(os.getenv('COLD_START_IMPORT_BUDGET_MS', DEFAULT_IMPORT_BUDGET_MS)))
+    parser.add_argument('--first-request-budget-ms', type=float,
+                        default=float(os.getenv('COLD_START_FIRST_REQUEST_BUDGET_MS', DEFAULT_FIRST_REQUEST_BUDGET_MS)))
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child()
+        return
+
+    samples = [run_sample() for _ in range(args.samples)]
+    import_ms = statistics.median(sample['import_ms'] for sample in samples)
+    first_request_ms = statistics.median(sample['first_request_ms'] for sample in samples)
+    warm_request_ms = statistics.median(sample['warm_request_ms'] for sample in samples)
+    eagerly_imported = sorted({name for sample in samples for name in sample['eagerly_imported']})
+
+    print(f"{'import lambda_handler':<24}{import_ms:>10.1f} ms  (budget {args.import_budget_ms:.0f} ms)")
+    print(f"{'first request':<24}{first_request_ms:>10.1f} ms  (budget {args.first_request_budget_ms:.0f} ms)")
+    print(f"{'warm request':<24}{warm_request_ms:>10.1f} ms")
+
+    failures = []
+    if any(sample['status'] != 200 for sample in samples):
+        failures.append("first request did not return 200")
+    if eagerly_imported:
+        failures.append(f"imported at startup: {', '.join(eagerly_imported)}")
+    if import_ms > args.import_budget_ms:
+        failures.append(f"import took {import_ms:.1f} ms")
+    if first_request_ms > args.first_request_budget_ms:
+        failures.append(f"first request took {first_request_ms:.1f} ms")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+"""
+Synthetic resume corpus and recorded Textract responses for offline benchmarks
+"""
+import hashlib
+import random
+import time
+from typing import Any, Dict, List
+
+from utils.certification_extractor import CertificationExtractor
+from utils.skill_extractor import SkillExtractor
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Resume length buckets: number of experience bullet lines
+LENGTHS = {
+    'short': 15,
+    'medium': 60,
+    'long': 200,
+}
+
+VERBS = ['Built', 'Designed', 'Led', 'Migrated', 'Automated', 'Optimized', 'Maintained', 'Delivered']
+OBJECTS = [
+    'payment services', 'data pipelines', 'internal tooling', 'customer dashboards',
+    'the deployment platform', 'search infrastructure', 'reporting APIs', 'mobile backends',
+]
+OUTCOMES = [
+    'reducing latency by 40%', 'serving 2M users', 'cutting costs by 30%', 'with zero downtime',
+    'for 12 product teams', 'ahead of schedule', 'across three regions',
+]
+
+
+def build_resume(rng: random.Random, lines: int, skills: List[str], certifications: List[str]) -> str:
+    """Generate one resume with the usual sections and roughly `lines` bullets"""
+    name = f"Candidate {rng.randint(1000, 9999)}"
+    years = rng.randint(2, 15)
+    top_skills = rng.sample(skills, 6)
+    output = [
+        name,
+        'Software Engineer',
+        f"{name.lower().replace(' ', '.')}@example.com | 555-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+        '',
+        'Summary',
+        f"Engineer with {years}+ years of experience with {top_skills[0]}.",
+        f"Proficient in {', '.join(top_skills[1:4])}.",
+        '',
+        'Technical Skills',
+        ', '.join(rng.sample(skills, rng.randint(8, 20))),
+        ', '.join(rng.sample(skills, rng.randint(4, 10))),
+        '',
+        'Experience',
+    ]
+    for index in range(lines):
+        if index % 12 == 0:
+            start_year = rng.randint(2005, 2022)
+            output.append(f"Company {rng.randint(1, 500)} - Engineer ({start_year} - {start_year + rng.randint(1, 4)})")
+        bullet = f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)} using {rng.choice(skills)}"
+        if rng.random() < 0.5:
+            bullet += f" and {rng.choice(skills)}"
+        output.append(f"{bullet}, {rng.choice(OUTCOMES)}")
+    output.append('')
+    output.append('Certifications')
+    for cert in rng.sample(certifications, rng.randint(1, 6)):
+        output.append(f"{cert} - {rng.randint(2012, 2024)}")
+    output.append('')
+    output.append('Education')
+    output.append(f"B.Sc. Computer Science, {rng.randint(1995, 2020)}")
+    return '\n'.join(output)
+
+
+def build_corpus(documents_per_length: int = 10, seed: int = 1234) -> List[Dict[str, Any]]:
+    """
+    Generate resumes of every length bucket
+
+    Returns:
+        List of {'name', 'length', 'text', 'document_bytes'} entries
+    """
+    rng = random.Random(seed)
+    skills = sorted(SkillExtractor().all_skills)
+    certifications = sorted(CertificationExtractor().all_certifications)
+    corpus = []
+    for length, lines in LENGTHS.items():
+        for index in range(documents_per_length):
+            text = build_resume(rng, lines, skills, certifications)
+            corpus.append({
+                'name': f"{length}-{index}.png",
+                'length': length,
+                'text': text,
+                # Distinct bytes per document so content-addressed caches see each
+                # one, behind a PNG signature so uploads pass the content check
+                'document_bytes': PNG_SIGNATURE + f"FAKE-DOCUMENT\n{text}".encode('utf-8'),
+            })
+    return corpus
+
+
+def textract_response(text: str, seed: int = 0) -> Dict[str, Any]:
+    """Build a detect_document_text style response with PAGE, LINE and WORD blocks"""
+    rng = random.Random(seed)
+    blocks = [{'BlockType': 'PAGE', 'Id': 'page-1', 'Confidence': 99.9}]
+    for line_number, line in enumerate(text.split('\n')):
+        if not line:
+            continue
+        blocks.append({
+            'BlockType': 'LINE',
+            'Id': f"line-{line_number}",
+            'Text': line,
+            'Confidence': round(rng.uniform(90, 99.9), 3),
+            'Page': 1,
+        })
+        for word_number, word in enumerate(line.split()):
+            blocks.append({
+                'BlockType': 'WORD',
+                'Id': f"word-{line_number}-{word_number}",
+                'Text': word,
+                'Confidence': round(rng.uniform(85, 99.9), 3),
+                'Page': 1,
+            })
+    return {'DocumentMetadata': {'Pages': 1}, 'Blocks': blocks}
+
+
+class FakeTextractClient:
+    """
+    Stand-in for the boto3 Textract client that replays recorded responses
+
+    Args:
+        responses: Mapping of document bytes to detect_document_text responses
+        latency: Seconds to sleep per call, to model the network round-trip
+    """
+
+    def __init__(self, responses: Dict[bytes, Dict[str, Any]], latency: float = 0.0):
+        self._responses = {hashlib.sha256(document).hexdigest(): response for document, response in responses.items()}
+        self.latency = latency
+        self.calls = 0
+
+    @classmethod
+    def for_corpus(cls, corpus: List[Dict[str, Any]], latency: float = 0.0) -> 'FakeTextractClient':
+        responses = {
+            entry['document_bytes']: textract_response(entry['text'], seed=index)
+            for index, entry in enumerate(corpus)
+        }
+        return cls(responses, latency=latency)
+
+    def detect_document_text(self, Document: Dict[str, bytes]) -> Dict[str, Any]:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return self._responses[hashlib.sha256(Document['Bytes']).hexdigest()]
@@ -0,0 +1,101 @@
+"""
+Benchmark for job-description match scoring
+
+Indexes synthetic candidates drawn from the real taxonomy, then ranks them
+against a job description with the vectorized NumPy scorer and the
+pure-Python fallback. At sizes where it is affordable, the top-k of both
+is checked against a brute-force score of every candidate.
+
+Usage:
+    python -m benchmarks.match_benchmark
+    python -m benchmarks.match_benchmark --sizes 10000 100000 1000000 --top-k 20
+"""
+import argparse
+import random
+import sys
+
+from benchmarks.timing import time_call
+from utils.match_scorer import MatchScorer, _top_k_numpy, _top_k_python
+from utils.search_index import CandidateIndex, normalize_term
+from utils.skill_extractor import SkillExtractor
+from utils.certification_extractor import CertificationExtractor
+
+JOB_DESCRIPTION = """
+Senior Backend Engineer
+
+Requirements
+- 5+ years of experience with Python and Go
+- Kubernetes, Docker and Terraform in production
+- PostgreSQL and Redis
+- AWS; AWS Certified Solutions Architect preferred
+- Strong communication and leadership
+"""
+
+# Brute-force scoring is slow in pure Python, so it is skipped above this size
+REFERENCE_MAX_CANDIDATES = 100_000
+
+
+def fill_index(index: CandidateIndex, count: int, seed: int):
+    """Add `count` synthetic candidates with Zipf-like skill popularity"""
+    rng = random.Random(seed)
+    skills = sorted(normalize_term(skill) for skill in SkillExtractor().all_skills)
+    certifications = sorted(normalize_term(cert) for cert in CertificationExtractor().all_certifications)
+    rng.shuffle(skills)
+    rng.shuffle(certifications)
+    skill_weights = [1 / (rank + 1) for rank in range(len(skills))]
+    certification_weights = [1 / (rank + 1) for rank in range(len(certifications))]
+    for number in range(len(index), len(index) + count):
+        index.add(
+            f"{number:064x}",
+            rng.choices(skills, skill_weights, k=rng.randint(5, 30)),
+            rng.choices(certifications, certification_weights, k=rng.randint(0, 4)),
+        )
+
+
+def brute_force(index: CandidateIndex, requirements, top_k: int):
+    scored = []
+    for slot, doc_id in enumerate(index._doc_ids):
+        score = sum(requirements.get(term, 0.0) for term in index.document_terms(doc_id))
+        if score:
+            scored.append((-score, slot))
+    scored.sort()
+    return [(slot, -score) for score, slot in scored[:top_k]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--top-k', type=int, default=10)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=11)
+    args = parser.parse_args()
+
+    index = CandidateIndex()
+    scorer = MatchScorer(index)
+    requirements = scorer.job_requirements(JOB_DESCRIPTION)
+    print(f"job requirements: {len(requirements)} terms, total weight {sum(requirements.values()):.0f}")
+    print(f"{'candidates':>12}{'numpy ms':>12}{'python ms':>12}{'rank() ms':>12}  check")
+
+    failures = 0
+    for size in sorted(args.sizes):
+        fill_index(index, size - len(index), args.seed + size)
+        slots, postings, _ = index.snapshot_postings(requirements)
+
+        numpy_ms = time_call(lambda: _top_k_numpy(slots, postings, requirements, args.top_k), args.repeats)
+        python_ms = time_call(lambda: _top_k_python(postings, requirements, args.top_k), 1)
+        rank_ms = time_call(lambda: scorer.rank(requirements, top_k=args.top_k), args.repeats)
+
+        numpy_top = _top_k_numpy(slots, postings, requirements, args.top_k)
+        python_top = _top_k_python(postings, requirements, args.top_k)
+        check = 'ok' if numpy_top == python_top else 'MISMATCH numpy/python'
+        if numpy_top == python_top and size <= REFERENCE_MAX_CANDIDATES:
+            if numpy_top != brute_force(index, requirements, args.top_k):
+                check = 'MISMATCH brute force'
+        failures += check != 'ok'
+        print(f"{size:>12}{numpy_ms:>12.2f}{python_ms:>12.1f}{rank_ms:>12.2f}  {check}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark for near-duplicate detection
+
+Generates distinct synthetic resumes plus lightly edited copies of some of
+them (a reworded line, a dropped line, an extra line), indexes the
+originals, then looks every document up. Reports recall on the edited
+copies, false positives on the distinct resumes, and LSH lookup time
+against a brute-force comparison with every indexed signature. The NumPy
+and pure-Python signatures are checked to be byte-identical.
+
+Usage:
+    python -m benchmarks.near_duplicate_benchmark
+    python -m benchmarks.near_duplicate_benchmark --documents 20000 --variants 1000
+"""
+import argparse
+import random
+import sys
+import time
+
+from benchmarks.corpus import LENGTHS, build_resume
+from utils.certification_extractor import CertificationExtractor
+from utils.near_duplicates import NearDuplicateIndex, _min_hashes_numpy, _min_hashes_python, shingles
+from utils.skill_extractor import SkillExtractor
+
+MIN_RECALL = 0.95
+
+
+def edit(rng: random.Random, text: str) -> str:
+    """Apply a small edit of the kind re-exported resumes usually differ by"""
+    lines = text.split('\n')
+    position = rng.randrange(1, len(lines))
+    change = rng.choice(('reword', 'drop', 'insert'))
+    if change == 'reword':
+        lines[position] = lines[position].replace('-', '–') + ' (updated)'
+    elif change == 'drop':
+        del lines[position]
+    else:
+        lines.insert(position, f"Phone: +1 555 {rng.randint(1000000, 9999999)}")
+    return '\n'.join(lines)
+
+
+def time_per_call(func, items) -> float:
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    return (time.perf_counter() - start) / len(items) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--documents', type=int, default=5000)
+    parser.add_argument('--variants', type=int, default=500)
+    parser.add_argument('--threshold', type=float, default=0.85)
+    parser.add_argument('--seed', type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    skills = sorted(SkillExtractor().all_skills)
+    certifications = sorted(CertificationExtractor().all_certifications)
+    lengths = list(LENGTHS.values())
+    originals = [build_resume(rng, rng.choice(lengths), skills, certifications) for _ in range(args.documents)]
+    variants = [(number, edit(rng, originals[number])) for number in rng.sample(range(args.documents), args.variants)]
+    distinct = [build_resume(rng, rng.choice(lengths), skills, certifications) for _ in range(args.variants)]
+
+    index = NearDuplicateIndex(threshold=args.threshold)
+    sample = originals[:200]
+    for text in sample:
+        hashes = shingles(text)
+        if _min_hashes_numpy(index._a, index._b, hashes) != _min_hashes_python(index._a, index._b, hashes):
+            print("MISMATCH between NumPy and pure-Python signatures")
+            sys.exit(1)
+    numpy_us = time_per_call(index.signature, sample)
+    python_us = time_per_call(lambda text: _min_hashes_python(index._a, index._b, shingles(text)), sample[:50])
+    print(f"signature: numpy {numpy_us:.0f} us/doc, python {python_us:.0f} us/doc")
+
+    start = time.perf_counter()
+    for number, text in enumerate(originals):
+        index.add(f"doc-{number}", index.signature(text))
+    print(f"indexed {len(index)} documents in {time.perf_counter() - start:.2f}s")
+
+    variant_signatures = [(number, index.signature(text)) for number, text in variants]
+    distinct_signatures = [index.signature(text) for text in distinct]
+
+    found = sum(
+        1 for number, signature in variant_signatures
+        if (index.query(signature) or (None,))[0] == f"doc-{number}"
+    )
+    false_positives = sum(1 for signature in distinct_signatures if index.query(signature) is not None)
+    recall = found / len(variants)
+    print(f"recall on edited copies: {found}/{len(variants)} ({recall:.1%})")
+    print(f"false positives on distinct resumes: {false_positives}/{len(distinct)}")
+
+    signatures = list(index._signatures.values())
+    queries = [signature for _, signature in variant_signatures] + distinct_signatures
+    lsh_us = time_per_call(index.query, queries)
+    brute_us = time_per_call(
+        lambda query: max(index.similarity(query, signature) for signature in signatures),
+        queries[:max(1, len(queries) // 20)]
+    )
+    print(f"lookup: lsh {lsh_us:.0f} us, brute force {brute_us:.0f} us ({brute_us / lsh_us:.0f}x)")
+
+    sys.exit(0 if recall >= MIN_RECALL and false_positives == 0 else 1)
+
+
+if __name__ == '__main__':
+    main()
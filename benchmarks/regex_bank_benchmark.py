@@ -0,0 +1,102 @@
+"""
+Per-resume saving from compiling extractor patterns once
+
+Replays the section-header, pattern and abbreviation stages of both
+extractors the way they used to run (pattern strings handed to module-level
+re functions on every call) and with the precompiled patterns the
+extractors now hold. The "cold cache" column purges the re module cache
+before every resume, which is what happens once a growing taxonomy pushes
+more than re's 512 cached patterns through it.
+
+Usage:
+    python -m benchmarks.regex_bank_benchmark
+"""
+import random
+import re
+
+from benchmarks.certification_matcher_benchmark import build_resume
+from benchmarks.timing import best_of
+from utils.certification_extractor import CertificationExtractor
+from utils.parser import ParsedDocument
+from utils.skill_extractor import SkillExtractor
+
+RESUMES = 50
+REPEATS = 3
+SECTION_PATTERN = r'{header}[:\s]*([^\n]*(?:\n[^\n]*)*?)(?:\n\n|\n[A-Z]|\n\d|$)'
+
+
+def legacy_sections(headers: list, text_lower: str) -> list:
+    sections = []
+    for header in headers:
+        pattern = SECTION_PATTERN.format(header=re.escape(header))
+        for match in re.finditer(pattern, text_lower, re.IGNORECASE | re.MULTILINE):
+            sections.append(match.group(1))
+    return sections
+
+
+def legacy_stages(skills: SkillExtractor, certs: CertificationExtractor, text: str, purge: bool) -> tuple:
+    if purge:
+        re.purge()
+    text_lower = text.lower()
+    skill_sections = legacy_sections(skills.skill_headers, text_lower)
+    cert_sections = legacy_sections(certs.certification_headers, text_lower)
+    phrases = [
+        match.group(2)
+        for match in re.finditer(r'(\d+)\+?\s*years?\s*(?:of\s*)?experience\s*(?:with|in)\s*([^,\n]+)', text_lower)
+    ]
+    phrases += [match.group(1) for match in re.finditer(r'proficient\s*(?:in|with)\s*([^.\n]+)', text_lower)]
+    for pattern in certs.certification_patterns:
+        phrases += [
+            re.sub(r'[^\w\s]', '', match.group(1).strip()).strip()
+            for match in re.finditer(pattern, text_lower)
+        ]
+    abbreviations = {
+        full_name for abbrev, full_name in certs.abbreviations.items()
+        if re.search(r'\b' + re.escape(abbrev) + r'\b', text_lower)
+    }
+    return skill_sections, cert_sections, phrases, abbreviations
+
+
+def compiled_stages(skills: SkillExtractor, certs: CertificationExtractor, text: str, purge: bool) -> tuple:
+    if purge:
+        re.purge()
+    document = ParsedDocument(text)
+    text_lower = document.text_lower
+    skill_sections = document.section_texts(skills.section_scanner)
+    cert_sections = document.section_texts(certs.section_scanner)
+    phrases = [match.group(2) for match in skills.experience_pattern.finditer(text_lower)]
+    phrases += [match.group(1) for match in skills.proficient_pattern.finditer(text_lower)]
+    for pattern in certs.compiled_certification_patterns:
+        phrases += [
+            certs.punctuation_pattern.sub('', match.group(1).strip()).strip()
+            for match in pattern.finditer(text_lower)
+        ]
+    abbreviations = certs._extract_certification_abbreviations(document)
+    return skill_sections, cert_sections, phrases, abbreviations
+
+
+def run(stages, skills, certs, texts, purge):
+    return [stages(skills, certs, text, purge) for text in texts]
+
+
+def main():
+    rng = random.Random(11)
+    skills = SkillExtractor()
+    certs = CertificationExtractor()
+    texts = [build_resume(certs, rng, lines) for lines in (40, 120) for _ in range(RESUMES // 2)]
+
+    print(f"{'re cache':>9} {'legacy ms/resume':>17} {'compiled ms/resume':>19} {'saving':>8}")
+    for purge in (False, True):
+        legacy_time, legacy_results = best_of(REPEATS, run, legacy_stages, skills, certs, texts, purge)
+        compiled_time, compiled_results = best_of(REPEATS, run, compiled_stages, skills, certs, texts, purge)
+        if legacy_results != compiled_results:
+            raise SystemExit('Precompiled patterns diverged from the per-call patterns')
+        legacy_ms = legacy_time * 1000 / len(texts)
+        compiled_ms = compiled_time * 1000 / len(texts)
+        print(f"{'cold' if purge else 'warm':>9} {legacy_ms:>17.3f} {compiled_ms:>19.3f} "
+              f"{(1 - compiled_ms / legacy_ms) * 100:>7.1f}%")
+    print('Outputs identical for all resumes')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark for response encoding and payload size
+
+Builds /analyze bodies for the synthetic corpus and reports, per resume
+length bucket, the time to encode them with the standard library json
+module and with encode_json (orjson when installed), and the payload size
+of the full body, the compact profile and both gzipped as GZipMiddleware
+would send them.
+
+The run fails (exit status 1) if the two encoders produce different
+documents, encode_json is slower than the standard library while orjson is
+installed, or the compact profile is not smaller than the full body.
+
+Usage:
+    python -m benchmarks.response_benchmark
+    python -m benchmarks.response_benchmark --documents 10 --repeats 500
+"""
+import argparse
+import gzip
+import json
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+from benchmarks.corpus import FakeTextractClient, build_corpus
+from utils import responses
+from utils.analyzer import build_analysis_response, extract_resume_data
+from utils.responses import ResponseShape, encode_json
+import utils.textract_service as textract_module
+
+
+def stdlib_encode(content: Any) -> bytes:
+    """Encode like Starlette's JSONResponse"""
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(',', ':')).encode('utf-8')
+
+
+def time_encoder(encode: Callable[[Any], bytes], bodies: List[Dict[str, Any]], repeats: int) -> float:
+    """Median microseconds to encode one body"""
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for body in bodies:
+            encode(body)
+        samples.append((time.perf_counter() - start) / len(bodies))
+    return statistics.median(samples) * 1e6
+
+
+def build_bodies(corpus: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Analysis bodies by length bucket, with the fields main.py adds"""
+    service = textract_module.TextractService(textract_client=FakeTextractClient.for_corpus(corpus))
+    bodies: Dict[str, List[Dict[str, Any]]] = {}
+    for number, entry in enumerate(corpus):
+        analysis = service.analyze_document(entry['document_bytes'], use_cache=False)
+        extraction = extract_resume_data(analysis['text'])
+        body = {
+            'analysis_id': f"{number:064x}",
+            'created_at': 1760000000.0 + number,
+            **build_analysis_response(entry['name'], analysis['text'], analysis['document_info'], extraction),
+            'near_duplicate_of': None,
+        }
+        bodies.setdefault(entry['length'], []).append(body)
+    return bodies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--documents', type=int, default=5, help='Documents per length bucket')
+    parser.add_argument('--repeats', type=int, default=200)
+    args = parser.parse_args()
+
+    bodies = build_bodies(build_corpus(args.documents))
+    compact = ResponseShape('compact')
+    encoder = 'orjson' if responses.orjson is not None else 'stdlib (orjson not installed)'
+    print(f"encode_json uses {encoder}")
+
+    failures = 0
+    print(f"{'length':<8}{'stdlib us':>11}{'encode_json us':>16}{'speedup':>9}"
+          f"{'full B':>9}{'compact B':>11}{'full gz B':>11}{'compact gz B':>14}  check")
+    for length, group in bodies.items():
+        same = all(json.loads(stdlib_encode(body)) == json.loads(encode_json(body)) for body in group)
+        stdlib_us = time_encoder(stdlib_encode, group, args.repeats)
+        fast_us = time_encoder(encode_json, group, args.repeats)
+
+        full = [encode_json(body) for body in group]
+        compacted = [encode_json(compact.apply(body)) for body in group]
+        sizes = [
+            statistics.mean(len(payload) for payload in full),
+            statistics.mean(len(payload) for payload in compacted),
+            statistics.mean(len(gzip.compress(payload, compresslevel=9)) for payload in full),
+            statistics.mean(len(gzip.compress(payload, compresslevel=9)) for payload in compacted),
+        ]
+
+        check = 'ok'
+        if not same:
+            check = 'MISMATCH'
+        elif responses.orjson is not None and fast_us > stdlib_us:
+            check = 'SLOWER'
+        elif sizes[1] >= sizes[0]:
+            check = 'COMPACT NOT SMALLER'
+        failures += check != 'ok'
+        print(f"{length:<8}{stdlib_us:>11.1f}{fast_us:>16.1f}{stdlib_us / fast_us:>8.1f}x"
+              f"{sizes[0]:>9.0f}{sizes[1]:>11.0f}{sizes[2]:>11.0f}{sizes[3]:>14.0f}  {check}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
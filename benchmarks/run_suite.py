@@ -0,0 +1,176 @@
+"""
+Offline benchmark suite for the /analyze pipeline
+
+Runs every stage of the pipeline over a synthetic resume corpus with a fake
+Textract client, then drives the FastAPI app end to end, and writes the
+results as JSON so runs can be compared.
+
+Usage:
+    python -m benchmarks.run_suite --output bench.json
+    python -m benchmarks.run_suite --documents 20 --requests 400 --concurrency 32 --latency-ms 150
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+from benchmarks.corpus import FakeTextractClient, build_corpus
+from utils.analyzer import build_analysis_response, get_certification_extractor, get_skill_extractor
+from utils.parser import ParsedDocument
+from utils.responses import encode_json
+import utils.textract_service as textract_module
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Summarize durations in seconds as milliseconds"""
+    ordered = sorted(samples)
+    return {
+        'count': len(ordered),
+        'mean_ms': statistics.fmean(ordered) * 1000,
+        'p50_ms': ordered[len(ordered) // 2] * 1000,
+        'p95_ms': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        'max_ms': ordered[-1] * 1000,
+    }
+
+
+def run_stages(corpus: List[Dict[str, Any]], repeats: int) -> Dict[str, Dict[str, Any]]:
+    """Time each pipeline stage per resume length bucket"""
+    service = textract_module.TextractService(textract_client=FakeTextractClient.for_corpus(corpus))
+    skills = get_skill_extractor()
+    certifications = get_certification_extractor()
+
+    timings: Dict[str, Dict[str, List[float]]] = {}
+    for _ in range(repeats):
+        for entry in corpus:
+            stages = timings.setdefault(entry['length'], {})
+
+            start = time.perf_counter()
+            analysis = service.analyze_document(entry['document_bytes'], use_cache=False)
+            ocr_done = time.perf_counter()
+            document = ParsedDocument(analysis['text'])
+            parse_done = time.perf_counter()
+            categorized_skills = skills.extract_skills_from_text(document)
+            skills_summary = skills.get_skill_summary(categorized_skills)
+            skills_done = time.perf_counter()
+            certification_results = certifications.extract_certifications_from_text(document)
+            certs_done = time.perf_counter()
+            body = build_analysis_response(entry['name'], analysis['text'], analysis['document_info'], {
+                'skills': categorized_skills,
+                'skills_summary': skills_summary,
+                'certifications': certification_results,
+            })
+            payload = encode_json(body)
+            json_done = time.perf_counter()
+
+            for stage, duration in (
+                ('ocr_parse', ocr_done - start),
+                ('document_parse', parse_done - ocr_done),
+                ('skills', skills_done - parse_done),
+                ('certifications', certs_done - skills_done),
+                ('json_serialization', json_done - certs_done),
+                ('total', json_done - start),
+            ):
+                stages.setdefault(stage, []).append(duration)
+            stages.setdefault('payload_bytes', []).append(len(payload))
+
+    results = {}
+    for length, stages in timings.items():
+        payload_sizes = stages.pop('payload_bytes')
+        results[length] = {stage: summarize(samples) for stage, samples in stages.items()}
+        results[length]['payload_bytes_mean'] = statistics.fmean(payload_sizes)
+    return results
+
+
+async def run_end_to_end(corpus: List[Dict[str, Any]], requests: int, concurrency: int,
+                         latency: float) -> Dict[str, Any]:
+    """Drive POST /analyze through the ASGI app and measure throughput"""
+    import httpx
+
+    # Keep the analysis store out of the working tree
+    os.environ.setdefault('ANALYSIS_STORE_PATH', os.path.join(tempfile.mkdtemp(), 'analyses.db'))
+    # Install the fake-backed service before main builds its own
+    textract_module.textract_service = textract_module.TextractService(
+        textract_client=FakeTextractClient.for_corpus(corpus, latency=latency)
+    )
+    import main
+
+    main.textract_service = textract_module.textract_service
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    errors = 0
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url='http://bench') as client:
+        async def one_request(index: int):
+            nonlocal errors
+            entry = corpus[index % len(corpus)]
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.post(
+                    '/analyze', params={'use_cache': 'false'},
+                    files={'file': (entry['name'], entry['document_bytes'], 'image/png')}
+                )
+                latencies.append(time.perf_counter() - start)
+                if response.status_code != 200:
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one_request(index) for index in range(requests)))
+        elapsed = time.perf_counter() - start
+
+    return {
+        'requests': requests,
+        'concurrency': concurrency,
+        'textract_latency_ms': latency * 1000,
+        'errors': errors,
+        'elapsed_s': elapsed,
+        'requests_per_second': requests / elapsed,
+        'latency': summarize(latencies),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--documents', type=int, default=10, help='resumes per length bucket')
+    parser.add_argument('--repeats', type=int, default=3, help='passes over the corpus for stage timings')
+    parser.add_argument('--requests', type=int, default=200, help='end-to-end requests to send')
+    parser.add_argument('--concurrency', type=int, default=16, help='concurrent end-to-end clients')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='simulated Textract latency per call')
+    parser.add_argument('--skip-e2e', action='store_true', help='only run the stage timings')
+    parser.add_argument('--output', help='write JSON results to this file instead of stdout')
+    args = parser.parse_args()
+
+    # Per-request INFO logs would dominate the end-to-end timings
+    logging.disable(logging.INFO)
+
+    corpus = build_corpus(args.documents)
+    results = {
+        'environment': {
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        },
+        'config': vars(args),
+        'stages': run_stages(corpus, args.repeats),
+    }
+    if not args.skip_e2e:
+        results['end_to_end'] = asyncio.run(
+            run_end_to_end(corpus, args.requests, args.concurrency, args.latency_ms / 1000)
+        )
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as handle:
+            handle.write(output)
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
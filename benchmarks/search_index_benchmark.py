@@ -0,0 +1,107 @@
+"""
+Benchmark for the candidate search index
+
+Indexes a large synthetic population of analyzed resumes, drawing skills
+and certifications from the real taxonomy with a skewed popularity, then
+times boolean queries against a linear scan over per-document sets. Every
+query result is checked against the scan.
+
+Usage:
+    python -m benchmarks.search_index_benchmark
+    python -m benchmarks.search_index_benchmark --documents 250000 --repeats 20
+"""
+import argparse
+import random
+import sys
+import time
+
+from benchmarks.timing import time_call
+from utils.certification_extractor import CertificationExtractor
+from utils.search_index import CandidateIndex, normalize_term
+from utils.skill_extractor import SkillExtractor
+
+
+def build_population(documents: int, seed: int):
+    """Generate (doc_id, skills, certifications) with Zipf-like term popularity"""
+    rng = random.Random(seed)
+    skills = sorted(normalize_term(skill) for skill in SkillExtractor().all_skills)
+    certifications = sorted(normalize_term(cert) for cert in CertificationExtractor().all_certifications)
+    rng.shuffle(skills)
+    rng.shuffle(certifications)
+    skill_weights = [1 / (rank + 1) for rank in range(len(skills))]
+    certification_weights = [1 / (rank + 1) for rank in range(len(certifications))]
+    population = []
+    for number in range(documents):
+        population.append((
+            f"{number:064x}",
+            set(rng.choices(skills, skill_weights, k=rng.randint(5, 30))),
+            set(rng.choices(certifications, certification_weights, k=rng.randint(0, 4))),
+        ))
+    return population, skills, certifications
+
+
+def scan(population, required, optional):
+    """Reference answer: documents with every required term and any optional term"""
+    matches = []
+    for doc_id, skills, certifications in population:
+        terms = skills | certifications
+        if all(term in terms for term in required) and (not optional or any(term in terms for term in optional)):
+            matches.append(doc_id)
+    return matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--documents', type=int, default=100_000)
+    parser.add_argument('--repeats', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    population, skills, certifications = build_population(args.documents, args.seed)
+    index = CandidateIndex()
+    start = time.perf_counter()
+    for doc_id, doc_skills, doc_certifications in population:
+        index.add(doc_id, doc_skills, doc_certifications)
+    build_seconds = time.perf_counter() - start
+    stats = index.stats()
+    print(
+        f"indexed {stats['documents']} documents, {stats['terms']} terms in {build_seconds:.2f}s "
+        f"({build_seconds / args.documents * 1e6:.1f} us/doc), postings {stats['posting_bytes'] / 1e6:.1f} MB"
+    )
+
+    # Common, mid-frequency and rare terms
+    queries = [
+        ([skills[0], skills[1]], []),
+        ([skills[0], certifications[0], skills[5]], []),
+        ([skills[2]], [certifications[1], certifications[2]]),
+        ([skills[10], skills[20], certifications[3]], [skills[3], skills[4]]),
+        ([skills[len(skills) // 2], skills[1]], []),
+    ]
+
+    failures = 0
+    print(f"{'query':<72}{'hits':>8}{'index ms':>10}{'scan ms':>10}")
+    for required, optional in queries:
+        parts = [f'"{term}"' for term in required]
+        if optional:
+            parts.append('(' + ' OR '.join(f'"{term}"' for term in optional) + ')')
+        query = ' AND '.join(parts)
+        expected = scan(population, required, optional)
+        result = index.search(query, limit=len(population))
+        if result['analysis_ids'] != expected or result['total'] != len(expected):
+            failures += 1
+            print(f"MISMATCH for {query}")
+        index_ms = time_call(lambda: index.search(query, limit=100), args.repeats)
+        scan_ms = time_call(lambda: scan(population, required, optional), max(1, args.repeats // 5))
+        label = query if len(query) <= 70 else query[:67] + '...'
+        print(f"{label:<72}{len(expected):>8}{index_ms:>10.3f}{scan_ms:>10.1f}")
+
+    # Incremental update: re-index an existing document with different terms
+    doc_id = population[0][0]
+    update_ms = time_call(lambda: index.add(doc_id, skills[:10], certifications[:2]), args.repeats)
+    print(f"incremental re-index of one document: {update_ms:.3f} ms")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Per-resume cost of direct skill matching as the taxonomy grows
+
+Compares the previous one-regex-per-skill scan against the single-pass
+KeywordMatcher used by SkillExtractor.
+
+Usage:
+    python -m benchmarks.skill_matcher_benchmark
+"""
+import random
+import re
+import string
+import time
+
+from benchmarks.timing import best_of
+from utils.keyword_matcher import KeywordMatcher
+
+TAXONOMY_SIZES = [180, 1000, 5000, 10000, 20000]
+RESUME_WORDS = 800
+REPEATS = 5
+
+
+def _random_word(rng: random.Random) -> str:
+    return ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 10)))
+
+
+def build_taxonomy(size: int, rng: random.Random) -> list:
+    skills = set()
+    while len(skills) < size:
+        words = [_random_word(rng) for _ in range(rng.choice((1, 1, 1, 2, 3)))]
+        skills.add(' '.join(words))
+    return sorted(skills)
+
+
+def build_resume(skills: list, rng: random.Random) -> str:
+    words = [_random_word(rng) for _ in range(RESUME_WORDS)]
+    for skill in rng.sample(skills, min(40, len(skills))):
+        words.insert(rng.randrange(len(words)), skill)
+    return ' '.join(words)
+
+
+def regex_scan(skills: list, text_lower: str) -> set:
+    found = set()
+    for skill in skills:
+        if ' ' in skill:
+            if skill in text_lower:
+                found.add(skill)
+        elif re.search(r'\b' + re.escape(skill) + r'\b', text_lower):
+            found.add(skill)
+    return found
+
+
+def main():
+    rng = random.Random(42)
+    print(f"{'skills':>8} {'build ms':>10} {'regex ms':>10} {'matcher ms':>11} {'speedup':>8}")
+    for size in TAXONOMY_SIZES:
+        skills = build_taxonomy(size, rng)
+        text = build_resume(skills, rng)
+
+        start = time.perf_counter()
+        matcher = KeywordMatcher(skills)
+        build_time = time.perf_counter() - start
+
+        regex_time = best_of(REPEATS, regex_scan, skills, text)[0]
+        matcher_time = best_of(REPEATS, matcher.find_all, text)[0]
+        print(f"{size:>8} {build_time * 1000:>10.2f} {regex_time * 1000:>10.2f} "
+              f"{matcher_time * 1000:>11.2f} {regex_time / matcher_time:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+"""
+Benchmark for taxonomy loading and hot swapping
+
+Compares compiling the extractors from the taxonomy file against loading
+the pickled snapshot, for the bundled taxonomy and for copies grown with
+synthetic skills and certifications. Results of snapshot extractors are
+checked against freshly compiled ones. Finally the taxonomy is swapped
+repeatedly while threads keep extracting, to check no analysis fails or
+mixes revisions.
+
+Usage:
+    python -m benchmarks.taxonomy_benchmark
+    python -m benchmarks.taxonomy_benchmark --scales 1 10 50 --repeats 5
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+from benchmarks.corpus import build_corpus
+from benchmarks.timing import time_call
+from utils import analyzer
+from utils.taxonomy import DEFAULT_TAXONOMY_PATH, Taxonomy
+
+WORDS = ['cloud', 'data', 'stream', 'graph', 'edge', 'secure', 'micro', 'quantum', 'neural', 'rapid', 'hyper', 'meta']
+
+
+def grow(data: dict, scale: int, seed: int) -> dict:
+    """Add synthetic entries so the taxonomy is roughly `scale` times larger"""
+    rng = random.Random(seed)
+    data = json.loads(json.dumps(data))
+    for skills in data['skills']['categories'].values():
+        skills.extend(
+            f"{rng.choice(WORDS)}{rng.choice(WORDS)}-{number}" for number in range(len(skills) * (scale - 1))
+        )
+    for certifications in data['certifications']['catalog'].values():
+        certifications.extend(
+            f"Certified {rng.choice(WORDS).title()} {rng.choice(WORDS).title()} Professional {number}"
+            for number in range(len(certifications) * (scale - 1))
+        )
+    return data
+
+
+def extract(snapshot, text):
+    return analyzer.extract_resume_data(text) if snapshot is None else {
+        **analyzer.extract_skill_data(text, snapshot), **analyzer.extract_certification_data(text, snapshot)
+    }
+
+
+def comparable(result):
+    return json.dumps({key: value for key, value in result.items() if key != 'timings'}, sort_keys=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 50])
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--swaps', type=int, default=20)
+    args = parser.parse_args()
+
+    with open(DEFAULT_TAXONOMY_PATH) as f:
+        base = json.load(f)
+    texts = [entry['text'] for entry in build_corpus(3)]
+    workdir = tempfile.mkdtemp()
+    taxonomy_file = os.path.join(workdir, 'taxonomy.json')
+    snapshot_file = os.path.join(workdir, 'taxonomy.pickle')
+    os.environ['TAXONOMY_PATH'] = taxonomy_file
+
+    failures = 0
+    print(f"{'scale':>6}{'skills':>9}{'certs':>9}{'compile ms':>12}{'snapshot ms':>13}{'snapshot KB':>13}  check")
+    for scale in args.scales:
+        with open(taxonomy_file, 'w') as f:
+            json.dump(grow(base, scale, seed=scale), f)
+        compiled = analyzer.TaxonomySnapshot(Taxonomy.from_file())
+        analyzer.write_taxonomy_snapshot(compiled, snapshot_file)
+        digest = compiled.digest
+
+        compile_ms = time_call(lambda: analyzer.TaxonomySnapshot(Taxonomy.from_file()), args.repeats)
+        snapshot_ms = time_call(lambda: analyzer.read_taxonomy_snapshot(digest, snapshot_file), args.repeats)
+
+        loaded = analyzer.read_taxonomy_snapshot(digest, snapshot_file)
+        same = loaded is not None and all(
+            comparable(extract(compiled, text)) == comparable(extract(loaded, text)) for text in texts
+        )
+        check = 'ok' if same else 'MISMATCH'
+        failures += not same
+        info = compiled.info()
+        print(f"{scale:>6}{info['skills']:>9}{info['certifications']:>9}{compile_ms:>12.1f}{snapshot_ms:>13.1f}"
+              f"{os.path.getsize(snapshot_file) / 1024:>13.0f}  {check}")
+
+    # Hot swap: alternate two revisions while extraction keeps running
+    revisions = []
+    for version in ('a', 'b'):
+        data = json.loads(json.dumps(base))
+        data['version'] = version
+        if version == 'b':
+            data['skills']['categories']['soft_skills'].append('education')
+        revisions.append(data)
+    with open(taxonomy_file, 'w') as f:
+        json.dump(revisions[0], f)
+    analyzer.reload_taxonomy()
+    expected = {
+        version: [comparable(extract(analyzer.TaxonomySnapshot(Taxonomy(data)), text)) for text in texts]
+        for version, data in zip('ab', revisions)
+    }
+
+    errors = []
+    stop = threading.Event()
+
+    def worker():
+        while not stop.is_set():
+            for number, text in enumerate(texts):
+                snapshot = analyzer.get_taxonomy_snapshot()
+                try:
+                    if comparable(extract(snapshot, text)) != expected[snapshot.version][number]:
+                        errors.append(f"revision mix-up under version {snapshot.version}")
+                except Exception as e:
+                    errors.append(str(e))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    swap_samples = []
+    for swap in range(args.swaps):
+        with open(taxonomy_file, 'w') as f:
+            json.dump(revisions[(swap + 1) % 2], f)
+        start = time.perf_counter()
+        analyzer.reload_taxonomy()
+        swap_samples.append(time.perf_counter() - start)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    print(f"hot swap: {args.swaps} swaps under load, median {statistics.median(swap_samples) * 1000:.1f} ms, "
+          f"{len(errors)} failed analyses")
+    failures += bool(errors)
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
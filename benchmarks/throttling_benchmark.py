@@ -0,0 +1,142 @@
+"""
+Burst load against a fake Textract client that enforces a TPS quota
+
+Sends a burst of documents through TextractService from a thread pool,
+the way /analyze/batch does, with and without client-side rate limiting
+and throttle retries. The run fails (exit status 1) if the rate-limited
+configuration loses any document to throttling, or if the boto3 client
+is not built with the configured pool, retry and timeout settings (a
+single botocore attempt by default, so throttling is only retried once
+by TextractService).
+
+Usage:
+    python -m benchmarks.throttling_benchmark
+    python -m benchmarks.throttling_benchmark --documents 60 --quota 10 --workers 16
+"""
+import argparse
+import collections
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from botocore.exceptions import ClientError
+
+from benchmarks.corpus import FakeTextractClient, build_corpus, textract_response
+from utils.rate_limiter import TokenBucket
+from utils.textract_service import TextractService
+
+
+class ThrottlingTextractClient(FakeTextractClient):
+    """
+    Fake Textract client that rejects calls above `quota` per rolling second
+    with a ThrottlingException, like the real service does
+    """
+
+    def __init__(self, responses, quota: float, latency: float = 0.0):
+        super().__init__(responses, latency=latency)
+        self.quota = quota
+        self.throttled = 0
+        self._recent = collections.deque()
+        self._lock = threading.Lock()
+
+    def detect_document_text(self, Document):
+        with self._lock:
+            now = time.monotonic()
+            while self._recent and now - self._recent[0] >= 1.0:
+                self._recent.popleft()
+            if len(self._recent) >= self.quota:
+                self.throttled += 1
+                raise ClientError(
+                    {'Error': {'Code': 'ThrottlingException', 'Message': 'Rate exceeded'}},
+                    'DetectDocumentText'
+                )
+            self._recent.append(now)
+        return super().detect_document_text(Document)
+
+
+def run_burst(corpus, quota: float, workers: int, rate: float, retries: int, latency: float) -> dict:
+    responses = {
+        entry['document_bytes']: textract_response(entry['text'], seed=index)
+        for index, entry in enumerate(corpus)
+    }
+    client = ThrottlingTextractClient(responses, quota=quota, latency=latency)
+    service = TextractService(textract_client=client)
+    service.throttle_retries = retries
+    service.throttle_backoff = 0.1
+    service.rate_limiters = {'detect_document_text': TokenBucket(rate)} if rate else {}
+
+    def analyze(entry):
+        try:
+            service.analyze_document(entry['document_bytes'], use_cache=False)
+            return True
+        except Exception:
+            return False
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(analyze, corpus))
+    return {
+        'succeeded': sum(results),
+        'failed': len(results) - sum(results),
+        'throttled_calls': client.throttled,
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def check_client_config() -> list:
+    """Build a real (offline) boto3 client and confirm it carries the tuned Config"""
+    os.environ.setdefault('AWS_ACCESS_KEY_ID', 'bench')
+    os.environ.setdefault('AWS_SECRET_ACCESS_KEY', 'bench')
+    service = TextractService()
+    config = service._get_textract_client().meta.config
+    problems = []
+    if config.max_pool_connections != service.max_pool_connections:
+        problems.append(f"pool size {config.max_pool_connections} != {service.max_pool_connections}")
+    if config.retries.get('mode') != service.retry_mode:
+        problems.append(f"retry mode {config.retries.get('mode')} != {service.retry_mode}")
+    if config.retries.get('total_max_attempts') != service.max_attempts:
+        problems.append(f"botocore attempts {config.retries.get('total_max_attempts')} != {service.max_attempts}")
+    if config.connect_timeout != service.connect_timeout or config.read_timeout != service.read_timeout:
+        problems.append("timeouts not applied")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--documents', type=int, default=15, help='Documents per length bucket')
+    parser.add_argument('--quota', type=float, default=10.0, help='Calls per second the fake service accepts')
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--latency-ms', type=float, default=20.0)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    corpus = build_corpus(documents_per_length=args.documents)
+    latency = args.latency_ms / 1000
+    configurations = (
+        ('no limiter, no retries', 0, 0),
+        ('retries only', 0, 3),
+        ('token bucket + retries', args.quota * 0.9, 3),
+    )
+    print(f"{len(corpus)} documents, quota {args.quota:.0f}/s, {args.workers} workers")
+    results = {}
+    for label, rate, retries in configurations:
+        results[label] = run_burst(corpus, args.quota, args.workers, rate, retries, latency)
+        result = results[label]
+        print(
+            f"{label:<26}{result['succeeded']:>5} ok {result['failed']:>5} failed "
+            f"{result['throttled_calls']:>6} throttled {result['seconds']:>8.2f}s"
+        )
+
+    failures = check_client_config()
+    if results['token bucket + retries']['failed']:
+        failures.append("rate-limited burst lost documents to throttling")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,26 @@
+"""
+Timing helpers shared by the benchmark scripts
+"""
+import statistics
+import time
+
+
+def time_call(func, repeats: int) -> float:
+    """Median milliseconds for one call of func over repeats runs"""
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def best_of(repeats: int, func, *args):
+    """Fastest of repeats calls of func(*args) in seconds, with the last result"""
+    timings = []
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
@@ -0,0 +1,162 @@
+"""
+Benchmark for upload handling under concurrent load
+
+Posts concurrent multipart uploads to /analyze through the ASGI app with a
+fake Textract client and reports, per scenario, the status codes, the
+request body bytes the application consumed and the peak Python heap
+(tracemalloc) per request:
+
+- accepted: uploads just under the size limit
+- oversized: uploads over the limit that announce their Content-Length
+- oversized-chunked: uploads over the limit streamed without Content-Length
+- unguarded: the oversized uploads again, bypassing the upload limit
+  middleware, to show what the limit saves
+
+Bodies are streamed from pre-built buffers in 64KB chunks so the client
+side adds no copies of its own to the measurement. The run fails (exit
+status 1) if an oversized upload is not refused with 413 before much more
+than the limit is read, or an accepted upload peaks above
+--max-heap-ratio times its size.
+
+Usage:
+    python -m benchmarks.upload_benchmark
+    python -m benchmarks.upload_benchmark --concurrency 16 --oversize-mb 50
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+CHUNK_SIZE = 64 * 1024
+BOUNDARY = 'upload-benchmark-boundary'
+
+
+def multipart_parts(filename: str, content: bytes):
+    head = (
+        f'--{BOUNDARY}\r\n'
+        f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        'Content-Type: image/png\r\n\r\n'
+    ).encode('utf-8')
+    tail = f'\r\n--{BOUNDARY}--\r\n'.encode('utf-8')
+    return head, memoryview(content), tail
+
+
+async def stream_body(parts):
+    head, content, tail = parts
+    yield head
+    for start in range(0, len(content), CHUNK_SIZE):
+        yield bytes(content[start:start + CHUNK_SIZE])
+    yield tail
+
+
+def without_upload_limit(app):
+    """Build the app's middleware stack without the upload limit middleware"""
+    from utils.uploads import UploadLimitMiddleware
+
+    configured = app.user_middleware
+    app.user_middleware = [middleware for middleware in configured if middleware.cls is not UploadLimitMiddleware]
+    try:
+        return app.build_middleware_stack()
+    finally:
+        app.user_middleware = configured
+
+
+def counting_app(app, counter):
+    """Wrap an ASGI app to count the request body bytes it receives"""
+    async def wrapped(scope, receive, send):
+        async def counted_receive():
+            message = await receive()
+            if message['type'] == 'http.request':
+                counter[0] += len(message.get('body', b''))
+            return message
+        await app(scope, counted_receive, send)
+    return wrapped
+
+
+async def run_scenario(app, payloads, send_length: bool):
+    import httpx
+
+    counter = [0]
+    transport = httpx.ASGITransport(app=counting_app(app, counter))
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench', timeout=None) as client:
+        async def post(number, content):
+            parts = multipart_parts(f"upload-{number}.png", content)
+            headers = {'content-type': f'multipart/form-data; boundary={BOUNDARY}'}
+            if send_length:
+                headers['content-length'] = str(sum(len(part) for part in parts))
+            response = await client.post(
+                '/analyze', params={'use_cache': 'false'}, headers=headers, content=stream_body(parts)
+            )
+            return response.status_code
+
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        statuses = await asyncio.gather(*(post(number, content) for number, content in enumerate(payloads)))
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    return statuses, counter[0], peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--upload-mb', type=float, default=8.0)
+    parser.add_argument('--oversize-mb', type=float, default=40.0)
+    parser.add_argument('--max-heap-ratio', type=float, default=3.0)
+    args = parser.parse_args()
+
+    os.environ.setdefault('ANALYSIS_STORE_ENABLED', 'false')
+    os.environ.setdefault('NEAR_DUPLICATE_MODE', 'off')
+    logging.disable(logging.CRITICAL)
+
+    import main as app_module
+    import utils.textract_service as textract_module
+    from benchmarks.corpus import PNG_SIGNATURE, FakeTextractClient, build_corpus, textract_response
+
+    text = build_corpus(1)[0]['text']
+    upload_bytes = int(args.upload_mb * 1024 * 1024)
+    accepted = []
+    for number in range(args.concurrency):
+        content = PNG_SIGNATURE + f"FAKE-DOCUMENT {number}\n{text}\n".encode('utf-8')
+        accepted.append(content + b'\0' * (upload_bytes - len(content)))
+    oversize_bytes = int(args.oversize_mb * 1024 * 1024)
+    oversized = [PNG_SIGNATURE + bytes([number]) * oversize_bytes for number in range(args.concurrency)]
+
+    app_module.textract_service = textract_module.TextractService(
+        textract_client=FakeTextractClient({content: textract_response(text) for content in accepted})
+    )
+    limit = app_module.MAX_FILE_SIZE + app_module.MULTIPART_OVERHEAD_BYTES
+    print(f"upload limit {app_module.MAX_FILE_SIZE / 1e6:.1f} MB, {args.concurrency} concurrent requests")
+
+    scenarios = [
+        ('accepted', app_module.app, accepted, True),
+        ('oversized', app_module.app, oversized, True),
+        ('oversized-chunked', app_module.app, oversized, False),
+        ('unguarded', without_upload_limit(app_module.app), oversized, True),
+    ]
+    tracemalloc.start()
+    failures = 0
+    print(f"{'scenario':<20}{'upload MB':>10}{'statuses':>16}{'read MB/req':>13}{'peak MB/req':>13}{'seconds':>9}")
+    for name, app, payloads, send_length in scenarios:
+        statuses, received, peak, elapsed = asyncio.run(run_scenario(app, payloads, send_length))
+        size = len(payloads[0])
+        read_per_request = received / len(payloads)
+        peak_per_request = peak / len(payloads)
+        status_summary = ','.join(f"{status}x{statuses.count(status)}" for status in sorted(set(statuses)))
+        print(f"{name:<20}{size / 1e6:>10.1f}{status_summary:>16}{read_per_request / 1e6:>13.2f}"
+              f"{peak_per_request / 1e6:>13.2f}{elapsed:>9.2f}")
+        if name == 'accepted':
+            failures += statuses != [200] * len(payloads) or peak_per_request > args.max_heap_ratio * size
+        elif name.startswith('oversized'):
+            failures += statuses != [413] * len(payloads) or read_per_request > limit + CHUNK_SIZE
+    tracemalloc.stop()
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+import os
+import json
+import sqlite3
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from models import SCHEMA, AnalysisRecord
+
+logger = logging.getLogger(__name__)
+
+class AnalysisStore:
+    def __init__(self, db_path: str = 'analyses.db'):
+        """
+        SQLite store of finished analyses keyed by document hash
+
+        Args:
+            db_path: SQLite database file (':memory:' for a throwaway store)
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        if db_path != ':memory:':
+            # Readers do not block the writer, and commits skip the extra fsync
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('PRAGMA synchronous=NORMAL')
+        for statement in SCHEMA:
+            self._db.execute(statement)
+        self._db.commit()
+
+    def save(self, record: AnalysisRecord):
+        """Store one analysis, replacing any earlier analysis of the same document"""
+        self.save_many([record])
+
+    def save_many(self, records: List[AnalysisRecord]):
+        """
+        Store many analyses in a single transaction
+
+        Args:
+            records: Analyses to store; later records win for repeated documents
+        """
+        if not records:
+            return
+        # Keep only the last record of each document
+        records = list({record.analysis_id: record for record in records}.values())
+        ids = [(record.analysis_id,) for record in records]
+        with self._lock:
+            with self._db:
+                self._db.executemany('DELETE FROM analysis_skills WHERE analysis_id = ?', ids)
+                self._db.executemany('DELETE FROM analysis_certifications WHERE analysis_id = ?', ids)
+                self._db.executemany(
+                    'INSERT OR REPLACE INTO analyses (analysis_id, filename, created_at, text, response) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    [
+                        (record.analysis_id, record.filename, record.created_at, record.text,
+                         json.dumps(record.response))
+                        for record in records
+                    ]
+                )
+                self._db.executemany(
+                    'INSERT OR IGNORE INTO analysis_skills (analysis_id, skill, category) VALUES (?, ?, ?)',
+                    [row for record in records for row in record.skill_rows()]
+                )
+                self._db.executemany(
+                    'INSERT OR IGNORE INTO analysis_certifications (analysis_id, certification, category) '
+                    'VALUES (?, ?, ?)',
+                    [row for record in records for row in record.certification_rows()]
+                )
+                self._db.executemany(
+                    'INSERT OR REPLACE INTO analysis_signatures (analysis_id, signature) VALUES (?, ?)',
+                    [(record.analysis_id, record.signature) for record in records if record.signature is not None]
+                )
+
+    def get(self, analysis_id: str) -> Optional[AnalysisRecord]:
+        """Return the stored analysis of a document, or None"""
+        with self._lock:
+            row = self._db.execute(
+                'SELECT analysis_id, filename, created_at, text, response FROM analyses WHERE analysis_id = ?',
+                (analysis_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        analysis_id, filename, created_at, text, response = row
+        return AnalysisRecord(analysis_id, filename, text, json.loads(response), created_at=created_at)
+
+    def find_ids(self, skill: Optional[str] = None, certification: Optional[str] = None,
+                 limit: int = 100) -> List[str]:
+        """
+        Return IDs of analyses that mention a skill and/or a certification
+
+        Args:
+            skill: Skill name (case-insensitive)
+            certification: Certification name (case-insensitive)
+            limit: Maximum number of IDs returned
+
+        Returns:
+            Matching analysis IDs, most recent first
+        """
+        query = 'SELECT a.analysis_id FROM analyses a'
+        conditions = []
+        params = []
+        if skill:
+            query += ' JOIN analysis_skills s ON s.analysis_id = a.analysis_id'
+            conditions.append('s.skill = ?')
+            params.append(skill.lower())
+        if certification:
+            query += ' JOIN analysis_certifications c ON c.analysis_id = a.analysis_id'
+            conditions.append('c.certification = ?')
+            params.append(certification.lower())
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += ' ORDER BY a.created_at DESC LIMIT ?'
+        params.append(limit)
+        with self._lock:
+            return [row[0] for row in self._db.execute(query, params)]
+
+    def index_entries(self) -> Dict[str, Tuple[List[str], List[str]]]:
+        """
+        Return the skills and certifications of every stored analysis
+
+        Returns:
+            Mapping of analysis ID to (skills, certifications), oldest first
+        """
+        entries: Dict[str, Tuple[List[str], List[str]]] = {}
+        with self._lock:
+            for (analysis_id,) in self._db.execute('SELECT analysis_id FROM analyses ORDER BY created_at'):
+                entries[analysis_id] = ([], [])
+            for analysis_id, skill in self._db.execute('SELECT analysis_id, skill FROM analysis_skills'):
+                entries[analysis_id][0].append(skill)
+            for analysis_id, certification in self._db.execute(
+                'SELECT analysis_id, certification FROM analysis_certifications'
+            ):
+                entries[analysis_id][1].append(certification)
+        return entries
+
+    def signatures(self) -> Dict[str, bytes]:
+        """Return the MinHash signature of every stored analysis that has one"""
+        with self._lock:
+            return dict(self._db.execute('SELECT analysis_id, signature FROM analysis_signatures'))
+
+    def count(self) -> int:
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM analyses').fetchone()[0]
+
+# Global instance
+analysis_store = None
+
+def get_analysis_store() -> Optional[AnalysisStore]:
+    """
+    Get or create the analysis store
+
+    ANALYSIS_STORE_PATH sets the SQLite file; ANALYSIS_STORE_ENABLED=false
+    turns persistence off. Under Lambda the file defaults to /tmp, the only
+    writable directory, so the store is per container and is lost when the
+    container is recycled.
+
+    Returns:
+        AnalysisStore instance, or None if persistence is disabled
+    """
+    global analysis_store
+    if os.getenv('ANALYSIS_STORE_ENABLED', 'true').lower() not in ('1', 'true', 'yes'):
+        return None
+    if analysis_store is None:
+        default_path = '/tmp/analyses.db' if os.getenv('AWS_LAMBDA_FUNCTION_NAME') else 'analyses.db'
+        analysis_store = AnalysisStore(os.getenv('ANALYSIS_STORE_PATH', default_path))
+    return analysis_store
@@ -1,21 +1,77 @@
-from fastapi import FastAPI, File, UploadFile, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import FastAPI, File, UploadFile, Request, Body
+from fastapi.responses import HTMLResponse, StreamingResponse, PlainTextResponse
+from starlette.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
-from utils.textract_service import get_textract_service
-from utils.skill_extractor import SkillExtractor
-from utils.certification_extractor import CertificationExtractor
+from utils.textract_service import get_textract_service, OCRResultCache
+from utils.analyzer import (
+    extract_resume_data, extract_skill_data, extract_certification_data, build_analysis_response,
+    get_taxonomy_snapshot, reload_taxonomy
+)
+from utils.metrics import REGISTRY, REQUESTS, REQUEST_DURATION, BYTES_PROCESSED, Gauge, StageTimer
+from utils.job_queue import JobQueue, JobQueueFull, get_job_store
+from database import get_analysis_store
+from models import AnalysisRecord
+from utils.search_index import CandidateIndex, QuerySyntaxError, SKILL, CERTIFICATION
+from utils.match_scorer import MatchScorer
+from utils.near_duplicates import NearDuplicateIndex
+from utils.uploads import UploadLimitMiddleware, UploadTooLarge, read_upload, sniff_document_type
+from utils.responses import FULL_SHAPE, FastJSONResponse, ResponseShape, ResponseShapeError, encode_json
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Callable, List, Optional, Tuple, Union
+import contextlib
+import functools
+import asyncio
 import logging
+import zipfile
+import io
+import os
 
-app = FastAPI()
+app = FastAPI(default_response_class=FastJSONResponse)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Initialize extractors
-skill_extractor = SkillExtractor()
-certification_extractor = CertificationExtractor()
+SUPPORTED_EXTENSIONS = ('.pdf', '.png', '.jpg', '.jpeg', '.tiff')
+# Textract's synchronous API caps documents at 10MB; the S3-backed job API
+# accepts much larger PDFs
+MAX_FILE_SIZE = int(os.getenv(
+    'MAX_UPLOAD_BYTES',
+    str((100 if os.getenv('TEXTRACT_S3_BUCKET') else 10) * 1024 * 1024)
+))
+FILE_TOO_LARGE_ERROR = f"File size too large. Please upload files smaller than {MAX_FILE_SIZE // (1024 * 1024)}MB."
+MAX_BATCH_FILES = int(os.getenv('BATCH_MAX_FILES', '500'))
+MAX_BATCH_UPLOAD_BYTES = int(os.getenv('BATCH_MAX_UPLOAD_BYTES', str(256 * 1024 * 1024)))
+BATCH_TOO_LARGE_ERROR = (
+    f"Batch too large. Please upload at most {MAX_BATCH_UPLOAD_BYTES // (1024 * 1024)}MB per request."
+)
+TOO_MANY_FILES_ERROR = f"Too many files in batch. Please upload at most {MAX_BATCH_FILES} files."
+# Total uncompressed size of the zip members one batch may unpack
+MAX_BATCH_DECOMPRESSED_BYTES = int(os.getenv('BATCH_MAX_DECOMPRESSED_BYTES', str(1024 * 1024 * 1024)))
+DECOMPRESSED_TOO_LARGE_ERROR = (
+    f"Zip archives too large. Please upload at most {MAX_BATCH_DECOMPRESSED_BYTES // (1024 * 1024)}MB "
+    "of uncompressed files per request."
+)
+INVALID_CONTENT_ERROR = "File content is not a valid PDF, PNG, JPG, JPEG, or TIFF document."
+# Room for multipart boundaries and part headers around a single file
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+# Oversized bodies are refused before the multipart parser spools them
+single_upload_limit = (MAX_FILE_SIZE + MULTIPART_OVERHEAD_BYTES, FILE_TOO_LARGE_ERROR)
+app.add_middleware(UploadLimitMiddleware, limits={
+    "/analyze": single_upload_limit,
+    "/analyze/stream": single_upload_limit,
+    "/jobs": single_upload_limit,
+    "/analyze/batch": (MAX_BATCH_UPLOAD_BYTES, BATCH_TOO_LARGE_ERROR),
+})
+
+# Large JSON bodies are gzipped for clients that accept it (event streams never are).
+# Off by default under Lambda: a REST API without binary media types passes
+# the gzipped body through Mangum as mangled text.
+if os.getenv(
+    'RESPONSE_COMPRESSION', 'false' if os.getenv('AWS_LAMBDA_FUNCTION_NAME') else 'true'
+).lower() in ('1', 'true', 'yes'):
+    app.add_middleware(GZipMiddleware, minimum_size=int(os.getenv('RESPONSE_COMPRESSION_MIN_BYTES', '1024')))
 
 # Initialize Textract service
 try:
@@ -25,70 +81,731 @@ except Exception as e:
     logger.error(f"Failed to initialize Textract service: {e}")
     textract_service = None
 
+# Finished analyses are stored by document hash for later retrieval
+try:
+    analysis_store = get_analysis_store()
+except Exception as e:
+    logger.error(f"Failed to open analysis store: {e}")
+    analysis_store = None
+# Batch results are written in groups of this size
+ANALYSIS_STORE_BATCH_SIZE = int(os.getenv('ANALYSIS_STORE_BATCH_SIZE', '50'))
+
+# Skill/certification search over analyzed resumes. Every new analysis is
+# indexed as it finishes; stored analyses are loaded on the first search.
+search_index = CandidateIndex()
+search_index_loaded = False
+search_index_lock = asyncio.Lock()
+# Job-description scoring over the same index, built on first use
+match_scorer = None
+
+# Near-duplicate detection over OCR text. NEAR_DUPLICATE_MODE=flag marks
+# responses with the closest earlier analysis, collapse answers with that
+# analysis instead of re-running extraction, off disables the check.
+NEAR_DUPLICATE_MODE = os.getenv('NEAR_DUPLICATE_MODE', 'flag').lower()
+near_duplicate_index = NearDuplicateIndex(threshold=float(os.getenv('NEAR_DUPLICATE_THRESHOLD', '0.85')))
+
+# Blocking OCR calls and CPU-bound extraction run on a bounded thread pool so
+# they never stall the event loop; Textract calls are further capped separately
+analysis_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv('ANALYZE_MAX_WORKERS', '8')),
+    thread_name_prefix='analyze'
+)
+textract_semaphore = asyncio.Semaphore(int(os.getenv('TEXTRACT_MAX_CONCURRENCY', '4')))
+
+# CPU-bound extraction can optionally run on worker processes instead
+extraction_processes = int(os.getenv('EXTRACTION_PROCESSES', '0'))
+extraction_executor = ProcessPoolExecutor(max_workers=extraction_processes) if extraction_processes > 0 else analysis_executor
+
+# Files of one batch request processed at the same time
+batch_concurrency = int(os.getenv('BATCH_MAX_CONCURRENCY', '8'))
+
+# Per-request stage timings in a Server-Timing response header
+server_timing_enabled = os.getenv('ENABLE_SERVER_TIMING', 'false').lower() in ('1', 'true', 'yes')
+
+@contextlib.asynccontextmanager
+async def no_limit():
+    """Async stand-in for a semaphore when there is no concurrency limit"""
+    yield
+
+async def run_blocking(func, *args, executor=None, **kwargs):
+    """Run a blocking callable on the analysis thread pool (or the given executor)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor or analysis_executor, functools.partial(func, *args, **kwargs))
+
+async def run_extraction(text: str, timer: StageTimer, extractor=extract_resume_data) -> dict:
+    """Run skill and certification extraction (or one of them) on the extraction pool"""
+    extraction = await run_blocking(extractor, text, executor=extraction_executor)
+    for stage, duration in extraction.pop('timings', {}).items():
+        timer.record(stage, duration)
+    return extraction
+
+def finish_request(endpoint: str, response, timer: StageTimer, observe_duration: bool = True):
+    """Record request metrics and attach the Server-Timing header"""
+    total = timer.elapsed()
+    REQUESTS.inc(endpoint=endpoint, status=response.status_code)
+    if observe_duration:
+        REQUEST_DURATION.observe(total, endpoint=endpoint)
+    if server_timing_enabled:
+        response.headers['Server-Timing'] = timer.server_timing_header(total)
+    return response
+
+def new_analysis_record(filename: str, file_content: bytes, text: str, response: dict,
+                        duplicate_check: Optional[dict] = None) -> AnalysisRecord:
+    """
+    Tag a response with its analysis ID (the document hash) and wrap it for storage
+
+    Args:
+        duplicate_check: Output of check_near_duplicate; a match is added to the
+            response as 'near_duplicate_of'
+    """
+    analysis_id = OCRResultCache.hash_document(file_content)
+    response['analysis_id'] = analysis_id
+    signature = None
+    if duplicate_check:
+        signature = duplicate_check['signature']
+        if duplicate_check['match']:
+            response['near_duplicate_of'] = duplicate_check['match']
+    return AnalysisRecord(analysis_id, filename, text, response, signature=signature)
+
+def index_analyses(records: List[AnalysisRecord]):
+    """Add analyses to the search and near-duplicate indexes"""
+    for record in records:
+        search_index.add(record.analysis_id, record.skill_names(), record.certification_names())
+        if record.signature is not None:
+            near_duplicate_index.add(record.analysis_id, record.signature)
+
+async def load_indexes():
+    """Index every stored analysis once, before the first search or duplicate check"""
+    global search_index_loaded
+    async with search_index_lock:
+        if search_index_loaded or analysis_store is None:
+            return
+        entries = await run_blocking(analysis_store.index_entries)
+        for analysis_id, (skills, certifications) in entries.items():
+            # Analyses indexed since startup are newer than their stored copy
+            if analysis_id not in search_index:
+                search_index.add(analysis_id, skills, certifications)
+        signatures = await run_blocking(analysis_store.signatures)
+        for analysis_id, signature in signatures.items():
+            if analysis_id not in near_duplicate_index:
+                near_duplicate_index.add(analysis_id, signature)
+        search_index_loaded = True
+        logger.info(f"Loaded {len(entries)} stored analyses into the search index")
+
+async def check_near_duplicate(file_content: bytes, text: str, timer: StageTimer) -> Optional[dict]:
+    """
+    Look up earlier analyses whose text nearly matches a new document
+
+    Returns:
+        Dictionary with the document's 'signature' and its best 'match'
+        ({analysis_id, similarity} or None), or None if detection is off
+    """
+    if NEAR_DUPLICATE_MODE == 'off':
+        return None
+    await load_indexes()
+    with timer.stage('dedupe'):
+        signature = await run_blocking(near_duplicate_index.signature, text)
+        # An exact re-upload is the same analysis, not a duplicate of it
+        match = near_duplicate_index.query(signature, exclude=OCRResultCache.hash_document(file_content))
+    return {
+        'signature': signature,
+        'match': {'analysis_id': match[0], 'similarity': match[1]} if match else None
+    }
+
+async def collapsed_response(filename: str, duplicate_check: Optional[dict]) -> Optional[dict]:
+    """In collapse mode, return the stored analysis a near duplicate resolves to"""
+    if NEAR_DUPLICATE_MODE != 'collapse' or not duplicate_check or not duplicate_check['match']:
+        return None
+    if analysis_store is None:
+        return None
+    record = await run_blocking(analysis_store.get, duplicate_check['match']['analysis_id'])
+    if record is None:
+        return None
+    return {**record.response, 'filename': filename, 'duplicate_of': duplicate_check['match']}
+
+async def save_analyses(records: List[AnalysisRecord], timer: Optional[StageTimer] = None):
+    """Store and index analyses, logging instead of failing the request if the store is unavailable"""
+    if not records:
+        return
+    index_analyses(records)
+    if analysis_store is None:
+        return
+    try:
+        with timer.stage('persist') if timer else contextlib.nullcontext():
+            await run_blocking(analysis_store.save_many, records)
+    except Exception as e:
+        logger.warning(f"Failed to store {len(records)} analyses: {e}")
+
+def validate_upload(filename: str, file_content: bytes) -> Optional[str]:
+    """Return an error message if an uploaded file cannot be analyzed"""
+    if not filename.lower().endswith(SUPPORTED_EXTENSIONS):
+        return "Unsupported file format. Please upload PDF, PNG, JPG, JPEG, or TIFF files."
+    if len(file_content) > MAX_FILE_SIZE:
+        return FILE_TOO_LARGE_ERROR
+    # The extension alone says nothing about what was actually uploaded
+    if sniff_document_type(file_content[:16]) is None:
+        return INVALID_CONTENT_ERROR
+    return None
+
+def response_shape(profile: Optional[str], fields: Optional[str]) -> ResponseShape:
+    """
+    Parse the profile= and fields= query parameters
+
+    profile=compact leaves out the summaries and Textract statistics;
+    fields= lists the top-level fields to return, e.g. fields=skills,certifications;
+    the analysis ID, filename and any error always come along.
+    """
+    return ResponseShape(profile, fields)
+
+def invalid_shape_response(error: ResponseShapeError):
+    return FastJSONResponse({"error": str(error)}, status_code=400)
+
+@app.on_event("shutdown")
+def shutdown_executor():
+    analysis_executor.shutdown(wait=False)
+    if extraction_executor is not analysis_executor:
+        extraction_executor.shutdown(wait=False)
+
 # Serve static files (CSS)
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
-# Templates folder for HTML
-templates = Jinja2Templates(directory="templates")
+# Templates folder for HTML, loaded on first page view since the API-only
+# Lambda deployment rarely serves it
+templates = None
+
+def get_templates():
+    global templates
+    if templates is None:
+        from fastapi.templating import Jinja2Templates
+        templates = Jinja2Templates(directory="templates")
+    return templates
 
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
-    return templates.TemplateResponse("index.html", {"request": request})
+    return get_templates().TemplateResponse(request, "index.html")
+
+@app.get("/metrics")
+async def metrics():
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
+
+@app.get("/taxonomy")
+async def taxonomy_info():
+    """Return the version of the skill and certification taxonomy in use"""
+    snapshot = await run_blocking(get_taxonomy_snapshot)
+    return FastJSONResponse(snapshot.info())
+
+@app.post("/taxonomy/reload")
+async def taxonomy_reload():
+    """
+    Swap in the taxonomy file's current contents without a restart
+
+    Analyses already running finish with the taxonomy they started with.
+    Extraction worker processes pick up the change on their next periodic check.
+    """
+    try:
+        snapshot = await run_blocking(reload_taxonomy)
+    except Exception as e:
+        logger.error(f"Taxonomy reload failed: {e}")
+        return FastJSONResponse({"error": f"Failed to reload taxonomy: {str(e)}"}, status_code=400)
+    return FastJSONResponse(snapshot.info())
 
 @app.post("/analyze")
-async def analyze_resume(file: UploadFile = File(...)):
+async def analyze_resume(file: UploadFile = File(...), use_cache: bool = True,
+                         profile: Optional[str] = None, fields: Optional[str] = None):
+    timer = StageTimer()
+    try:
+        shape = response_shape(profile, fields)
+    except ResponseShapeError as e:
+        return finish_request("analyze", invalid_shape_response(e), timer)
+    response = await _analyze_resume(file, use_cache, timer, shape)
+    return finish_request("analyze", response, timer)
+
+async def _analyze_resume(file: UploadFile, use_cache: bool, timer: StageTimer, shape: ResponseShape = FULL_SHAPE):
     try:
         # Check if Textract service is available
         if textract_service is None:
-            return JSONResponse({
+            return FastJSONResponse({
                 "error": "AWS Textract service is not available. Please check your AWS configuration."
             }, status_code=503)
         
         # Validate file type
-        if not file.filename.lower().endswith(('.pdf', '.png', '.jpg', '.jpeg', '.tiff')):
-            return JSONResponse({
+        if not file.filename.lower().endswith(SUPPORTED_EXTENSIONS):
+            return FastJSONResponse({
                 "error": "Unsupported file format. Please upload PDF, PNG, JPG, JPEG, or TIFF files."
             }, status_code=400)
         
-        # Read file content
-        file_content = await file.read()
-        
-        # Check file size (Textract has limits)
-        if len(file_content) > 10 * 1024 * 1024:  # 10MB limit
-            return JSONResponse({
-                "error": "File size too large. Please upload files smaller than 10MB."
+        # Read file content, stopping once it passes the size limit (Textract has limits)
+        try:
+            with timer.stage('upload_read'):
+                file_content = await read_upload(file, MAX_FILE_SIZE)
+        except UploadTooLarge:
+            return FastJSONResponse({
+                "error": FILE_TOO_LARGE_ERROR
             }, status_code=400)
+        BYTES_PROCESSED.inc(len(file_content))
+        
+        error = validate_upload(file.filename, file_content)
+        if error:
+            return FastJSONResponse({"error": error}, status_code=400)
         
         logger.info(f"Processing file: {file.filename} ({len(file_content)} bytes)")
         
         # Extract text using AWS Textract
         try:
-            text = textract_service.extract_text_from_document(file_content)
-            document_info = textract_service.get_document_info(file_content)
+            async with textract_semaphore:
+                with timer.stage('ocr'):
+                    analysis = await run_blocking(
+                        textract_service.analyze_document, file_content, use_cache=use_cache
+                    )
+            text = analysis['text']
+            document_info = analysis['document_info']
         except Exception as e:
             logger.error(f"Textract extraction failed: {e}")
-            return JSONResponse({
+            return FastJSONResponse({
                 "error": f"Failed to extract text from document: {str(e)}"
             }, status_code=500)
 
-        # Extract skills using the advanced skill extractor
-        categorized_skills = skill_extractor.extract_skills_from_text(text)
-        skill_summary = skill_extractor.get_skill_summary(categorized_skills)
-        
-        # Extract certifications using the certification extractor
-        certification_results = certification_extractor.extract_certifications_from_text(text)
-
-        return JSONResponse({
-            "filename": file.filename,
-            "content_length": len(text),
-            "document_info": document_info,
-            "skills": categorized_skills,
-            "skills_summary": skill_summary,
-            "certifications": certification_results['certifications'],
-            "certification_details": certification_results['details'],
-            "certifications_summary": certification_results['summary'],
-            "extraction_method": "AWS Textract with advanced pattern matching"
-        })
+        duplicate_check = await check_near_duplicate(file_content, text, timer)
+        body = await collapsed_response(file.filename, duplicate_check)
+        if body is None:
+            # Extract skills and certifications off the event loop
+            extraction = await run_extraction(text, timer)
+
+            body = build_analysis_response(file.filename, text, document_info, extraction)
+            await save_analyses([new_analysis_record(file.filename, file_content, text, body, duplicate_check)], timer)
+
+        with timer.stage('encode'):
+            return FastJSONResponse(shape.apply(body))
     except Exception as e:
         logger.error(f"Analysis failed: {e}")
-        return JSONResponse({"error": str(e)}, status_code=500)
+        return FastJSONResponse({"error": str(e)}, status_code=500)
+
+def server_sent_event(event: str, data: dict) -> str:
+    """Format one server-sent event"""
+    return f"event: {event}\ndata: {encode_json(data).decode('utf-8')}\n\n"
+
+@app.post("/analyze/stream")
+async def analyze_resume_stream(request: Request, file: UploadFile = File(...), use_cache: bool = True,
+                                profile: Optional[str] = None, fields: Optional[str] = None):
+    """
+    Analyze a resume, streaming progress as server-sent events
+
+    Emits 'upload', 'ocr', 'skills' and 'certifications' events as each stage
+    finishes, then 'result' with the full /analyze response body, or 'error'.
+    Work stops before the next stage once the client disconnects. profile=
+    and fields= shape the 'result' event like the /analyze body.
+    """
+    timer = StageTimer()
+    try:
+        shape = response_shape(profile, fields)
+    except ResponseShapeError as e:
+        return finish_request("analyze_stream", invalid_shape_response(e), timer)
+    if textract_service is None:
+        return finish_request("analyze_stream", FastJSONResponse({
+            "error": "AWS Textract service is not available. Please check your AWS configuration."
+        }, status_code=503), timer)
+
+    try:
+        with timer.stage('upload_read'):
+            file_content = await read_upload(file, MAX_FILE_SIZE)
+    except UploadTooLarge:
+        return finish_request("analyze_stream", FastJSONResponse({"error": FILE_TOO_LARGE_ERROR}, status_code=400), timer)
+    BYTES_PROCESSED.inc(len(file_content))
+    error = validate_upload(file.filename, file_content)
+    if error:
+        return finish_request("analyze_stream", FastJSONResponse({"error": error}, status_code=400), timer)
+
+    async def stream_events():
+        try:
+            yield server_sent_event("upload", {"filename": file.filename, "bytes": len(file_content)})
+
+            try:
+                async with textract_semaphore:
+                    with timer.stage('ocr'):
+                        analysis = await run_blocking(
+                            textract_service.analyze_document, file_content, use_cache=use_cache
+                        )
+            except Exception as e:
+                logger.error(f"Textract extraction failed: {e}")
+                yield server_sent_event("error", {"error": f"Failed to extract text from document: {str(e)}"})
+                return
+            text = analysis['text']
+            document_info = analysis['document_info']
+            yield server_sent_event("ocr", {
+                "pages": document_info.get('document_metadata', {}).get('Pages', 1),
+                "content_length": len(text),
+                "document_info": document_info
+            })
+
+            duplicate_check = await check_near_duplicate(file_content, text, timer)
+            body = await collapsed_response(file.filename, duplicate_check)
+            if body is not None:
+                yield server_sent_event("result", shape.apply(body))
+                return
+
+            if await request.is_disconnected():
+                logger.info(f"Client disconnected, stopping analysis of {file.filename}")
+                return
+            skills = await run_extraction(text, timer, extractor=extract_skill_data)
+            yield server_sent_event("skills", skills)
+
+            if await request.is_disconnected():
+                logger.info(f"Client disconnected, stopping analysis of {file.filename}")
+                return
+            certifications = await run_extraction(text, timer, extractor=extract_certification_data)
+            certification_results = certifications['certifications']
+            yield server_sent_event("certifications", {
+                "certifications": certification_results['certifications'],
+                "certification_details": certification_results['details'],
+                "certifications_summary": certification_results['summary']
+            })
+
+            body = build_analysis_response(file.filename, text, document_info, {**skills, **certifications})
+            await save_analyses([new_analysis_record(file.filename, file_content, text, body, duplicate_check)], timer)
+
+            with timer.stage('encode'):
+                event = server_sent_event("result", shape.apply(body))
+            yield event
+        except Exception as e:
+            logger.error(f"Analysis failed: {e}")
+            yield server_sent_event("error", {"error": str(e)})
+        finally:
+            REQUEST_DURATION.observe(timer.elapsed(), endpoint="analyze_stream")
+
+    return finish_request("analyze_stream", StreamingResponse(
+        stream_events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    ), timer, observe_duration=False)
+
+# A batch file: (filename, content or a callable reading it, error)
+BatchEntry = Tuple[str, Union[bytes, Callable[[], bytes]], Optional[str]]
+
+def expand_zip_upload(filename: str, archive_bytes: bytes, max_members: int,
+                      max_bytes: int) -> Tuple[List[BatchEntry], int]:
+    """
+    Expand a zip upload into batch entries without decompressing it
+
+    Member contents are callables reading the member, so each one is only
+    decompressed when the batch gets to it. Members that are too large are
+    reported without being read.
+
+    Args:
+        filename: Name of the uploaded archive
+        archive_bytes: Archive content
+        max_members: Most files the archive may add to the batch
+        max_bytes: Most uncompressed bytes the archive may add to the batch
+
+    Returns:
+        Entries, and the uncompressed size of the members that will be read
+
+    Raises:
+        UploadTooLarge: If the archive exceeds max_members or max_bytes
+    """
+    try:
+        archive = zipfile.ZipFile(io.BytesIO(archive_bytes))
+    except zipfile.BadZipFile:
+        return [(filename, b'', "Invalid zip archive.")], 0
+
+    members = [
+        info for info in archive.infolist() if not info.is_dir() and not info.filename.startswith('__MACOSX/')
+    ]
+    if len(members) > max_members:
+        raise UploadTooLarge(TOO_MANY_FILES_ERROR)
+    # Reads stop at the size declared in the archive, so the declared sizes bound the work
+    total_bytes = sum(info.file_size for info in members if info.file_size <= MAX_FILE_SIZE)
+    if total_bytes > max_bytes:
+        raise UploadTooLarge(DECOMPRESSED_TOO_LARGE_ERROR)
+
+    entries = []
+    for info in members:
+        member_name = f"{filename}/{info.filename}"
+        if info.file_size > MAX_FILE_SIZE:
+            entries.append((member_name, b'', FILE_TOO_LARGE_ERROR))
+        else:
+            entries.append((member_name, functools.partial(archive.read, info), None))
+    return entries, total_bytes
+
+async def analyze_batch_item(filename: str, file_content: Union[bytes, Callable[[], bytes]], error: Optional[str],
+                             use_cache: bool, semaphore: Optional[asyncio.Semaphore] = None,
+                             pending_records: Optional[List[AnalysisRecord]] = None) -> dict:
+    """
+    Analyze one file of a batch, reporting failures in the result instead of raising
+
+    Zip members are read once the item holds a semaphore slot. Successful
+    analyses are stored straight away, or appended to pending_records when
+    the caller writes them in bulk.
+    """
+    if error:
+        return {"filename": filename, "error": error}
+
+    timer = StageTimer()
+    # contextlib.nullcontext only supports async with from Python 3.10
+    async with semaphore if semaphore is not None else no_limit():
+        if callable(file_content):
+            try:
+                with timer.stage('upload_read'):
+                    file_content = await run_blocking(file_content)
+            except Exception as e:
+                logger.error(f"Failed to read {filename} from its zip archive: {e}")
+                return {"filename": filename, "error": "Invalid zip archive member."}
+        error = validate_upload(filename, file_content)
+        if error:
+            return {"filename": filename, "error": error}
+        BYTES_PROCESSED.inc(len(file_content))
+
+        try:
+            async with textract_semaphore:
+                with timer.stage('ocr'):
+                    analysis = await run_blocking(
+                        textract_service.analyze_document, file_content, use_cache=use_cache
+                    )
+        except Exception as e:
+            logger.error(f"Textract extraction failed for {filename}: {e}")
+            return {"filename": filename, "error": f"Failed to extract text from document: {str(e)}"}
+
+        try:
+            duplicate_check = await check_near_duplicate(file_content, analysis['text'], timer)
+            body = await collapsed_response(filename, duplicate_check)
+            if body is not None:
+                return body
+            extraction = await run_extraction(analysis['text'], timer)
+        except Exception as e:
+            logger.error(f"Analysis failed for {filename}: {e}")
+            return {"filename": filename, "error": str(e)}
+
+    body = build_analysis_response(filename, analysis['text'], analysis['document_info'], extraction)
+    record = new_analysis_record(filename, file_content, analysis['text'], body, duplicate_check)
+    if pending_records is not None:
+        pending_records.append(record)
+    else:
+        await save_analyses([record], timer)
+    return body
+
+@app.post("/analyze/batch")
+async def analyze_batch(files: List[UploadFile] = File(...), use_cache: bool = True,
+                        profile: Optional[str] = None, fields: Optional[str] = None):
+    """
+    Analyze many resumes (or zip archives of resumes) in one request
+
+    Results are streamed back as NDJSON, one line per file in completion order,
+    shaped by profile= and fields= like the /analyze body.
+    """
+    timer = StageTimer()
+    try:
+        shape = response_shape(profile, fields)
+    except ResponseShapeError as e:
+        return finish_request("analyze_batch", invalid_shape_response(e), timer)
+    if textract_service is None:
+        return finish_request("analyze_batch", FastJSONResponse({
+            "error": "AWS Textract service is not available. Please check your AWS configuration."
+        }, status_code=503), timer)
+
+    entries = []
+    decompressed_bytes = 0
+    for file in files:
+        is_zip = file.filename.lower().endswith('.zip')
+        try:
+            with timer.stage('upload_read'):
+                file_content = await read_upload(file, MAX_BATCH_UPLOAD_BYTES if is_zip else MAX_FILE_SIZE)
+        except UploadTooLarge:
+            entries.append((file.filename, b'', BATCH_TOO_LARGE_ERROR if is_zip else FILE_TOO_LARGE_ERROR))
+            continue
+        if is_zip:
+            try:
+                members, member_bytes = expand_zip_upload(
+                    file.filename, file_content, MAX_BATCH_FILES - len(entries),
+                    MAX_BATCH_DECOMPRESSED_BYTES - decompressed_bytes
+                )
+            except UploadTooLarge as e:
+                return finish_request("analyze_batch", FastJSONResponse({"error": str(e)}, status_code=400), timer)
+            entries.extend(members)
+            decompressed_bytes += member_bytes
+        else:
+            entries.append((file.filename, file_content, None))
+
+    if len(entries) > MAX_BATCH_FILES:
+        return finish_request("analyze_batch", FastJSONResponse({"error": TOO_MANY_FILES_ERROR}, status_code=400), timer)
+
+    logger.info(f"Processing batch of {len(entries)} files")
+    semaphore = asyncio.Semaphore(batch_concurrency)
+
+    async def stream_results():
+        pending_records = []
+        tasks = [
+            asyncio.create_task(analyze_batch_item(filename, content, error, use_cache, semaphore, pending_records))
+            for filename, content, error in entries
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield encode_json(shape.apply(await task)) + b"\n"
+                if len(pending_records) >= ANALYSIS_STORE_BATCH_SIZE:
+                    records = pending_records[:]
+                    pending_records.clear()
+                    await save_analyses(records)
+        finally:
+            # Stop outstanding work if the client goes away
+            for task in tasks:
+                task.cancel()
+            # Store what finished without waiting, the stream may be closing
+            if pending_records:
+                index_analyses(pending_records)
+                if analysis_store is not None:
+                    analysis_executor.submit(analysis_store.save_many, pending_records[:])
+            REQUEST_DURATION.observe(timer.elapsed(), endpoint="analyze_batch")
+
+    return finish_request(
+        "analyze_batch", StreamingResponse(stream_results(), media_type="application/x-ndjson"), timer,
+        observe_duration=False
+    )
+
+async def run_analysis_job(filename: str, file_content: bytes, use_cache: bool) -> dict:
+    """Analyze a queued upload, raising so the job is marked failed on error"""
+    result = await analyze_batch_item(filename, file_content, None, use_cache)
+    if "error" in result:
+        raise Exception(result["error"])
+    return result
+
+# Submitted jobs wait in a bounded queue; a full queue rejects new jobs.
+# Under Lambda the workers would only run while some later request is being
+# served, and a job could be polled on another container, so /jobs is off
+# there unless explicitly enabled.
+JOBS_ENABLED = os.getenv(
+    'JOBS_ENABLED', 'false' if os.getenv('AWS_LAMBDA_FUNCTION_NAME') else 'true'
+).lower() in ('1', 'true', 'yes')
+JOBS_DISABLED_ERROR = "Background jobs are not available on this deployment. Please use /analyze or /analyze/batch."
+job_store = get_job_store()
+job_queue = JobQueue(
+    job_store,
+    run_analysis_job,
+    workers=int(os.getenv('JOB_WORKERS', '4')),
+    max_pending=int(os.getenv('JOB_QUEUE_MAX_PENDING', '100')),
+    lease_seconds=float(os.getenv('JOB_LEASE_SECONDS', '60'))
+)
+REGISTRY.register(Gauge(
+    'resume_analyzer_job_queue_depth', 'Analysis jobs waiting for a worker', lambda: job_queue.depth
+))
+
+@app.on_event("startup")
+async def start_job_queue():
+    # The queue also fails jobs left behind by workers that stopped renewing their leases
+    if JOBS_ENABLED:
+        job_queue.start()
+
+@app.on_event("shutdown")
+async def stop_job_queue():
+    await job_queue.stop()
+
+@app.post("/jobs", status_code=202)
+async def submit_job(request: Request, file: UploadFile = File(...), use_cache: bool = True):
+    """
+    Queue a resume for analysis and return its job ID straight away
+
+    Poll GET /jobs/{job_id} for the status and, once completed, the result.
+    """
+    timer = StageTimer()
+    if not JOBS_ENABLED:
+        return finish_request("jobs", FastJSONResponse({"error": JOBS_DISABLED_ERROR}, status_code=503), timer)
+    if textract_service is None:
+        return finish_request("jobs", FastJSONResponse({
+            "error": "AWS Textract service is not available. Please check your AWS configuration."
+        }, status_code=503), timer)
+
+    try:
+        with timer.stage('upload_read'):
+            file_content = await read_upload(file, MAX_FILE_SIZE)
+    except UploadTooLarge:
+        return finish_request("jobs", FastJSONResponse({"error": FILE_TOO_LARGE_ERROR}, status_code=400), timer)
+    error = validate_upload(file.filename, file_content)
+    if error:
+        return finish_request("jobs", FastJSONResponse({"error": error}, status_code=400), timer)
+
+    try:
+        job = await job_queue.submit(file.filename, file_content=file_content, use_cache=use_cache)
+    except JobQueueFull as e:
+        return finish_request("jobs", FastJSONResponse(
+            {"error": f"{e}. Please retry later."}, status_code=429, headers={"Retry-After": "5"}
+        ), timer)
+
+    return finish_request("jobs", FastJSONResponse({
+        "job_id": job['job_id'],
+        "status": job['status'],
+        "status_url": str(request.url_for('get_job', job_id=job['job_id']))
+    }, status_code=202), timer)
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str, profile: Optional[str] = None, fields: Optional[str] = None):
+    try:
+        shape = response_shape(profile, fields)
+    except ResponseShapeError as e:
+        return invalid_shape_response(e)
+    job = await run_blocking(job_store.get, job_id)
+    if job is None:
+        return FastJSONResponse({"error": "Job not found."}, status_code=404)
+    if job.get('result') is not None:
+        job = {**job, 'result': shape.apply(job['result'])}
+    return FastJSONResponse(job)
+
+@app.get("/analyses")
+async def list_analyses(skill: Optional[str] = None, certification: Optional[str] = None, limit: int = 100):
+    """Return IDs of stored analyses that mention a skill and/or certification"""
+    if analysis_store is None:
+        return FastJSONResponse({"error": "Analysis store is not available."}, status_code=503)
+    analysis_ids = await run_blocking(
+        analysis_store.find_ids, skill=skill, certification=certification, limit=min(max(limit, 1), 1000)
+    )
+    return FastJSONResponse({"analysis_ids": analysis_ids})
+
+@app.get("/analyses/{analysis_id}")
+async def get_analysis(analysis_id: str, include_text: bool = False,
+                       profile: Optional[str] = None, fields: Optional[str] = None):
+    """Return a stored analysis without re-running OCR or extraction"""
+    try:
+        shape = response_shape(profile, fields)
+    except ResponseShapeError as e:
+        return invalid_shape_response(e)
+    if analysis_store is None:
+        return FastJSONResponse({"error": "Analysis store is not available."}, status_code=503)
+    record = await run_blocking(analysis_store.get, analysis_id)
+    if record is None:
+        return FastJSONResponse({"error": "Analysis not found."}, status_code=404)
+    return FastJSONResponse(shape.apply(record.to_dict(include_text=include_text)))
+
+@app.get("/search")
+async def search(q: str, limit: int = 100, offset: int = 0):
+    """
+    Find analyzed resumes by skills and certifications
+
+    q is a boolean query such as
+    `kubernetes AND "aws certified solutions architect" AND (postgresql OR mysql)`.
+    """
+    await load_indexes()
+    try:
+        results = search_index.search(q, limit=min(max(limit, 1), 1000), offset=max(offset, 0))
+    except QuerySyntaxError as e:
+        return FastJSONResponse({"error": f"Invalid query: {e}"}, status_code=400)
+    return FastJSONResponse({"query": q, **results})
+
+@app.post("/match")
+async def match_candidates(job_description: str = Body(..., embed=True), top_k: int = Body(10, embed=True)):
+    """
+    Rank analyzed resumes against a job description
+
+    The job description runs through the same skill and certification
+    extraction as resumes; candidates are scored by the weighted share of
+    those requirements their resume covers.
+    """
+    global match_scorer
+    await load_indexes()
+    if match_scorer is None:
+        match_scorer = await run_blocking(MatchScorer, search_index)
+
+    requirements = await run_blocking(match_scorer.job_requirements, job_description)
+    results = await run_blocking(match_scorer.rank, requirements, top_k=min(max(top_k, 1), 1000))
+    return FastJSONResponse({
+        "requirements": {
+            "skills": sorted(name for kind, name in requirements if kind == SKILL),
+            "certifications": sorted(name for kind, name in requirements if kind == CERTIFICATION)
+        },
+        **results
+    })
@@ -0,0 +1,73 @@
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# SQLite schema of the analysis store. Skills and certifications get their
+# own indexed tables so documents can be looked up by either.
+SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS analyses ('
+    'analysis_id TEXT PRIMARY KEY, filename TEXT NOT NULL, created_at REAL NOT NULL, '
+    'text TEXT NOT NULL, response TEXT NOT NULL)',
+    'CREATE TABLE IF NOT EXISTS analysis_skills ('
+    'analysis_id TEXT NOT NULL, skill TEXT NOT NULL, category TEXT NOT NULL, '
+    'PRIMARY KEY (analysis_id, skill)) WITHOUT ROWID',
+    'CREATE INDEX IF NOT EXISTS analysis_skills_skill ON analysis_skills (skill)',
+    'CREATE TABLE IF NOT EXISTS analysis_certifications ('
+    'analysis_id TEXT NOT NULL, certification TEXT NOT NULL, category TEXT NOT NULL, '
+    'PRIMARY KEY (analysis_id, certification)) WITHOUT ROWID',
+    'CREATE INDEX IF NOT EXISTS analysis_certifications_certification ON analysis_certifications (certification)',
+    'CREATE TABLE IF NOT EXISTS analysis_signatures ('
+    'analysis_id TEXT PRIMARY KEY, signature BLOB NOT NULL) WITHOUT ROWID',
+)
+
+class AnalysisRecord:
+    def __init__(self, analysis_id: str, filename: str, text: str, response: Dict[str, Any],
+                 created_at: Optional[float] = None, signature: Optional[bytes] = None):
+        """
+        One stored analysis
+
+        Args:
+            analysis_id: Content hash of the analyzed document
+            filename: Name the document was uploaded under
+            text: Text extracted from the document
+            response: The /analyze response body
+            created_at: Time the analysis was stored
+            signature: MinHash signature of the text, for near-duplicate detection
+        """
+        self.analysis_id = analysis_id
+        self.filename = filename
+        self.text = text
+        self.response = response
+        self.created_at = created_at if created_at is not None else time.time()
+        self.signature = signature
+
+    def skill_rows(self) -> List[Tuple[str, str, str]]:
+        """(analysis_id, skill, category) rows for the skills index"""
+        return [
+            (self.analysis_id, skill.lower(), category)
+            for category, skills in self.response.get('skills', {}).items()
+            for skill in skills
+        ]
+
+    def certification_rows(self) -> List[Tuple[str, str, str]]:
+        """(analysis_id, certification, category) rows for the certifications index"""
+        return [
+            (self.analysis_id, certification.lower(), category)
+            for category, certifications in self.response.get('certifications', {}).items()
+            for certification in certifications
+        ]
+
+    def skill_names(self) -> List[str]:
+        return [skill for _, skill, _ in self.skill_rows()]
+
+    def certification_names(self) -> List[str]:
+        return [certification for _, certification, _ in self.certification_rows()]
+
+    def to_dict(self, include_text: bool = False) -> Dict[str, Any]:
+        result = {
+            'analysis_id': self.analysis_id,
+            'created_at': self.created_at,
+            **self.response,
+        }
+        if include_text:
+            result['text'] = self.text
+        return result
@@ -55,6 +55,32 @@ aws iam attach-role-policy \
 
 echo "✅ Textract policy attached"
 
+# Allow staging large and multi-page PDFs for Textract's job-based API
+# (set TEXTRACT_S3_BUCKET, and TEXTRACT_S3_PREFIX if not textract-uploads/)
+if [ -n "$TEXTRACT_S3_BUCKET" ]; then
+  TEXTRACT_S3_PREFIX=${TEXTRACT_S3_PREFIX:-textract-uploads/}
+  echo "Granting access to s3://$TEXTRACT_S3_BUCKET/$TEXTRACT_S3_PREFIX..."
+  aws iam put-role-policy \
+    --role-name LambdaExecutionRole \
+    --policy-name ResumeAnalyzerTextractStaging \
+    --policy-document '{
+      "Version": "2012-10-17",
+      "Statement": [
+        {
+          "Effect": "Allow",
+          "Action": [
+            "s3:PutObject",
+            "s3:GetObject",
+            "s3:DeleteObject"
+          ],
+          "Resource": "arn:aws:s3:::'"$TEXTRACT_S3_BUCKET/$TEXTRACT_S3_PREFIX"'*"
+        }
+      ]
+    }'
+
+  echo "✅ Textract staging bucket policy attached"
+fi
+
 # Create custom policy for additional permissions
 echo "Creating custom policy for additional permissions..."
 aws iam create-policy \
@@ -78,7 +104,9 @@ aws iam create-policy \
           "textract:AnalyzeDocument",
           "textract:StartDocumentAnalysis",
           "textract:GetDocumentAnalysis",
-          "textract:ListDocumentAnalysisJobs"
+          "textract:ListDocumentAnalysisJobs",
+          "textract:StartDocumentTextDetection",
+          "textract:GetDocumentTextDetection"
         ],
         "Resource": "*"
       }
@@ -43,6 +43,32 @@ aws iam attach-role-policy \
 
 echo "✅ Textract policy attached"
 
+# Allow staging large and multi-page PDFs for Textract's job-based API
+# (set TEXTRACT_S3_BUCKET, and TEXTRACT_S3_PREFIX if not textract-uploads/)
+if [ -n "$TEXTRACT_S3_BUCKET" ]; then
+  TEXTRACT_S3_PREFIX=${TEXTRACT_S3_PREFIX:-textract-uploads/}
+  echo "Granting access to s3://$TEXTRACT_S3_BUCKET/$TEXTRACT_S3_PREFIX..."
+  aws iam put-role-policy \
+    --role-name LambdaExecutionRole \
+    --policy-name ResumeAnalyzerTextractStaging \
+    --policy-document '{
+      "Version": "2012-10-17",
+      "Statement": [
+        {
+          "Effect": "Allow",
+          "Action": [
+            "s3:PutObject",
+            "s3:GetObject",
+            "s3:DeleteObject"
+          ],
+          "Resource": "arn:aws:s3:::'"$TEXTRACT_S3_BUCKET/$TEXTRACT_S3_PREFIX"'*"
+        }
+      ]
+    }'
+
+  echo "✅ Textract staging bucket policy attached"
+fi
+
 # Get role ARN
 ROLE_ARN=$(aws iam get-role --role-name LambdaExecutionRole --query 'Role.Arn' --output text)
 echo "🎯 Lambda execution role ARN: $ROLE_ARN"
@@ -0,0 +1,135 @@
+"""
+Synthetic inputs and reference implementations shared by the tests
+"""
+import random
+
+from utils.certification_extractor import CertificationExtractor
+from utils.parser import ParsedDocument
+
+FILLER = [
+    'designed', 'scalable', 'services', 'team', 'delivered', 'platform', 'migration',
+    'engineer', 'professional', 'associate', 'developer', 'administrator', 'certified',
+    'cloud', 'data', 'security', 'network', 'project', 'management', 'expert', 'master',
+]
+
+
+def build_resume(extractor: CertificationExtractor, rng: random.Random, lines: int) -> str:
+    """Resume text mixing filler lines, inline certifications and a certifications section"""
+    certifications = sorted(extractor.all_certifications)
+    body = []
+    for _ in range(lines):
+        words = rng.sample(FILLER, rng.randint(4, 10))
+        if rng.random() < 0.3:
+            words.insert(rng.randrange(len(words)), rng.choice(certifications))
+        body.append(' '.join(words) + rng.choice([',', '.', '', ' - 2021']))
+    certs = ', '.join(rng.sample(certifications, 8))
+    return 'Experience\n' + '\n'.join(body) + '\n\nCertifications\n' + certs + '\n'
+
+
+def linear_match(extractor: CertificationExtractor, phrase_clean: str):
+    """First catalog certification related to a phrase, scanning in file order"""
+    for cert in extractor._ordered_certifications:
+        if phrase_clean in cert.lower() or cert.lower() in phrase_clean:
+            return cert
+    return None
+
+
+def run_stages(extractor: CertificationExtractor, texts: list) -> list:
+    """Certifications found by the section and pattern stages for each text"""
+    results = []
+    for text in texts:
+        document = ParsedDocument(text)
+        found = set()
+        found.update(extractor._extract_from_certification_sections(document))
+        found.update(extractor._extract_with_certification_patterns(document))
+        results.append(found)
+    return results
+
+
+def collect_phrases(extractor: CertificationExtractor, texts: list) -> list:
+    """Every phrase the stages look up in the catalog"""
+    phrases = []
+    original = extractor._match_certification
+
+    def recording_match(phrase_clean):
+        phrases.append(phrase_clean)
+        return original(phrase_clean)
+
+    extractor._match_certification = recording_match
+    try:
+        run_stages(extractor, texts)
+    finally:
+        del extractor._match_certification
+    return phrases
+
+
+def build_pdf(page_contents: list) -> bytes:
+    """
+    Minimal PDF with one page per content stream
+
+    Args:
+        page_contents: Content stream bytes for each page; empty bytes give a blank page
+
+    Returns:
+        PDF document bytes
+    """
+    objects = [b'<< /Type /Catalog /Pages 2 0 R >>', None,
+               b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>']
+    page_ids = []
+    for contents in page_contents:
+        objects.append(b'<< /Length %d >>\nstream\n%s\nendstream' % (len(contents), contents))
+        objects.append(b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+                       b'/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>' % len(objects))
+        page_ids.append(len(objects))
+    kids = b' '.join(b'%d 0 R' % page_id for page_id in page_ids)
+    objects[1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (kids, len(page_ids))
+
+    output = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b'%d 0 obj\n%s\nendobj\n' % (number, body)
+    xref = len(output)
+    output += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    output += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    output += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref)
+    return bytes(output)
+
+
+def text_page(text: str) -> bytes:
+    """Content stream that draws text, as a born-digital page would"""
+    return b'BT /F1 12 Tf 72 720 Td (%s) Tj ET' % text.encode('latin-1')
+
+
+# Draws a filled rectangle but no text, standing in for a scanned image
+SCANNED_PAGE = b'0 0 0 rg 72 72 468 648 re f'
+
+
+def textract_response(text: str) -> dict:
+    """detect_document_text style response with one LINE block per line"""
+    blocks = [{'BlockType': 'PAGE', 'Id': 'page-1', 'Confidence': 99.9}]
+    for number, line in enumerate(text.split('\n')):
+        blocks.append({'BlockType': 'LINE', 'Id': f"line-{number}", 'Text': line, 'Confidence': 99.0, 'Page': 1})
+    return {'DocumentMetadata': {'Pages': 1}, 'Blocks': blocks}
+
+
+class ScriptedTextractClient:
+    """
+    Stand-in for the boto3 Textract client that raises the given errors in
+    order before answering
+
+    Args:
+        errors: Exceptions raised by the first calls
+        text: Text of the response once the errors are used up
+    """
+
+    def __init__(self, errors: list, text: str = 'Senior engineer with Python and AWS experience'):
+        self.errors = list(errors)
+        self.response = textract_response(text)
+        self.calls = 0
+
+    def detect_document_text(self, Document):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return self.response
@@ -0,0 +1,74 @@
+import pytest
+
+import database
+from database import AnalysisStore
+from models import AnalysisRecord
+
+
+def make_record(analysis_id, skills, certifications=None, created_at=None, signature=None):
+    response = {
+        'filename': f"{analysis_id}.pdf",
+        'skills': {'programming_languages': skills},
+        'certifications': {'cloud': certifications or []},
+    }
+    return AnalysisRecord(analysis_id, f"{analysis_id}.pdf", f"Resume text of {analysis_id}", response,
+                          created_at=created_at, signature=signature)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return AnalysisStore(str(tmp_path / 'analyses.db'))
+
+
+def test_round_trip(store):
+    record = make_record('a1', ['Python', 'Go'], ['AWS Certified Developer'], created_at=100.0, signature=b'\x01\x02')
+    store.save(record)
+    stored = store.get('a1')
+
+    assert (stored.analysis_id, stored.filename, stored.text, stored.created_at) == (
+        'a1', 'a1.pdf', 'Resume text of a1', 100.0
+    )
+    assert stored.response == record.response
+    assert store.signatures() == {'a1': b'\x01\x02'}
+    assert store.get('missing') is None
+
+
+def test_save_replaces_earlier_analysis(store):
+    store.save(make_record('a1', ['Python']))
+    store.save_many([make_record('a1', ['Go']), make_record('a1', ['Rust'])])
+
+    assert store.count() == 1
+    assert store.find_ids(skill='python') == []
+    assert store.find_ids(skill='rust') == ['a1']
+
+
+def test_listing(store):
+    store.save_many([
+        make_record('old', ['Python'], ['AWS Certified Developer'], created_at=1.0),
+        make_record('new', ['Python', 'Go'], created_at=2.0),
+        make_record('other', ['Java'], ['AWS Certified Developer'], created_at=3.0),
+    ])
+
+    assert store.find_ids(skill='Python') == ['new', 'old']
+    assert store.find_ids(certification='aws certified developer') == ['other', 'old']
+    assert store.find_ids(skill='python', certification='AWS Certified Developer') == ['old']
+    assert store.find_ids(limit=2) == ['other', 'new']
+    entries = store.index_entries()
+    assert list(entries) == ['old', 'new', 'other']
+    assert {analysis_id: (sorted(skills), certifications) for analysis_id, (skills, certifications) in entries.items()} == {
+        'old': (['python'], ['aws certified developer']),
+        'new': (['go', 'python'], []),
+        'other': (['java'], ['aws certified developer']),
+    }
+
+
+def test_lambda_default_path(monkeypatch):
+    paths = []
+    monkeypatch.setattr(database, 'analysis_store', None)
+    monkeypatch.setattr(database, 'AnalysisStore', paths.append)
+    monkeypatch.setenv('AWS_LAMBDA_FUNCTION_NAME', 'resume-analyzer')
+    monkeypatch.delenv('ANALYSIS_STORE_PATH', raising=False)
+    monkeypatch.delenv('ANALYSIS_STORE_ENABLED', raising=False)
+    database.get_analysis_store()
+
+    assert paths == ['/tmp/analyses.db']
@@ -0,0 +1,35 @@
+import random
+
+import pytest
+
+from tests.helpers import build_resume, collect_phrases, linear_match, run_stages
+from utils.certification_extractor import CertificationExtractor
+
+
+@pytest.fixture(scope='module')
+def extractors():
+    indexed = CertificationExtractor()
+    linear = CertificationExtractor()
+    linear._match_certification = lambda phrase_clean: linear_match(linear, phrase_clean)
+    return indexed, linear
+
+
+@pytest.fixture(scope='module')
+def resumes(extractors):
+    indexed, _ = extractors
+    rng = random.Random(7)
+    return [build_resume(indexed, rng, lines) for lines in (40, 200) for _ in range(10)]
+
+
+def test_indexed_stages_match_linear_scan(extractors, resumes):
+    indexed, linear = extractors
+    assert run_stages(indexed, resumes) == run_stages(linear, resumes)
+
+
+def test_indexed_lookup_matches_linear_scan(extractors, resumes):
+    indexed, linear = extractors
+    phrases = collect_phrases(indexed, resumes)
+    assert phrases
+    assert [indexed._match_certification(phrase) for phrase in phrases] == [
+        linear._match_certification(phrase) for phrase in phrases
+    ]
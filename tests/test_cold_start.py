@@ -0,0 +1,41 @@
+import json
+import os
+import subprocess
+import sys
+
+# Modules that must stay off the import path of main
+DEFERRED_MODULES = ('boto3', 'botocore.client', 'pypdf', 'jinja2')
+
+# Far above the expected import time; only catches a heavy dependency
+# creeping back onto the startup path
+IMPORT_BUDGET_SECONDS = 10.0
+
+CHILD = f"""
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import main
+elapsed = time.perf_counter() - start
+deferred = {DEFERRED_MODULES!r}
+eager = [name for name in deferred if name in sys.modules]
+
+from fastapi.testclient import TestClient
+TestClient(main.app).get('/')
+print(json.dumps({{'elapsed': elapsed, 'eager': eager, 'jinja2_after_request': 'jinja2' in sys.modules}}))
+"""
+
+
+def test_main_imports_heavy_modules_lazily(tmp_path):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, ANALYSIS_STORE_PATH=str(tmp_path / 'analyses.db'))
+    completed = subprocess.run(
+        [sys.executable, '-c', CHILD], cwd=root, env=env, capture_output=True, text=True, timeout=120
+    )
+    assert completed.returncode == 0, completed.stderr
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    assert result['eager'] == []
+    assert result['elapsed'] < IMPORT_BUDGET_SECONDS
+    assert result['jinja2_after_request']
@@ -0,0 +1,74 @@
+import pytest
+
+from tests.helpers import SCANNED_PAGE, build_pdf, text_page
+from utils.analyzer import build_analysis_response
+from utils.extraction_backends import ExtractionBackend, PdfTextLayerBackend
+
+pytest.importorskip('pypdf')
+
+RESUME_TEXT = 'Senior engineer with Python and AWS experience'
+
+
+class RecordingBackend(ExtractionBackend):
+    name = 'textract'
+
+    def __init__(self, multipage: bool = True, fail: bool = False):
+        self.multipage = multipage
+        self.fail = fail
+        self.page_counts = []
+
+    @property
+    def accepts_multipage_documents(self) -> bool:
+        return self.multipage
+
+    def analyze_document(self, document_bytes, use_cache=True, page_count=None):
+        self.page_counts.append(page_count)
+        if self.fail:
+            raise Exception('Request throttled. Please try again later')
+        return {'text': 'OCR text from a scanned page', 'document_info': {'backend': self.name}}
+
+
+def test_mixed_pdf_skips_blank_pages():
+    fallback = RecordingBackend()
+    backend = PdfTextLayerBackend(fallback)
+    result = backend.analyze_document(build_pdf([text_page(RESUME_TEXT), b'', SCANNED_PAGE]))
+
+    assert fallback.page_counts == [1]
+    assert result['text'] == RESUME_TEXT + '\nOCR text from a scanned page'
+    assert result['document_info']['backend'] == 'mixed'
+    assert result['document_info']['page_backends'] == ['pdf_text', None, 'textract']
+
+
+def test_failed_page_is_treated_as_empty():
+    backend = PdfTextLayerBackend(RecordingBackend(fail=True))
+    result = backend.analyze_document(build_pdf([text_page(RESUME_TEXT), SCANNED_PAGE]))
+
+    assert result['text'] == RESUME_TEXT
+    assert result['document_info']['page_backends'] == ['pdf_text', None]
+
+
+def test_scanned_pdf_is_split_without_multipage_support():
+    fallback = RecordingBackend(multipage=False)
+    backend = PdfTextLayerBackend(fallback)
+    result = backend.analyze_document(build_pdf([SCANNED_PAGE, SCANNED_PAGE]))
+
+    assert fallback.page_counts == [1, 1]
+    assert result['document_info']['backend'] == 'textract'
+
+
+def test_scanned_pdf_goes_to_fallback_whole_with_multipage_support():
+    fallback = RecordingBackend()
+    PdfTextLayerBackend(fallback).analyze_document(build_pdf([SCANNED_PAGE, b'', SCANNED_PAGE]))
+
+    assert fallback.page_counts == [3]
+
+
+def test_extraction_method_reports_backend():
+    backend = PdfTextLayerBackend(RecordingBackend())
+    result = backend.analyze_document(build_pdf([text_page(RESUME_TEXT)]))
+    extraction = {'skills': {}, 'skills_summary': {}, 'certifications': {
+        'certifications': [], 'details': {}, 'summary': {}
+    }}
+    response = build_analysis_response('resume.pdf', result['text'], result['document_info'], extraction)
+
+    assert response['extraction_method'] == 'PDF text layer with advanced pattern matching'
@@ -0,0 +1,103 @@
+import asyncio
+import time
+
+import pytest
+
+from utils.job_queue import (
+    JOB_COMPLETED, JOB_FAILED, JOB_QUEUED, InMemoryJobStore, JobQueue, JobQueueFull, JobStore, SQLiteJobStore
+)
+
+
+async def echo_handler(filename, **payload):
+    return {'filename': filename, **payload}
+
+
+async def wait_for_status(store, job_id, status, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = store.get(job_id)
+        if job['status'] == status:
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"Job {job_id} is {store.get(job_id)['status']}, expected {status}")
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def store(request, tmp_path):
+    if request.param == 'sqlite':
+        return SQLiteJobStore(str(tmp_path / 'jobs.db'))
+    return InMemoryJobStore()
+
+
+def test_job_store_is_abstract():
+    with pytest.raises(TypeError):
+        JobStore()
+
+
+def test_submitted_job_completes(store):
+    async def scenario():
+        queue = JobQueue(store, echo_handler, workers=2)
+        job = await queue.submit('resume.pdf', use_cache=False)
+        assert job['status'] == JOB_QUEUED
+        done = await wait_for_status(store, job['job_id'], JOB_COMPLETED)
+        await queue.stop()
+        return done
+
+    job = asyncio.run(scenario())
+    assert job['result'] == {'filename': 'resume.pdf', 'use_cache': False}
+
+
+def test_failing_job_records_error(store):
+    async def failing_handler(filename, **payload):
+        raise Exception('No text could be extracted from the document')
+
+    async def scenario():
+        queue = JobQueue(store, failing_handler, workers=1)
+        job = await queue.submit('blank.pdf')
+        done = await wait_for_status(store, job['job_id'], JOB_FAILED)
+        await queue.stop()
+        return done
+
+    assert asyncio.run(scenario())['error'] == 'No text could be extracted from the document'
+
+
+def test_full_queue_rejects_submissions():
+    async def scenario():
+        queue = JobQueue(InMemoryJobStore(), echo_handler, workers=0, max_pending=1)
+        await queue.submit('first.pdf')
+        try:
+            with pytest.raises(JobQueueFull):
+                await queue.submit('second.pdf')
+        finally:
+            await queue.stop()
+
+    asyncio.run(scenario())
+
+
+def test_expired_leases_are_failed(tmp_path):
+    store = SQLiteJobStore(str(tmp_path / 'jobs.db'))
+    store.create('abandoned', 'resume.pdf', owner='stopped-worker', lease_expires=time.time() - 1)
+    store.create('leased', 'resume.pdf', owner='live-worker', lease_expires=time.time() + 60)
+
+    async def scenario():
+        queue = JobQueue(store, echo_handler, workers=1)
+        queue.start()
+        job = await wait_for_status(store, 'abandoned', JOB_FAILED)
+        await queue.stop()
+        return job
+
+    assert asyncio.run(scenario())['error'] == 'Job was interrupted by a server restart'
+    assert store.get('leased')['status'] == JOB_QUEUED
+
+
+def test_stop_fails_own_unfinished_jobs(tmp_path):
+    store = SQLiteJobStore(str(tmp_path / 'jobs.db'))
+
+    async def scenario():
+        queue = JobQueue(store, echo_handler, workers=0)
+        job = await queue.submit('resume.pdf')
+        await queue.stop()
+        return job
+
+    job = asyncio.run(scenario())
+    assert store.get(job['job_id'])['error'] == 'Job was interrupted by a server shutdown'
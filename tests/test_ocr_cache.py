@@ -0,0 +1,26 @@
+import sqlite3
+
+from utils.textract_service import OCRResultCache
+
+
+def stored_keys(db_path):
+    with sqlite3.connect(db_path) as db:
+        return {row[0] for row in db.execute('SELECT document_hash FROM ocr_results')}
+
+
+def test_write_caps_persistent_rows(tmp_path):
+    db_path = str(tmp_path / 'ocr.db')
+    cache = OCRResultCache(db_path=db_path, max_db_rows=3)
+    for number in range(5):
+        cache.set(f"key-{number}", {'text': str(number)})
+    assert stored_keys(db_path) == {'key-2', 'key-3', 'key-4'}
+
+
+def test_write_prunes_expired_rows(tmp_path):
+    db_path = str(tmp_path / 'ocr.db')
+    cache = OCRResultCache(db_path=db_path)
+    cache.set('old', {'text': 'old'})
+    with sqlite3.connect(db_path) as db:
+        db.execute("UPDATE ocr_results SET created_at = 0 WHERE document_hash = 'old'")
+    cache.set('new', {'text': 'new'})
+    assert stored_keys(db_path) == {'new'}
@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from utils.search_index import CERTIFICATION, SKILL, CandidateIndex, QuerySyntaxError, bit_count
+
+SKILLS = ['python', 'go', 'rust', 'java', 'kubernetes', 'postgresql', 'machine learning', 'react']
+CERTIFICATIONS = ['aws certified developer', 'cka', 'pmp', 'azure fundamentals']
+
+
+def random_query(rng, depth=0):
+    """(query text, evaluator over a document's terms)"""
+    if depth >= 2 or rng.random() < 0.4:
+        kind, name = rng.choice([(SKILL, name) for name in SKILLS] + [(CERTIFICATION, name) for name in CERTIFICATIONS])
+        return f'"{name}"', lambda terms: (kind, name) in terms
+    left_text, left = random_query(rng, depth + 1)
+    right_text, right = random_query(rng, depth + 1)
+    if rng.random() < 0.5:
+        return f'({left_text} AND {right_text})', lambda terms: left(terms) and right(terms)
+    return f'({left_text} OR {right_text})', lambda terms: left(terms) or right(terms)
+
+
+@pytest.fixture(scope='module')
+def corpus():
+    rng = random.Random(11)
+    index = CandidateIndex()
+    documents = {}
+    for number in range(300):
+        doc_id = f"doc-{rng.randrange(240)}"
+        skills = rng.sample(SKILLS, rng.randint(0, 4))
+        certifications = rng.sample(CERTIFICATIONS, rng.randint(0, 2))
+        index.add(doc_id, skills, certifications)
+        documents[doc_id] = {(SKILL, name) for name in skills} | {(CERTIFICATION, name) for name in certifications}
+        if number % 7 == 0:
+            removed = rng.choice(list(documents))
+            index.remove(removed)
+            del documents[removed]
+    return index, documents
+
+
+def test_bit_count():
+    assert [bit_count(value) for value in (0, 1, 0b1011, 1 << 200 | 1)] == [0, 1, 3, 2]
+
+
+def test_search_matches_linear_scan(corpus):
+    index, documents = corpus
+    rng = random.Random(5)
+    for _ in range(200):
+        query, matches = random_query(rng)
+        expected = [doc_id for doc_id, terms in documents.items() if matches(terms)]
+        result = index.search(query, limit=len(documents))
+        assert result == {'total': len(expected), 'analysis_ids': expected}, query
+
+
+def test_paging_matches_linear_scan(corpus):
+    index, documents = corpus
+    expected = [doc_id for doc_id, terms in documents.items() if (SKILL, 'python') in terms]
+    pages = [index.search('python', limit=7, offset=offset)['analysis_ids'] for offset in range(0, len(expected), 7)]
+
+    assert [doc_id for page in pages for doc_id in page] == expected
+    assert index.search('python', limit=7, offset=len(expected) + 1000) == {'total': len(expected), 'analysis_ids': []}
+    assert index.search('python', limit=3, offset=-5)['analysis_ids'] == expected[:3]
+
+
+def test_malformed_query(corpus):
+    index, _ = corpus
+    with pytest.raises(QuerySyntaxError):
+        index.search('python AND')
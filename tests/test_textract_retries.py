@@ -0,0 +1,58 @@
+import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError, ReadTimeoutError
+
+from tests.helpers import ScriptedTextractClient
+from utils.rate_limiter import TokenBucket
+from utils.textract_service import TextractService
+
+DOCUMENT = b'\x89PNG\r\n\x1a\nscanned resume'
+
+
+def client_error(code: str) -> ClientError:
+    return ClientError({'Error': {'Code': code, 'Message': code}}, 'DetectDocumentText')
+
+
+def make_service(client: ScriptedTextractClient, retries: int = 3) -> TextractService:
+    service = TextractService(textract_client=client)
+    service.throttle_retries = retries
+    service.throttle_backoff = 0.0
+    return service
+
+
+@pytest.mark.parametrize('error', [
+    client_error('ThrottlingException'),
+    client_error('InternalServerError'),
+    client_error('ServiceUnavailable'),
+    EndpointConnectionError(endpoint_url='https://textract.ap-southeast-2.amazonaws.com'),
+    ReadTimeoutError(endpoint_url='https://textract.ap-southeast-2.amazonaws.com'),
+])
+def test_retryable_errors_are_retried(error):
+    client = ScriptedTextractClient([error, error])
+    result = make_service(client).analyze_document(DOCUMENT, use_cache=False)
+
+    assert client.calls == 3
+    assert result['text'] == client.response['Blocks'][1]['Text']
+
+
+def test_throttling_slows_the_rate_limiter():
+    client = ScriptedTextractClient([client_error('ThrottlingException')])
+    service = make_service(client)
+    limiter = TokenBucket(8)
+    service.rate_limiters = {'detect_document_text': limiter}
+    service.analyze_document(DOCUMENT, use_cache=False)
+
+    assert limiter.rate < limiter.max_rate
+
+
+def test_other_errors_are_not_retried():
+    client = ScriptedTextractClient([client_error('AccessDeniedException')])
+    with pytest.raises(Exception, match='Access denied'):
+        make_service(client).analyze_document(DOCUMENT, use_cache=False)
+    assert client.calls == 1
+
+
+def test_retries_are_bounded():
+    client = ScriptedTextractClient([client_error('ThrottlingException')] * 5)
+    with pytest.raises(Exception, match='throttled'):
+        make_service(client, retries=2).analyze_document(DOCUMENT, use_cache=False)
+    assert client.calls == 3
@@ -0,0 +1,306 @@
+import os
+import time
+import pickle
+import hashlib
+import logging
+import threading
+from functools import lru_cache
+from typing import Dict, Any, Optional, Union
+from utils import certification_extractor, keyword_matcher, parser, skill_extractor
+from utils.skill_extractor import SkillExtractor
+from utils.certification_extractor import CertificationExtractor
+from utils.parser import ParsedDocument
+from utils.taxonomy import Taxonomy, file_digest, taxonomy_path
+
+logger = logging.getLogger(__name__)
+
+# Bump when the snapshot file layout changes
+SNAPSHOT_FORMAT = 2
+
+# Modules whose objects are pickled into snapshots; editing any of them
+# invalidates snapshots compiled by the previous code
+SNAPSHOT_MODULES = (skill_extractor, certification_extractor, keyword_matcher, parser)
+
+# How often each process checks the taxonomy file for changes (0 disables)
+TAXONOMY_CHECK_INTERVAL = float(os.getenv('TAXONOMY_CHECK_INTERVAL_SECONDS', '30'))
+
+# Reported extraction method for each document_info backend
+EXTRACTION_METHODS = {
+    'textract': 'AWS Textract',
+    'pdf_text': 'PDF text layer',
+    'mixed': 'PDF text layer and AWS Textract'
+}
+
+class TaxonomySnapshot:
+    def __init__(self, taxonomy: Taxonomy):
+        """
+        Extractors compiled from one taxonomy revision
+
+        A request takes one snapshot and uses it throughout, so swapping in a
+        new snapshot never mixes revisions within an analysis.
+
+        Args:
+            taxonomy: Taxonomy to compile
+        """
+        self.version = taxonomy.version
+        self.digest = taxonomy.digest
+        self.skill_extractor = SkillExtractor(taxonomy)
+        self.certification_extractor = CertificationExtractor(taxonomy)
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            'version': self.version,
+            'digest': self.digest,
+            'skills': len(self.skill_extractor.all_skills),
+            'certifications': len(self.certification_extractor.all_certifications)
+        }
+
+@lru_cache(maxsize=None)
+def code_fingerprint() -> str:
+    """SHA-256 over the source of the modules a snapshot pickles, and of this module"""
+    digest = hashlib.sha256()
+    for path in [module.__file__ for module in SNAPSHOT_MODULES] + [__file__]:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def snapshot_header(digest: str) -> tuple:
+    """Header identifying the taxonomy revision and extractor code a snapshot was built from"""
+    return (SNAPSHOT_FORMAT, code_fingerprint(), digest)
+
+def taxonomy_snapshot_path() -> str:
+    """Return the compiled snapshot file (TAXONOMY_SNAPSHOT_PATH, or next to the taxonomy file)"""
+    return os.getenv('TAXONOMY_SNAPSHOT_PATH', os.path.splitext(taxonomy_path())[0] + '.pickle')
+
+def write_taxonomy_snapshot(snapshot: TaxonomySnapshot, path: Optional[str] = None):
+    """
+    Write a compiled snapshot, replacing the old file atomically
+
+    The header (format, code fingerprint, taxonomy digest) is pickled
+    separately so stale snapshots can be recognized without unpickling the
+    extractors.
+    """
+    path = path or taxonomy_snapshot_path()
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as f:
+        pickle.dump(snapshot_header(snapshot.digest), f, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, path)
+
+def read_taxonomy_snapshot(digest: str, path: Optional[str] = None) -> Optional[TaxonomySnapshot]:
+    """
+    Read a compiled snapshot if it was built from the given taxonomy revision
+    by the current extractor code
+
+    Only snapshots written by this application should be configured, since
+    unpickling runs code from the file.
+
+    Returns:
+        TaxonomySnapshot, or None if the file is missing or stale
+    """
+    try:
+        with open(path or taxonomy_snapshot_path(), 'rb') as f:
+            if pickle.load(f) != snapshot_header(digest):
+                return None
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable taxonomy snapshot: {e}")
+        return None
+
+def load_taxonomy_snapshot() -> TaxonomySnapshot:
+    """
+    Load the current taxonomy, from its compiled snapshot when that is up to date
+
+    A stale or missing snapshot is recompiled from the taxonomy file and
+    written back when the snapshot location is writable.
+    """
+    snapshot = read_taxonomy_snapshot(file_digest())
+    if snapshot is not None:
+        return snapshot
+    snapshot = TaxonomySnapshot(Taxonomy.from_file())
+    try:
+        write_taxonomy_snapshot(snapshot)
+    except OSError as e:
+        logger.info(f"Taxonomy snapshot not written: {e}")
+    return snapshot
+
+# The live snapshot; replaced as a whole, so readers never need the lock
+taxonomy_snapshot = None
+taxonomy_checked_at = 0.0
+taxonomy_lock = threading.Lock()
+
+def get_taxonomy_snapshot() -> TaxonomySnapshot:
+    """
+    Get the live taxonomy snapshot, loading it on first use
+
+    Every TAXONOMY_CHECK_INTERVAL_SECONDS one caller also checks the taxonomy
+    file and swaps in a new snapshot if it changed; other callers keep using
+    the current one meanwhile.
+
+    Returns:
+        TaxonomySnapshot instance
+    """
+    global taxonomy_snapshot
+    if taxonomy_snapshot is None:
+        with taxonomy_lock:
+            if taxonomy_snapshot is None:
+                taxonomy_snapshot = load_taxonomy_snapshot()
+                _mark_checked()
+    elif TAXONOMY_CHECK_INTERVAL > 0 and time.monotonic() - taxonomy_checked_at >= TAXONOMY_CHECK_INTERVAL:
+        if taxonomy_lock.acquire(blocking=False):
+            try:
+                _reload_if_changed()
+            except Exception as e:
+                logger.error(f"Failed to reload taxonomy, keeping version {taxonomy_snapshot.version}: {e}")
+            finally:
+                _mark_checked()
+                taxonomy_lock.release()
+    return taxonomy_snapshot
+
+def reload_taxonomy() -> TaxonomySnapshot:
+    """
+    Reload the taxonomy file now if it changed
+
+    Returns:
+        The live TaxonomySnapshot after the reload
+
+    Raises:
+        ValueError: If the taxonomy file is invalid (the old snapshot stays live)
+    """
+    with taxonomy_lock:
+        _reload_if_changed()
+        _mark_checked()
+        return taxonomy_snapshot
+
+def _reload_if_changed():
+    global taxonomy_snapshot
+    current = taxonomy_snapshot
+    if current is not None and current.digest == file_digest():
+        return
+    snapshot = load_taxonomy_snapshot()
+    taxonomy_snapshot = snapshot
+    logger.info(f"Loaded taxonomy version {snapshot.version}")
+
+def _mark_checked():
+    global taxonomy_checked_at
+    taxonomy_checked_at = time.monotonic()
+
+def get_skill_extractor() -> SkillExtractor:
+    """
+    Get the SkillExtractor of the live taxonomy
+
+    Returns:
+        SkillExtractor instance
+    """
+    return get_taxonomy_snapshot().skill_extractor
+
+def get_certification_extractor() -> CertificationExtractor:
+    """
+    Get the CertificationExtractor of the live taxonomy
+
+    Returns:
+        CertificationExtractor instance
+    """
+    return get_taxonomy_snapshot().certification_extractor
+
+def extract_skill_data(text: Union[str, ParsedDocument], snapshot: Optional[TaxonomySnapshot] = None) -> Dict[str, Any]:
+    """
+    Run skill extraction over resume text
+
+    Args:
+        text: Text extracted from the resume, or its ParsedDocument
+        snapshot: Taxonomy to use; the live one when omitted
+
+    Returns:
+        Dictionary with 'skills', 'skills_summary' and 'timings' keys
+    """
+    start = time.perf_counter()
+    document = ParsedDocument.from_text(text)
+    skills = (snapshot or get_taxonomy_snapshot()).skill_extractor
+    categorized_skills = skills.extract_skills_from_text(document)
+    skills_summary = skills.get_skill_summary(categorized_skills)
+    return {
+        'skills': categorized_skills,
+        'skills_summary': skills_summary,
+        'timings': {'skills': time.perf_counter() - start}
+    }
+
+def extract_certification_data(text: Union[str, ParsedDocument],
+                               snapshot: Optional[TaxonomySnapshot] = None) -> Dict[str, Any]:
+    """
+    Run certification extraction over resume text
+
+    Args:
+        text: Text extracted from the resume, or its ParsedDocument
+        snapshot: Taxonomy to use; the live one when omitted
+
+    Returns:
+        Dictionary with 'certifications' and 'timings' keys
+    """
+    start = time.perf_counter()
+    extractor = (snapshot or get_taxonomy_snapshot()).certification_extractor
+    certifications = extractor.extract_certifications_from_text(ParsedDocument.from_text(text))
+    return {
+        'certifications': certifications,
+        'timings': {'certifications': time.perf_counter() - start}
+    }
+
+def extract_resume_data(text: str) -> Dict[str, Any]:
+    """
+    Run skill and certification extraction over resume text
+
+    Args:
+        text: Text extracted from the resume
+
+    Returns:
+        Dictionary with 'skills', 'skills_summary', 'certifications' and
+        per-stage 'timings' (seconds) keys
+    """
+    document = ParsedDocument(text)
+    snapshot = get_taxonomy_snapshot()
+    skills = extract_skill_data(document, snapshot)
+    certifications = extract_certification_data(document, snapshot)
+    return {
+        'skills': skills['skills'],
+        'skills_summary': skills['skills_summary'],
+        'certifications': certifications['certifications'],
+        'timings': {**skills['timings'], **certifications['timings']}
+    }
+
+def build_analysis_response(filename: str, text: str, document_info: Dict[str, Any],
+                            extraction: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Assemble the /analyze response body for one document
+
+    Args:
+        filename: Name of the uploaded file
+        text: Text extracted from the document
+        document_info: Document information from the extraction backend
+        extraction: Result of extract_resume_data
+
+    Returns:
+        Response dictionary
+    """
+    certification_results = extraction['certifications']
+    backend = document_info.get('backend', 'textract')
+    return {
+        "filename": filename,
+        "content_length": len(text),
+        "document_info": document_info,
+        "skills": extraction['skills'],
+        "skills_summary": extraction['skills_summary'],
+        "certifications": certification_results['certifications'],
+        "certification_details": certification_results['details'],
+        "certifications_summary": certification_results['summary'],
+        "extraction_method": f"{EXTRACTION_METHODS.get(backend, backend)} with advanced pattern matching"
+    }
+
+if __name__ == '__main__':
+    # Compile the taxonomy snapshot ahead of time, e.g. while packaging. The
+    # class is taken from the importable module so the pickle loads there.
+    from utils import analyzer
+    compiled = analyzer.TaxonomySnapshot(Taxonomy.from_file())
+    analyzer.write_taxonomy_snapshot(compiled)
+    print(f"Wrote taxonomy version {compiled.version} to {analyzer.taxonomy_snapshot_path()}")
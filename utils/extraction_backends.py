@@ -0,0 +1,174 @@
+import abc
+import io
+import os
+import logging
+import importlib.util
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+class ExtractionBackend(abc.ABC):
+    """
+    Interface for services that turn document bytes into text
+
+    Backends return a dictionary with 'text' and 'document_info' keys, and
+    record in document_info which backend served each page.
+    """
+    name = 'base'
+
+    @property
+    def accepts_multipage_documents(self) -> bool:
+        """Whether analyze_document can take a multi-page PDF in one call"""
+        return True
+
+    @abc.abstractmethod
+    def analyze_document(self, document_bytes: bytes, use_cache: bool = True,
+                         page_count: Optional[int] = None) -> Dict[str, Any]:
+        """Return the document's text and document_info"""
+
+    def extract_text_from_document(self, document_bytes: bytes) -> str:
+        """
+        Extract text from a document
+
+        Args:
+            document_bytes: Document content as bytes
+
+        Returns:
+            Extracted text as string
+        """
+        return self.analyze_document(document_bytes)['text']
+
+class PdfTextLayerBackend(ExtractionBackend):
+    """
+    Reads the embedded text layer of born-digital PDFs locally and only
+    sends scanned pages and images to the fallback backend
+    """
+    name = 'pdf_text'
+
+    def __init__(self, fallback: ExtractionBackend, min_chars_per_page: Optional[int] = None):
+        """
+        Args:
+            fallback: Backend used for images, scanned pages and unreadable PDFs
+            min_chars_per_page: Pages with less embedded text are treated as scanned
+        """
+        self.fallback = fallback
+        if min_chars_per_page is None:
+            min_chars_per_page = int(os.getenv('PDF_TEXT_MIN_CHARS', '20'))
+        self.min_chars_per_page = min_chars_per_page
+
+    @staticmethod
+    def is_available() -> bool:
+        """Return True if the PDF library is installed"""
+        # pypdf itself is only imported once a PDF arrives, keeping it off the
+        # cold-start path
+        return importlib.util.find_spec('pypdf') is not None
+
+    @property
+    def cache(self):
+        return self.fallback.cache
+
+    def analyze_document(self, document_bytes: bytes, use_cache: bool = True,
+                         page_count: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Extract text, reading embedded PDF text where possible
+
+        Args:
+            document_bytes: Document content as bytes
+            use_cache: Whether the fallback backend may use its OCR cache
+            page_count: Pages in the document, if already known
+
+        Returns:
+            Dictionary with 'text' and 'document_info' keys; page_backends
+            holds None for blank pages and pages the fallback could not read
+        """
+        reader = self._open_pdf(document_bytes)
+        if reader is None:
+            return self.fallback.analyze_document(document_bytes, use_cache=use_cache, page_count=page_count)
+
+        page_texts = []
+        page_backends = []
+        scanned_pages = []
+        for index, page in enumerate(reader.pages):
+            try:
+                page_text = page.extract_text() or ''
+            except Exception as e:
+                logger.warning(f"Failed to read PDF text layer: {e}")
+                page_text = ''
+            page_texts.append(page_text)
+            if len(page_text.strip()) >= self.min_chars_per_page:
+                page_backends.append(self.name)
+            elif self._is_blank(page):
+                # Nothing to read, so there is no point paying for OCR
+                page_backends.append(None)
+            else:
+                page_backends.append(self.fallback.name)
+                scanned_pages.append(index)
+
+        if self.name not in page_backends and scanned_pages and (
+                len(page_texts) == 1 or self.fallback.accepts_multipage_documents):
+            # The fallback reuses the page count instead of parsing the PDF again
+            return self.fallback.analyze_document(document_bytes, use_cache=use_cache, page_count=len(page_texts))
+
+        for index in scanned_pages:
+            try:
+                page_result = self.fallback.analyze_document(
+                    self._single_page_pdf(reader, index), use_cache=use_cache, page_count=1
+                )
+                page_texts[index] = page_result['text']
+            except Exception as e:
+                logger.warning(f"Failed to extract page {index + 1} with {self.fallback.name}: {e}")
+                page_texts[index] = ''
+                page_backends[index] = None
+
+        text = '\n'.join(page_text.strip() for page_text in page_texts if page_text.strip())
+        if not text:
+            raise Exception("No text could be extracted from the document")
+
+        backends_used = set(page_backends) - {None}
+        logger.info(
+            f"Read {page_backends.count(self.name)} of {len(page_texts)} pages from the PDF text layer"
+        )
+        return {
+            'text': text,
+            'document_info': {
+                'backend': backends_used.pop() if len(backends_used) == 1 else 'mixed',
+                'page_backends': page_backends,
+                'processing_mode': 'local' if not scanned_pages else 'per_page',
+                'document_metadata': {'Pages': len(page_texts)}
+            }
+        }
+
+    @staticmethod
+    def _is_blank(page) -> bool:
+        """Return True for pages that draw nothing at all"""
+        try:
+            contents = page.get_contents()
+            return contents is None or not contents.get_data().strip()
+        except Exception:
+            return False
+
+    def _open_pdf(self, document_bytes: bytes):
+        if not document_bytes.startswith(b'%PDF'):
+            return None
+        try:
+            from pypdf import PdfReader
+        except ImportError:
+            return None
+        try:
+            reader = PdfReader(io.BytesIO(document_bytes))
+            if reader.is_encrypted and not reader.decrypt(''):
+                return None
+            if not reader.pages:
+                return None
+            return reader
+        except Exception as e:
+            logger.warning(f"Failed to open PDF locally, falling back to {self.fallback.name}: {e}")
+            return None
+
+    def _single_page_pdf(self, reader, index: int) -> bytes:
+        from pypdf import PdfWriter
+        writer = PdfWriter()
+        writer.add_page(reader.pages[index])
+        buffer = io.BytesIO()
+        writer.write(buffer)
+        return buffer.getvalue()
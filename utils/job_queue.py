@@ -0,0 +1,336 @@
+import os
+import abc
+import json
+import time
+import uuid
+import asyncio
+import sqlite3
+import logging
+import threading
+import functools
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = 'queued'
+JOB_PROCESSING = 'processing'
+JOB_COMPLETED = 'completed'
+JOB_FAILED = 'failed'
+
+class JobQueueFull(Exception):
+    """Raised when a job is submitted while the queue is at capacity"""
+
+class JobStore(abc.ABC):
+    """
+    Interface for storing job status and results
+
+    Jobs are dictionaries with 'job_id', 'status', 'filename', 'created_at',
+    'updated_at', 'result' and 'error' keys. Each unfinished job is owned by
+    the queue that holds its payload, which keeps renewing a lease on it; a
+    job whose lease runs out belongs to a worker that is gone.
+    """
+
+    @abc.abstractmethod
+    def create(self, job_id: str, filename: str, owner: str = '',
+               lease_expires: float = float('inf')) -> Dict[str, Any]:
+        """Record a new queued job and return it"""
+
+    @abc.abstractmethod
+    def update(self, job_id: str, status: str, result: Optional[Dict[str, Any]] = None,
+               error: Optional[str] = None):
+        """Set a job's status, and its result or error"""
+
+    @abc.abstractmethod
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return a job, or None if it does not exist"""
+
+    def renew_leases(self, owner: str, lease_expires: float):
+        """Extend the lease on every unfinished job of an owner"""
+
+    def fail_unfinished(self, reason: str, owner: Optional[str] = None) -> int:
+        """
+        Mark jobs that can no longer run as failed
+
+        Args:
+            reason: Error recorded on the jobs
+            owner: Fail this owner's unfinished jobs (e.g. on shutdown); when
+                omitted, fail the unfinished jobs whose lease has expired
+
+        Returns:
+            Number of jobs marked failed
+        """
+        return 0
+
+class InMemoryJobStore(JobStore):
+    def __init__(self, ttl_seconds: float = 3600):
+        """
+        Job store kept in process memory
+
+        Args:
+            ttl_seconds: Time after which finished jobs are forgotten
+        """
+        self.ttl_seconds = ttl_seconds
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def create(self, job_id: str, filename: str, owner: str = '',
+               lease_expires: float = float('inf')) -> Dict[str, Any]:
+        # Only this process can see its jobs, so they need no lease
+        now = time.time()
+        job = {
+            'job_id': job_id, 'status': JOB_QUEUED, 'filename': filename,
+            'created_at': now, 'updated_at': now, 'result': None, 'error': None
+        }
+        with self._lock:
+            self._purge_expired(now)
+            self._jobs[job_id] = job
+        return dict(job)
+
+    def update(self, job_id: str, status: str, result: Optional[Dict[str, Any]] = None,
+               error: Optional[str] = None):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job.update(status=status, result=result, error=error, updated_at=time.time())
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+    def fail_unfinished(self, reason: str, owner: Optional[str] = None) -> int:
+        if owner is None:
+            return 0
+        now = time.time()
+        failed = 0
+        with self._lock:
+            for job in self._jobs.values():
+                if job['status'] in (JOB_QUEUED, JOB_PROCESSING):
+                    job.update(status=JOB_FAILED, error=reason, updated_at=now)
+                    failed += 1
+        return failed
+
+    def _purge_expired(self, now: float):
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job['status'] in (JOB_COMPLETED, JOB_FAILED) and now - job['updated_at'] > self.ttl_seconds
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+class SQLiteJobStore(JobStore):
+    def __init__(self, db_path: str, ttl_seconds: float = 3600):
+        """
+        Job store persisted in SQLite, so status and results survive restarts
+        and can be read by every worker process on the host
+
+        Args:
+            db_path: SQLite database file
+            ttl_seconds: Time after which finished jobs are deleted
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS jobs ('
+            'job_id TEXT PRIMARY KEY, status TEXT NOT NULL, filename TEXT NOT NULL, '
+            'created_at REAL NOT NULL, updated_at REAL NOT NULL, result TEXT, error TEXT)'
+        )
+        self._db.execute('CREATE INDEX IF NOT EXISTS jobs_status_updated ON jobs (status, updated_at)')
+        # Stores created before leases were added lack the ownership columns
+        columns = {row[1] for row in self._db.execute('PRAGMA table_info(jobs)')}
+        if 'owner' not in columns:
+            self._db.execute("ALTER TABLE jobs ADD COLUMN owner TEXT NOT NULL DEFAULT ''")
+            self._db.execute('ALTER TABLE jobs ADD COLUMN lease_expires REAL NOT NULL DEFAULT 0')
+        self._db.commit()
+
+    def create(self, job_id: str, filename: str, owner: str = '',
+               lease_expires: float = float('inf')) -> Dict[str, Any]:
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                'DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?',
+                (JOB_COMPLETED, JOB_FAILED, now - self.ttl_seconds)
+            )
+            self._db.execute(
+                'INSERT INTO jobs (job_id, status, filename, created_at, updated_at, owner, lease_expires) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (job_id, JOB_QUEUED, filename, now, now, owner, lease_expires)
+            )
+            self._db.commit()
+        return {
+            'job_id': job_id, 'status': JOB_QUEUED, 'filename': filename,
+            'created_at': now, 'updated_at': now, 'result': None, 'error': None
+        }
+
+    def update(self, job_id: str, status: str, result: Optional[Dict[str, Any]] = None,
+               error: Optional[str] = None):
+        payload = json.dumps(result) if result is not None else None
+        with self._lock:
+            self._db.execute(
+                'UPDATE jobs SET status = ?, result = ?, error = ?, updated_at = ? WHERE job_id = ?',
+                (status, payload, error, time.time(), job_id)
+            )
+            self._db.commit()
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._db.execute(
+                'SELECT job_id, status, filename, created_at, updated_at, result, error FROM jobs WHERE job_id = ?',
+                (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        job_id, status, filename, created_at, updated_at, result, error = row
+        return {
+            'job_id': job_id, 'status': status, 'filename': filename,
+            'created_at': created_at, 'updated_at': updated_at,
+            'result': json.loads(result) if result is not None else None, 'error': error
+        }
+
+    def renew_leases(self, owner: str, lease_expires: float):
+        with self._lock:
+            self._db.execute(
+                'UPDATE jobs SET lease_expires = ? WHERE owner = ? AND status IN (?, ?)',
+                (lease_expires, owner, JOB_QUEUED, JOB_PROCESSING)
+            )
+            self._db.commit()
+
+    def fail_unfinished(self, reason: str, owner: Optional[str] = None) -> int:
+        now = time.time()
+        if owner is None:
+            condition, argument = 'lease_expires < ?', now
+        else:
+            condition, argument = 'owner = ?', owner
+        with self._lock:
+            cursor = self._db.execute(
+                f'UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE status IN (?, ?) AND {condition}',
+                (JOB_FAILED, reason, now, JOB_QUEUED, JOB_PROCESSING, argument)
+            )
+            self._db.commit()
+        return cursor.rowcount
+
+class JobQueue:
+    def __init__(self, store: JobStore, handler: Callable[..., Awaitable[Dict[str, Any]]],
+                 workers: int = 4, max_pending: int = 100, lease_seconds: float = 60):
+        """
+        Bounded in-process queue that runs analysis jobs in the background
+
+        Payloads only live in this process, so the queue owns the jobs it
+        creates and renews their leases while it runs. Jobs of queues that
+        stopped renewing (a crashed or restarted worker) are failed by
+        whichever queue sharing the store notices first.
+
+        Args:
+            store: Where job status and results are kept
+            handler: Coroutine function called with a job's payload; returns the
+                result, or raises to fail the job
+            workers: Jobs processed at the same time
+            max_pending: Jobs allowed to wait before submissions are rejected
+            lease_seconds: How long a job stays owned without its lease being renewed
+        """
+        self.store = store
+        self.handler = handler
+        self.workers = workers
+        self.max_pending = max_pending
+        self.lease_seconds = lease_seconds
+        self.owner = uuid.uuid4().hex
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks = []
+
+    @property
+    def depth(self) -> int:
+        """Number of jobs waiting for a worker"""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def start(self):
+        """Start the worker tasks on the running event loop"""
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._renew_leases()))
+
+    async def stop(self):
+        """Cancel the worker tasks and fail the jobs still waiting"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        await self._run_store(self.store.fail_unfinished, "Job was interrupted by a server shutdown", owner=self.owner)
+
+    async def _run_store(self, func, *args, **kwargs):
+        # Store calls may hit SQLite, so keep them off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+    async def submit(self, filename: str, **payload) -> Dict[str, Any]:
+        """
+        Queue a job
+
+        Args:
+            filename: Name of the uploaded file
+            **payload: Keyword arguments for the handler
+
+        Returns:
+            The newly created job
+
+        Raises:
+            JobQueueFull: If max_pending jobs are already waiting
+        """
+        self.start()
+        if self._queue.full():
+            raise JobQueueFull(f"Job queue is full ({self.max_pending} jobs pending)")
+        job = await self._run_store(
+            self.store.create, uuid.uuid4().hex, filename, owner=self.owner,
+            lease_expires=time.time() + self.lease_seconds
+        )
+        try:
+            self._queue.put_nowait((job['job_id'], filename, payload))
+        except asyncio.QueueFull:
+            # Other submissions filled the queue while the job was being created
+            await self._run_store(self.store.update, job['job_id'], JOB_FAILED, error="Job queue is full")
+            raise JobQueueFull(f"Job queue is full ({self.max_pending} jobs pending)")
+        return job
+
+    async def _worker(self):
+        while True:
+            job_id, filename, payload = await self._queue.get()
+            try:
+                await self._run_store(self.store.update, job_id, JOB_PROCESSING)
+                result = await self.handler(filename=filename, **payload)
+                await self._run_store(self.store.update, job_id, JOB_COMPLETED, result=result)
+            except asyncio.CancelledError:
+                # The loop is going away, so record the failure without awaiting
+                self.store.update(job_id, JOB_FAILED, error="Job was cancelled")
+                raise
+            except Exception as e:
+                logger.error(f"Job {job_id} failed: {e}")
+                await self._run_store(self.store.update, job_id, JOB_FAILED, error=str(e))
+            finally:
+                self._queue.task_done()
+
+    async def _renew_leases(self):
+        while True:
+            try:
+                await self._run_store(self.store.renew_leases, self.owner, time.time() + self.lease_seconds)
+                abandoned = await self._run_store(self.store.fail_unfinished, "Job was interrupted by a server restart")
+                if abandoned:
+                    logger.warning(f"Marked {abandoned} jobs of stopped workers as failed")
+            except Exception as e:
+                logger.error(f"Failed to renew job leases: {e}")
+            await asyncio.sleep(self.lease_seconds / 3)
+
+def get_job_store() -> JobStore:
+    """
+    Create the job store selected by JOB_STORE ('memory' or 'sqlite')
+
+    Returns:
+        JobStore instance
+    """
+    ttl_seconds = float(os.getenv('JOB_RESULT_TTL_SECONDS', '3600'))
+    if os.getenv('JOB_STORE', 'memory') == 'sqlite':
+        return SQLiteJobStore(os.getenv('JOB_STORE_PATH', 'jobs.db'), ttl_seconds=ttl_seconds)
+    return InMemoryJobStore(ttl_seconds=ttl_seconds)
@@ -0,0 +1,171 @@
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+class KeywordMatcher:
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Aho-Corasick automaton that finds many keywords in a single pass
+
+        Args:
+            keywords: Keywords to match, in the same case as the text to search
+        """
+        self.keywords: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+
+        for keyword in dict.fromkeys(keywords):
+            if keyword:
+                self._add_keyword(keyword)
+        self._build_failure_links()
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def _add_keyword(self, keyword: str):
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(len(self.keywords))
+        self.keywords.append(keyword)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state].extend(self._output[self._fail[next_state]])
+
+    def iter_matches(self, text: str, word_boundaries: bool = True) -> Iterator[Tuple[int, int, str]]:
+        """
+        Yield (start, end, keyword) for every keyword occurrence in text
+
+        With word boundaries enabled a keyword only matches when it is not
+        glued to an adjacent word character, so 'java' does not match inside
+        'javascript' while 'c++' still matches before punctuation.
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        keywords = self.keywords
+        state = 0
+
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if not output[state]:
+                continue
+
+            end = index + 1
+            for keyword_id in output[state]:
+                keyword = keywords[keyword_id]
+                start = end - len(keyword)
+                if word_boundaries and not self.has_word_boundaries(text, start, end):
+                    continue
+                yield start, end, keyword
+
+    @staticmethod
+    def has_word_boundaries(text: str, start: int, end: int) -> bool:
+        """Return True if text[start:end] is not glued to adjacent word characters"""
+        if start > 0 and _is_word_char(text[start]) and _is_word_char(text[start - 1]):
+            return False
+        if end < len(text) and _is_word_char(text[end - 1]) and _is_word_char(text[end]):
+            return False
+        return True
+
+    def find_all(self, text: str) -> Set[str]:
+        """Return the set of keywords that occur in text"""
+        return {keyword for _, _, keyword in self.iter_matches(text)}
+
+class SubstringIndex:
+    def __init__(self, entries: List[str], gram_size: int = 3):
+        """
+        Index answering "which entry contains, or is contained in, this string"
+
+        Args:
+            entries: Strings to index; their order decides which match wins
+            gram_size: Length of the character n-grams used for posting lists
+        """
+        self.entries = entries
+        self.gram_size = gram_size
+        self._max_length = max((len(entry) for entry in entries), default=0)
+        self._short: Dict[str, int] = {}
+        self._short_entries: List[int] = []
+        self._grams: Dict[str, Set[int]] = {}
+        self._anchors: Dict[str, List[int]] = {}
+
+        for position, entry in enumerate(entries):
+            for length in range(min(gram_size, len(entry) + 1)):
+                for start in range(len(entry) - length + 1):
+                    self._short.setdefault(entry[start:start + length], position)
+            for gram in self._gram_set(entry):
+                self._grams.setdefault(gram, set()).add(position)
+
+        # Every entry is anchored on its rarest n-gram; an entry can only be
+        # contained in a query that shares that n-gram
+        for position, entry in enumerate(entries):
+            if len(entry) < gram_size:
+                self._short_entries.append(position)
+                continue
+            anchor = min(sorted(self._gram_set(entry)), key=lambda gram: len(self._grams[gram]))
+            self._anchors.setdefault(anchor, []).append(position)
+
+    def _gram_set(self, text: str) -> Set[str]:
+        size = self.gram_size
+        return {text[start:start + size] for start in range(len(text) - size + 1)}
+
+    def first_related(self, query: str) -> Optional[int]:
+        """
+        Return the position of the first entry that contains query or is
+        contained in it, or None if no entry is related
+        """
+        grams = self._gram_set(query)
+        best = self._first_containing(query, grams)
+        for position in self._contained_in(query, grams):
+            if best is None or position < best:
+                best = position
+        return best
+
+    def _first_containing(self, query: str, grams: Set[str]) -> Optional[int]:
+        if len(query) < self.gram_size:
+            return self._short.get(query)
+        if len(query) > self._max_length:
+            return None
+
+        postings = []
+        for gram in grams:
+            posting = self._grams.get(gram)
+            if not posting:
+                return None
+            postings.append(posting)
+        postings.sort(key=len)
+
+        for position in sorted(postings[0].intersection(*postings[1:])):
+            if query in self.entries[position]:
+                return position
+        return None
+
+    def _contained_in(self, query: str, grams: Set[str]) -> Iterator[int]:
+        for position in self._short_entries:
+            if self.entries[position] in query:
+                yield position
+        for gram in grams.intersection(self._anchors):
+            for position in self._anchors[gram]:
+                if self.entries[position] in query:
+                    yield position
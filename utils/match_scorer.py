@@ -0,0 +1,131 @@
+import heapq
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.analyzer import get_taxonomy_snapshot
+from utils.parser import ParsedDocument
+from utils.search_index import CERTIFICATION, SKILL, CandidateIndex, normalize_term
+
+# Set bit positions of every byte value, for walking bitsets without NumPy
+BYTE_BITS = [tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)]
+
+def category_weights(priority: List[str]) -> Dict[str, float]:
+    """
+    Weight categories by their priority order
+
+    The first category gets a weight equal to the number of categories and
+    each later one gets one less, down to 1 for the last.
+    """
+    return {category: float(len(priority) - rank) for rank, category in enumerate(priority)}
+
+class MatchScorer:
+    def __init__(self, index: CandidateIndex):
+        """
+        Ranks indexed candidates against a job description
+
+        Args:
+            index: Candidate index whose skill and certification bitsets are scored
+        """
+        self.index = index
+
+    def job_requirements(self, job_description: str) -> Dict[Tuple[str, str], float]:
+        """
+        Extract the weighted skills and certifications a job description asks for
+
+        Args:
+            job_description: Job description text
+
+        Returns:
+            Mapping of (kind, normalized name) to weight
+        """
+        document = ParsedDocument(job_description)
+        # Weights follow the priorities of the same taxonomy revision that extracts
+        snapshot = get_taxonomy_snapshot()
+        skills = snapshot.skill_extractor
+        certifications = snapshot.certification_extractor
+        skill_weights = category_weights(skills.skill_priority)
+        certification_weights = category_weights(certifications.certification_priority)
+        requirements = {}
+        for category, names in skills.extract_skills_from_text(document).items():
+            for name in names:
+                requirements[(SKILL, normalize_term(name))] = skill_weights.get(category, 1.0)
+        certification_results = certifications.extract_certifications_from_text(document)
+        for category, names in certification_results['certifications'].items():
+            for name in names:
+                requirements[(CERTIFICATION, normalize_term(name))] = certification_weights.get(category, 1.0)
+        return requirements
+
+    def rank(self, requirements: Dict[Tuple[str, str], float], top_k: int = 10) -> Dict[str, Any]:
+        """
+        Score every indexed candidate and return the best matches
+
+        A candidate's score is the weighted share of the requirements found
+        in their resume, from 0 to 1.
+
+        Args:
+            requirements: Output of job_requirements
+            top_k: Number of candidates returned
+
+        Returns:
+            Dictionary with 'candidates_scored' and 'matches' (best first)
+        """
+        slots, postings, doc_ids = self.index.snapshot_postings(requirements)
+        total_weight = sum(requirements.values())
+        if not postings or total_weight == 0:
+            return {'candidates_scored': len(self.index), 'matches': []}
+
+        top = _top_k_numpy(slots, postings, requirements, top_k)
+        if top is None:
+            top = _top_k_python(postings, requirements, top_k)
+
+        matches = []
+        for slot, score in top:
+            doc_id = doc_ids[slot]
+            if doc_id is None:
+                continue
+            terms = set(self.index.document_terms(doc_id))
+            matches.append({
+                'analysis_id': doc_id,
+                'score': round(score / total_weight, 4),
+                'matched_skills': sorted(name for kind, name in requirements if kind == SKILL and (kind, name) in terms),
+                'matched_certifications': sorted(
+                    name for kind, name in requirements if kind == CERTIFICATION and (kind, name) in terms
+                ),
+            })
+        return {'candidates_scored': len(self.index), 'matches': matches}
+
+def _top_k_numpy(slots: int, postings: Dict[Tuple[str, str], bytes], requirements: Dict[Tuple[str, str], float],
+                 top_k: int) -> Optional[List[Tuple[int, float]]]:
+    """Score all candidates in one pass over unpacked bitsets; None if NumPy is missing"""
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    scores = np.zeros(slots, dtype=np.float32)
+    for term, posting in postings.items():
+        bits = np.unpackbits(np.frombuffer(posting, dtype=np.uint8), count=slots, bitorder='little')
+        scores += bits * np.float32(requirements[term])
+
+    candidates = np.flatnonzero(scores)
+    # Highest score first, earlier-indexed candidates first among ties
+    keys = scores[candidates].astype(np.float64) * (slots + 1) - candidates
+    if candidates.size > top_k:
+        # Linear-time selection of the k best, then sort only those
+        best = np.argpartition(-keys, top_k - 1)[:top_k]
+        candidates, keys = candidates[best], keys[best]
+    order = np.argsort(-keys)
+    return [(int(slot), float(scores[slot])) for slot in candidates[order]]
+
+def _top_k_python(postings: Dict[Tuple[str, str], bytes], requirements: Dict[Tuple[str, str], float],
+                  top_k: int) -> List[Tuple[int, float]]:
+    """Pure-Python scoring: accumulate per set bit, then pick the best with a heap"""
+    scores: Dict[int, float] = {}
+    for term, posting in postings.items():
+        weight = requirements[term]
+        for byte_index, byte in enumerate(posting):
+            if byte:
+                base = byte_index * 8
+                for bit in BYTE_BITS[byte]:
+                    slot = base + bit
+                    scores[slot] = scores.get(slot, 0.0) + weight
+    return heapq.nsmallest(top_k, scores.items(), key=lambda item: (-item[1], item[0]))
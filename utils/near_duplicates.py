@@ -0,0 +1,154 @@
+import re
+import zlib
+import random
+import threading
+from array import array
+from typing import Dict, List, Optional, Set, Tuple
+
+WORD_PATTERN = re.compile(r'[a-z0-9]+')
+
+# Hash permutations are (a * x + b) mod a Mersenne prime; with 31-bit values
+# every product fits in 64 bits, so NumPy and pure Python agree exactly
+MERSENNE_PRIME = (1 << 31) - 1
+
+def shingles(text: str, size: int = 5) -> Set[int]:
+    """
+    Hash the overlapping word n-grams of a text
+
+    Args:
+        text: Document text
+        size: Words per shingle
+
+    Returns:
+        Set of 31-bit shingle hashes
+    """
+    words = WORD_PATTERN.findall(text.lower())
+    if len(words) < size:
+        return {zlib.crc32(' '.join(words).encode('utf-8')) % MERSENNE_PRIME} if words else set()
+    return {
+        zlib.crc32(' '.join(words[index:index + size]).encode('utf-8')) % MERSENNE_PRIME
+        for index in range(len(words) - size + 1)
+    }
+
+class NearDuplicateIndex:
+    def __init__(self, num_perm: int = 128, bands: int = 16, threshold: float = 0.85, seed: int = 1):
+        """
+        MinHash signatures with a banded LSH index for near-duplicate lookups
+
+        Documents whose signatures agree on every row of at least one band
+        become candidates; candidates are then confirmed by their estimated
+        Jaccard similarity. With 16 bands of 8 rows, pairs above roughly 0.7
+        similarity are almost always found while lookups stay sub-linear.
+
+        Args:
+            num_perm: Number of hash permutations (signature length)
+            bands: Number of LSH bands; must divide num_perm
+            threshold: Estimated Jaccard similarity at which documents count as duplicates
+            seed: Seed of the hash permutations, fixed so stored signatures stay comparable
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        rng = random.Random(seed)
+        self._a = [rng.randrange(1, MERSENNE_PRIME) for _ in range(num_perm)]
+        self._b = [rng.randrange(0, MERSENNE_PRIME) for _ in range(num_perm)]
+        self._signatures: Dict[str, bytes] = {}
+        self._buckets: List[Dict[bytes, List[str]]] = [{} for _ in range(bands)]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._signatures
+
+    def signature(self, text: str) -> bytes:
+        """
+        Compute the MinHash signature of a text
+
+        Returns:
+            num_perm unsigned 32-bit minimums, as little-endian bytes
+        """
+        hashes = shingles(text)
+        if not hashes:
+            return array('I', [MERSENNE_PRIME] * self.num_perm).tobytes()
+        signature = _min_hashes_numpy(self._a, self._b, hashes)
+        if signature is None:
+            signature = _min_hashes_python(self._a, self._b, hashes)
+        return signature
+
+    def similarity(self, first: bytes, second: bytes) -> float:
+        """Estimate the Jaccard similarity of two signatures"""
+        first_values = array('I', first)
+        second_values = array('I', second)
+        return sum(x == y for x, y in zip(first_values, second_values)) / self.num_perm
+
+    def _band_keys(self, signature: bytes) -> List[bytes]:
+        width = self.rows * 4
+        return [signature[band * width:(band + 1) * width] for band in range(self.bands)]
+
+    def add(self, doc_id: str, signature: bytes):
+        """Index a document's signature, replacing an earlier one"""
+        with self._lock:
+            if doc_id in self._signatures:
+                self._remove(doc_id)
+            self._signatures[doc_id] = signature
+            for buckets, key in zip(self._buckets, self._band_keys(signature)):
+                buckets.setdefault(key, []).append(doc_id)
+
+    def remove(self, doc_id: str):
+        with self._lock:
+            if doc_id in self._signatures:
+                self._remove(doc_id)
+
+    def _remove(self, doc_id: str):
+        signature = self._signatures.pop(doc_id)
+        for buckets, key in zip(self._buckets, self._band_keys(signature)):
+            bucket = buckets[key]
+            bucket.remove(doc_id)
+            if not bucket:
+                del buckets[key]
+
+    def query(self, signature: bytes, exclude: Optional[str] = None) -> Optional[Tuple[str, float]]:
+        """
+        Find the most similar indexed document at or above the threshold
+
+        Args:
+            signature: Signature of the incoming document
+            exclude: Document ID to ignore (e.g. the document itself)
+
+        Returns:
+            (doc_id, estimated similarity), or None if there is no near duplicate
+        """
+        with self._lock:
+            candidates = set()
+            for buckets, key in zip(self._buckets, self._band_keys(signature)):
+                candidates.update(buckets.get(key, ()))
+            candidates.discard(exclude)
+            scored = [(self.similarity(signature, self._signatures[doc_id]), doc_id) for doc_id in candidates]
+        best = max(scored, default=None)
+        if best is None or best[0] < self.threshold:
+            return None
+        similarity, doc_id = best
+        return doc_id, similarity
+
+def _min_hashes_numpy(a: List[int], b: List[int], hashes: Set[int]) -> Optional[bytes]:
+    """Apply every permutation to every shingle in one array operation; None if NumPy is missing"""
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    values = np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+    a = np.array(a, dtype=np.uint64)[:, None]
+    b = np.array(b, dtype=np.uint64)[:, None]
+    return ((a * values + b) % MERSENNE_PRIME).min(axis=1).astype('<u4').tobytes()
+
+def _min_hashes_python(a: List[int], b: List[int], hashes: Set[int]) -> bytes:
+    """Pure-Python MinHash, one permutation at a time"""
+    return array('I', [
+        min((a_value * value + b_value) % MERSENNE_PRIME for value in hashes)
+        for a_value, b_value in zip(a, b)
+    ]).tobytes()
@@ -0,0 +1,74 @@
+import re
+from typing import Dict, List, Union
+from utils.keyword_matcher import KeywordMatcher
+
+# Section bodies start after the header and run to the end of that line, or
+# to the first non-empty line when the header ends its own line
+SECTION_BODY_PATTERN = re.compile(r'[:\s]*([^\n]*(?:\n[^\n]*)*?)(?:\n\n|\n[A-Z]|\n\d|$)', re.IGNORECASE | re.MULTILINE)
+
+class SectionHeaderScanner:
+    def __init__(self, headers: List[str]):
+        """
+        Finds the section bodies that follow any of a set of headers in one pass
+
+        Args:
+            headers: Lowercase section headers
+        """
+        self.headers = list(dict.fromkeys(headers))
+        self._matcher = KeywordMatcher(self.headers)
+
+    def scan(self, text_lower: str) -> List[str]:
+        """
+        Return section bodies grouped by header, in header order
+
+        Each header behaves like its own non-overlapping regex scan: a later
+        mention is skipped if it starts inside the previous section of the
+        same header.
+        """
+        occurrences = {header: [] for header in self.headers}
+        for start, end, header in self._matcher.iter_matches(text_lower, word_boundaries=False):
+            occurrences[header].append((start, end))
+
+        sections = []
+        for header in self.headers:
+            last_end = 0
+            for start, end in sorted(occurrences[header]):
+                if start < last_end:
+                    continue
+                match = SECTION_BODY_PATTERN.match(text_lower, end)
+                sections.append(match.group(1))
+                last_end = match.end()
+        return sections
+
+class ParsedDocument:
+    def __init__(self, text: str):
+        """
+        Resume text with its lowercase copy, computed once for all extractors
+
+        Args:
+            text: Raw text extracted from the document
+        """
+        self.text = text
+        self.text_lower = text.lower()
+        self._sections: Dict[SectionHeaderScanner, List[str]] = {}
+
+    @classmethod
+    def from_text(cls, text: Union[str, 'ParsedDocument']) -> 'ParsedDocument':
+        """Return text as a ParsedDocument, parsing it only if needed"""
+        if isinstance(text, cls):
+            return text
+        return cls(text)
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def section_texts(self, scanner: SectionHeaderScanner) -> List[str]:
+        """
+        Return the section bodies that follow any of the scanner's headers
+
+        Each extractor has its own scanner, so results are only reused when
+        the same extractor looks at the document again.
+        """
+        if scanner not in self._sections:
+            self._sections[scanner] = scanner.scan(self.text_lower)
+        return self._sections[scanner]
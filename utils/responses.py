@@ -0,0 +1,85 @@
+import json
+from typing import Any, Dict, Optional
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Response profiles: None keeps every field of the /analyze body
+PROFILES = {
+    'full': None,
+    # Drops what can be derived from the remaining fields (the summaries
+    # repeat skills and certifications) and the raw Textract statistics
+    'compact': (
+        'analysis_id', 'filename', 'content_length', 'skills', 'certifications', 'certification_details',
+        'near_duplicate_of', 'duplicate_of', 'error'
+    ),
+}
+
+# Every top-level field an analysis body can have, for validating fields=
+RESPONSE_FIELDS = (
+    'analysis_id', 'created_at', 'filename', 'content_length', 'document_info', 'skills', 'skills_summary',
+    'certifications', 'certification_details', 'certifications_summary', 'extraction_method',
+    'near_duplicate_of', 'duplicate_of', 'text', 'error'
+)
+
+# Kept whatever fields= asks for, so batch and stream results (sent in
+# completion order) and their errors can always be tied back to a file
+IDENTITY_FIELDS = ('analysis_id', 'filename')
+
+class ResponseShapeError(Exception):
+    """Raised for unknown profiles or field names"""
+
+class ResponseShape:
+    def __init__(self, profile: Optional[str] = None, fields: Optional[str] = None):
+        """
+        Which top-level fields of an analysis body a client asked for
+
+        Args:
+            profile: Name from PROFILES; 'full' when omitted
+            fields: Comma-separated field names; overrides the profile. The
+                analysis ID, filename and any error are always returned
+
+        Raises:
+            ResponseShapeError: If the profile or a field name is unknown
+        """
+        if profile is not None and profile not in PROFILES:
+            raise ResponseShapeError(f"Unknown profile '{profile}', expected one of {', '.join(PROFILES)}")
+        self.keep = PROFILES[profile or 'full']
+        if fields:
+            names = [name.strip() for name in fields.split(',') if name.strip()]
+            unknown = [name for name in names if name not in RESPONSE_FIELDS]
+            if unknown:
+                raise ResponseShapeError(f"Unknown fields: {', '.join(unknown)}")
+            self.keep = tuple(dict.fromkeys(IDENTITY_FIELDS + tuple(names) + ('error',)))
+
+    def apply(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the body restricted to the requested fields"""
+        if self.keep is None:
+            return body
+        return {key: body[key] for key in self.keep if key in body}
+
+FULL_SHAPE = ResponseShape()
+
+def encode_json(content: Any) -> bytes:
+    """
+    Encode JSON like JSONResponse does, with orjson when it is installed
+
+    orjson is several times faster on the nested analysis bodies; content
+    it cannot encode falls back to the standard library.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(content)
+        except TypeError:
+            pass
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(',', ':')).encode('utf-8')
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered through encode_json"""
+
+    def render(self, content: Any) -> bytes:
+        return encode_json(content)
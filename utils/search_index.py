@@ -0,0 +1,271 @@
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+SKILL = 'skill'
+CERTIFICATION = 'certification'
+
+QUERY_TOKEN_PATTERN = re.compile(r'\s*(?:(\()|(\))|"([^"]*)"|([^\s()"]+))')
+
+class QuerySyntaxError(Exception):
+    """Raised for malformed search queries"""
+
+if hasattr(int, 'bit_count'):
+    bit_count = int.bit_count
+else:
+    def bit_count(bitset: int) -> int:
+        """Number of set bits (int.bit_count needs Python 3.10, the Lambda template declares 3.9)"""
+        return bin(bitset).count('1')
+
+def normalize_term(name: str) -> str:
+    """Normalize a skill or certification name the way the index stores it"""
+    return ' '.join(name.lower().split())
+
+class CandidateIndex:
+    def __init__(self):
+        """
+        Inverted index from skill and certification names to analyzed documents
+
+        Each posting list is a bitset with one bit per document. Bitsets are
+        kept in mutable bytearrays so indexing a document only flips bits,
+        and are turned into Python ints at query time so AND/OR run as single
+        big-integer operations. Documents can be added (or re-added) one at a
+        time as they are analyzed.
+        """
+        self._doc_ids: List[Optional[str]] = []
+        self._doc_numbers: Dict[str, int] = {}
+        self._doc_terms: Dict[int, Tuple[Tuple[str, str], ...]] = {}
+        # One shared key object per term keeps per-document memory small
+        self._term_keys: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        self._postings: Dict[Tuple[str, str], bytearray] = {}
+        self._posting_counts: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._doc_numbers)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._doc_numbers
+
+    def add(self, doc_id: str, skills: Iterable[str] = (), certifications: Iterable[str] = ()):
+        """
+        Index a document, replacing its earlier entry if it was indexed before
+
+        Args:
+            doc_id: Analysis ID of the document
+            skills: Skill names found in the document
+            certifications: Certification names found in the document
+        """
+        terms = dict.fromkeys(
+            [(SKILL, normalize_term(skill)) for skill in skills]
+            + [(CERTIFICATION, normalize_term(certification)) for certification in certifications]
+        )
+        with self._lock:
+            terms = tuple(self._term_keys.setdefault(term, term) for term in terms)
+            number = self._doc_numbers.get(doc_id)
+            if number is None:
+                number = len(self._doc_ids)
+                self._doc_ids.append(doc_id)
+                self._doc_numbers[doc_id] = number
+            else:
+                self._clear_terms(number)
+            byte_index, bit = divmod(number, 8)
+            for term in terms:
+                posting = self._postings.get(term)
+                if posting is None:
+                    posting = self._postings[term] = bytearray()
+                    self._posting_counts[term] = 0
+                if len(posting) <= byte_index:
+                    posting.extend(bytes(byte_index + 1 - len(posting)))
+                posting[byte_index] |= 1 << bit
+                self._posting_counts[term] += 1
+            self._doc_terms[number] = terms
+
+    def remove(self, doc_id: str):
+        """Drop a document from the index"""
+        with self._lock:
+            number = self._doc_numbers.pop(doc_id, None)
+            if number is None:
+                return
+            self._clear_terms(number)
+            del self._doc_terms[number]
+            self._doc_ids[number] = None
+
+    def _clear_terms(self, number: int):
+        byte_index, bit = divmod(number, 8)
+        for term in self._doc_terms.get(number, ()):
+            self._posting_counts[term] -= 1
+            if self._posting_counts[term]:
+                self._postings[term][byte_index] &= ~(1 << bit) & 0xFF
+            else:
+                del self._postings[term]
+                del self._posting_counts[term]
+
+    def document_terms(self, doc_id: str) -> Tuple[Tuple[str, str], ...]:
+        """Return the (kind, name) terms indexed for a document"""
+        number = self._doc_numbers.get(doc_id)
+        return self._doc_terms.get(number, ()) if number is not None else ()
+
+    def snapshot_postings(self, terms: Iterable[Tuple[str, str]]) -> Tuple[int, Dict[Tuple[str, str], bytes], List[Optional[str]]]:
+        """
+        Copy the posting bitsets of some terms for scoring outside the lock
+
+        Args:
+            terms: (kind, name) terms
+
+        Returns:
+            (document slot count, {term: little-endian bitset bytes}, slot -> analysis ID)
+        """
+        with self._lock:
+            postings = {}
+            for kind, name in terms:
+                term = (kind, normalize_term(name))
+                if term in self._postings:
+                    postings[term] = bytes(self._postings[term])
+            # Slots are only ever appended or blanked, so the list can be shared
+            return len(self._doc_ids), postings, self._doc_ids
+
+    def term_bitset(self, name: str, kind: Optional[str] = None) -> int:
+        """
+        Return the documents mentioning a name as a bitset
+
+        Args:
+            name: Skill or certification name
+            kind: SKILL or CERTIFICATION to restrict the lookup, or None for both
+        """
+        name = normalize_term(name)
+        kinds = (kind,) if kind is not None else (SKILL, CERTIFICATION)
+        bitset = 0
+        for term_kind in kinds:
+            posting = self._postings.get((term_kind, name))
+            if posting is not None:
+                bitset |= int.from_bytes(posting, 'little')
+        return bitset
+
+    def search(self, query: str, limit: int = 100, offset: int = 0) -> Dict[str, object]:
+        """
+        Run a boolean query
+
+        Terms are skill or certification names; multi-word names can be
+        quoted or written out. AND binds tighter than OR, and parentheses
+        group, e.g. `kubernetes AND "aws certified solutions architect"
+        AND (postgresql OR mysql)`. Terms may be prefixed with skill: or
+        certification: to restrict their kind.
+
+        Args:
+            query: Boolean query
+            limit: Maximum number of document IDs returned
+            offset: Number of matching documents skipped, for paging
+
+        Returns:
+            Dictionary with 'total' and 'analysis_ids' (in indexing order)
+
+        Raises:
+            QuerySyntaxError: If the query cannot be parsed
+        """
+        with self._lock:
+            bitset = _QueryParser(query, self.term_bitset).parse()
+            total = bit_count(bitset)
+            # Past the last match there is nothing to walk
+            offset = min(max(offset, 0), total)
+            return {
+                'total': total,
+                'analysis_ids': self._doc_ids_from_bitset(bitset, limit, offset) if offset < total else []
+            }
+
+    def _doc_ids_from_bitset(self, bitset: int, limit: int, offset: int) -> List[str]:
+        doc_ids = []
+        skipped = 0
+        while bitset and len(doc_ids) < limit:
+            # Walk the lowest set bit one at a time, only as far as needed
+            lowest = bitset & -bitset
+            bitset ^= lowest
+            if skipped < offset:
+                skipped += 1
+                continue
+            doc_ids.append(self._doc_ids[lowest.bit_length() - 1])
+        return doc_ids
+
+    def stats(self) -> Dict[str, int]:
+        """Return document, term and approximate posting memory counts"""
+        with self._lock:
+            return {
+                'documents': len(self._doc_numbers),
+                'terms': len(self._postings),
+                'posting_bytes': sum(len(posting) for posting in self._postings.values())
+            }
+
+class _QueryParser:
+    """Recursive-descent parser that evaluates a query straight to a bitset"""
+
+    def __init__(self, query: str, lookup):
+        self.tokens = self._tokenize(query)
+        self.position = 0
+        self.lookup = lookup
+
+    @staticmethod
+    def _tokenize(query: str) -> List[Tuple[str, str]]:
+        tokens = []
+        for match in QUERY_TOKEN_PATTERN.finditer(query.strip()):
+            open_paren, close_paren, quoted, word = match.groups()
+            if open_paren:
+                tokens.append(('(', open_paren))
+            elif close_paren:
+                tokens.append((')', close_paren))
+            elif quoted is not None:
+                tokens.append(('term', quoted))
+            elif word.upper() in ('AND', 'OR'):
+                tokens.append((word.upper(), word))
+            else:
+                # Words without operators between them form one multi-word name
+                if tokens and tokens[-1][0] == 'word':
+                    tokens[-1] = ('word', f"{tokens[-1][1]} {word}")
+                else:
+                    tokens.append(('word', word))
+        return [('term', value) if kind == 'word' else (kind, value) for kind, value in tokens]
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.position][0] if self.position < len(self.tokens) else None
+
+    def parse(self) -> int:
+        if not self.tokens:
+            raise QuerySyntaxError("Query is empty")
+        result = self._or()
+        if self.position != len(self.tokens):
+            raise QuerySyntaxError(f"Unexpected '{self.tokens[self.position][1]}'")
+        return result
+
+    def _or(self) -> int:
+        result = self._and()
+        while self._peek() == 'OR':
+            self.position += 1
+            result |= self._and()
+        return result
+
+    def _and(self) -> int:
+        result = self._operand()
+        while self._peek() == 'AND':
+            self.position += 1
+            operand = self._operand()
+            result &= operand
+        return result
+
+    def _operand(self) -> int:
+        kind = self._peek()
+        if kind == '(':
+            self.position += 1
+            result = self._or()
+            if self._peek() != ')':
+                raise QuerySyntaxError("Missing ')'")
+            self.position += 1
+            return result
+        if kind == 'term':
+            value = self.tokens[self.position][1]
+            self.position += 1
+            prefix, _, name = value.partition(':')
+            if name and prefix.lower() in (SKILL, CERTIFICATION):
+                return self.lookup(name, prefix.lower())
+            return self.lookup(value)
+        if kind is None:
+            raise QuerySyntaxError("Query ends unexpectedly")
+        raise QuerySyntaxError(f"Unexpected '{self.tokens[self.position][1]}'")
@@ -1,58 +1,42 @@
 import re
-from typing import List, Dict, Set
+from typing import List, Dict, Optional, Set, Union
 from collections import Counter
+from utils.keyword_matcher import KeywordMatcher
+from utils.parser import ParsedDocument, SectionHeaderScanner
+from utils.taxonomy import Taxonomy
 
 class SkillExtractor:
-    def __init__(self):
-        # Comprehensive skill databases
-        self.programming_languages = {
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'c', 'go', 'rust', 'kotlin',
-            'swift', 'php', 'ruby', 'scala', 'r', 'matlab', 'perl', 'haskell', 'clojure', 'erlang',
-            'dart', 'lua', 'bash', 'powershell', 'sql', 'html', 'css', 'xml', 'json', 'yaml'
-        }
+    def __init__(self, taxonomy: Optional[Taxonomy] = None):
+        """
+        Extracts and categorizes skills in resume text
+
+        Args:
+            taxonomy: Skill taxonomy; read from the taxonomy file when omitted
+        """
+        taxonomy = taxonomy or Taxonomy.from_file()
+        self.taxonomy_version = taxonomy.version
         
-        self.frameworks_libraries = {
-            'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask', 'fastapi', 'spring',
-            'laravel', 'rails', 'asp.net', 'jquery', 'bootstrap', 'tailwind', 'sass', 'less',
-            'webpack', 'babel', 'gulp', 'grunt', 'npm', 'yarn', 'pip', 'maven', 'gradle',
-            'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'pandas', 'numpy', 'matplotlib',
-            'seaborn', 'plotly', 'd3.js', 'chart.js', 'lodash', 'moment.js', 'axios'
+        # Skill databases by category, in categorization order
+        self.skill_sets = {
+            category: {skill.lower() for skill in skills}
+            for category, skills in taxonomy.skill_categories.items()
         }
         
-        self.databases = {
-            'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch', 'cassandra', 'dynamodb',
-            'sqlite', 'oracle', 'sql server', 'mariadb', 'neo4j', 'influxdb', 'couchdb',
-            'firebase', 'supabase', 'planetscale', 'cockroachdb'
-        }
+        # Combine all skills for comprehensive matching
+        self.all_skills = set().union(*self.skill_sets.values())
         
-        self.cloud_platforms = {
-            'aws', 'azure', 'gcp', 'google cloud', 'heroku', 'vercel', 'netlify', 'digital ocean',
-            'linode', 'vultr', 'cloudflare', 'amazon web services', 'microsoft azure'
-        }
+        # Skill -> category lookup, first matching category wins
+        self.skill_category_order = list(dict.fromkeys([*self.skill_sets, 'other']))
+        self.skill_categories = {}
+        for category, skills in self.skill_sets.items():
+            for skill in skills:
+                self.skill_categories.setdefault(skill, category)
         
-        self.tools_technologies = {
-            'docker', 'kubernetes', 'jenkins', 'git', 'github', 'gitlab', 'bitbucket', 'jira',
-            'confluence', 'slack', 'trello', 'asana', 'figma', 'sketch', 'adobe', 'photoshop',
-            'illustrator', 'vscode', 'intellij', 'eclipse', 'vim', 'emacs', 'postman', 'insomnia',
-            'swagger', 'openapi', 'graphql', 'rest', 'api', 'microservices', 'ci/cd', 'devops',
-            'agile', 'scrum', 'kanban', 'tdd', 'bdd', 'unit testing', 'integration testing'
-        }
+        # Category priority used when picking top skills
+        self.skill_priority = list(taxonomy.skill_priority)
         
-        self.soft_skills = {
-            'leadership', 'communication', 'teamwork', 'problem solving', 'critical thinking',
-            'time management', 'project management', 'mentoring', 'collaboration', 'adaptability',
-            'creativity', 'analytical', 'detail oriented', 'self motivated', 'multitasking'
-        }
-        
-        # Combine all skills for comprehensive matching
-        self.all_skills = (
-            self.programming_languages | 
-            self.frameworks_libraries | 
-            self.databases | 
-            self.cloud_platforms | 
-            self.tools_technologies | 
-            self.soft_skills
-        )
+        # Single-pass matcher over the whole taxonomy
+        self.skill_matcher = KeywordMatcher(self.all_skills)
         
         # Common skill section headers
         self.skill_headers = [
@@ -60,21 +44,27 @@ class SkillExtractor:
             'programming languages', 'frameworks', 'technologies used', 'expertise',
             'technical expertise', 'key skills', 'competencies', 'proficiencies'
         ]
+        
+        # Precompiled patterns, built once per extractor
+        self.section_scanner = SectionHeaderScanner(self.skill_headers)
+        self.experience_pattern = re.compile(r'(\d+)\+?\s*years?\s*(?:of\s*)?experience\s*(?:with|in)\s*([^,\n]+)')
+        self.proficient_pattern = re.compile(r'proficient\s*(?:in|with)\s*([^.\n]+)')
+        self.punctuation_pattern = re.compile(r'[^\w\s]')
 
-    def extract_skills_from_text(self, text: str) -> Dict[str, List[str]]:
+    def extract_skills_from_text(self, text: Union[str, ParsedDocument]) -> Dict[str, List[str]]:
         """
-        Extract skills from resume text using multiple methods
+        Extract skills from resume text (or an already parsed document) using multiple methods
         """
-        text_lower = text.lower()
+        document = ParsedDocument.from_text(text)
         
         # Method 1: Direct keyword matching
-        direct_matches = self._extract_direct_matches(text_lower)
+        direct_matches = self._extract_direct_matches(document.text_lower)
         
         # Method 2: Context-aware extraction (look for skill sections)
-        context_matches = self._extract_from_context(text)
+        context_matches = self._extract_from_context(document)
         
         # Method 3: Pattern-based extraction
-        pattern_matches = self._extract_with_patterns(text)
+        pattern_matches = self._extract_with_patterns(document)
         
         # Combine and deduplicate results
         all_found_skills = set()
@@ -89,36 +79,17 @@ class SkillExtractor:
 
     def _extract_direct_matches(self, text_lower: str) -> Set[str]:
         """Extract skills using direct keyword matching"""
-        found_skills = set()
-        
-        for skill in self.all_skills:
-            # Handle multi-word skills
-            if ' ' in skill:
-                if skill in text_lower:
-                    found_skills.add(skill.title())
-            else:
-                # Use word boundaries for single words to avoid partial matches
-                pattern = r'\b' + re.escape(skill) + r'\b'
-                if re.search(pattern, text_lower):
-                    found_skills.add(skill.title())
-        
-        return found_skills
+        return {skill.title() for skill in self.skill_matcher.find_all(text_lower)}
 
-    def _extract_from_context(self, text: str) -> Set[str]:
+    def _extract_from_context(self, document: ParsedDocument) -> Set[str]:
         """Extract skills from dedicated skill sections"""
         found_skills = set()
-        text_lower = text.lower()
         
         # Look for skill section headers
-        for header in self.skill_headers:
-            pattern = rf'{re.escape(header)}[:\s]*([^\n]*(?:\n[^\n]*)*?)(?:\n\n|\n[A-Z]|\n\d|$)'
-            matches = re.finditer(pattern, text_lower, re.IGNORECASE | re.MULTILINE)
-            
-            for match in matches:
-                skill_section = match.group(1)
-                # Extract skills from this section
-                section_skills = self._extract_skills_from_section(skill_section)
-                found_skills.update(section_skills)
+        for skill_section in document.section_texts(self.section_scanner):
+            # Extract skills from this section
+            section_skills = self._extract_skills_from_section(skill_section)
+            found_skills.update(section_skills)
         
         return found_skills
 
@@ -132,28 +103,27 @@ class SkillExtractor:
             if sep in section_text:
                 items = [item.strip() for item in section_text.split(sep)]
                 for item in items:
-                    item_clean = re.sub(r'[^\w\s]', '', item.lower()).strip()
+                    item_clean = self.punctuation_pattern.sub('', item.lower()).strip()
                     if item_clean in self.all_skills:
                         found_skills.add(item_clean.title())
         
         return found_skills
 
-    def _extract_with_patterns(self, text: str) -> Set[str]:
+    def _extract_with_patterns(self, document: ParsedDocument) -> Set[str]:
         """Extract skills using regex patterns"""
         found_skills = set()
+        text_lower = document.text_lower
         
         # Pattern for "X years of experience with Y"
-        experience_pattern = r'(\d+)\+?\s*years?\s*(?:of\s*)?experience\s*(?:with|in)\s*([^,\n]+)'
-        matches = re.finditer(experience_pattern, text.lower())
+        matches = self.experience_pattern.finditer(text_lower)
         for match in matches:
             skill_phrase = match.group(2).strip()
-            skill_clean = re.sub(r'[^\w\s]', '', skill_phrase).strip()
+            skill_clean = self.punctuation_pattern.sub('', skill_phrase).strip()
             if skill_clean in self.all_skills:
                 found_skills.add(skill_clean.title())
         
         # Pattern for "Proficient in X, Y, Z"
-        proficient_pattern = r'proficient\s*(?:in|with)\s*([^.\n]+)'
-        matches = re.finditer(proficient_pattern, text.lower())
+        matches = self.proficient_pattern.finditer(text_lower)
         for match in matches:
             skills_text = match.group(1)
             skills = self._extract_skills_from_section(skills_text)
@@ -163,41 +133,11 @@ class SkillExtractor:
 
     def _categorize_skills(self, skills: List[str]) -> Dict[str, List[str]]:
         """Categorize skills into different types"""
-        categorized = {
-            'programming_languages': [],
-            'frameworks_libraries': [],
-            'databases': [],
-            'cloud_platforms': [],
-            'tools_technologies': [],
-            'soft_skills': [],
-            'other': []
-        }
+        categorized = {category: [] for category in self.skill_category_order}
         
         for skill in skills:
-            skill_lower = skill.lower()
-            categorized_flag = False
-            
-            if skill_lower in self.programming_languages:
-                categorized['programming_languages'].append(skill)
-                categorized_flag = True
-            elif skill_lower in self.frameworks_libraries:
-                categorized['frameworks_libraries'].append(skill)
-                categorized_flag = True
-            elif skill_lower in self.databases:
-                categorized['databases'].append(skill)
-                categorized_flag = True
-            elif skill_lower in self.cloud_platforms:
-                categorized['cloud_platforms'].append(skill)
-                categorized_flag = True
-            elif skill_lower in self.tools_technologies:
-                categorized['tools_technologies'].append(skill)
-                categorized_flag = True
-            elif skill_lower in self.soft_skills:
-                categorized['soft_skills'].append(skill)
-                categorized_flag = True
-            
-            if not categorized_flag:
-                categorized['other'].append(skill)
+            category = self.skill_categories.get(skill.lower(), 'other')
+            categorized[category].append(skill)
         
         # Remove empty categories
         return {k: v for k, v in categorized.items() if v}
@@ -215,18 +155,8 @@ class SkillExtractor:
 
     def _get_top_skills(self, categorized_skills: Dict[str, List[str]], limit: int = 10) -> List[str]:
         """Get the most important skills based on category priority"""
-        priority_order = [
-            'programming_languages',
-            'frameworks_libraries', 
-            'cloud_platforms',
-            'databases',
-            'tools_technologies',
-            'soft_skills',
-            'other'
-        ]
-        
         top_skills = []
-        for category in priority_order:
+        for category in self.skill_priority:
             if category in categorized_skills:
                 top_skills.extend(categorized_skills[category][:3])  # Take top 3 from each category
                 if len(top_skills) >= limit:
@@ -0,0 +1,56 @@
+import os
+import json
+import hashlib
+from typing import Any, Dict, List, Optional
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'taxonomy.json')
+
+def taxonomy_path() -> str:
+    """Return the taxonomy file in use (TAXONOMY_PATH, or the bundled data/taxonomy.json)"""
+    return os.getenv('TAXONOMY_PATH', DEFAULT_TAXONOMY_PATH)
+
+class Taxonomy:
+    def __init__(self, data: Dict[str, Any], digest: str = ''):
+        """
+        Skill and certification taxonomy read from a versioned data file
+
+        Args:
+            data: Parsed taxonomy file
+            digest: SHA-256 of the file contents, identifying this exact revision
+
+        Raises:
+            ValueError: If a required section is missing
+        """
+        try:
+            self.version = str(data['version'])
+            skills = data['skills']
+            certifications = data['certifications']
+            self.skill_categories: Dict[str, List[str]] = skills['categories']
+            self.skill_priority: List[str] = skills['priority']
+            self.certification_catalog: Dict[str, List[str]] = certifications['catalog']
+            self.certification_categories: Dict[str, str] = certifications['categories']
+            self.certification_priority: List[str] = certifications['priority']
+            self.certification_abbreviations: Dict[str, str] = certifications.get('abbreviations', {})
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid taxonomy file, missing {e}")
+        unknown_groups = set(self.certification_categories) - set(self.certification_catalog)
+        if unknown_groups:
+            raise ValueError(f"Invalid taxonomy file, unknown certification groups: {sorted(unknown_groups)}")
+        self.digest = digest
+
+    @classmethod
+    def from_file(cls, path: Optional[str] = None) -> 'Taxonomy':
+        """
+        Read a taxonomy file
+
+        Args:
+            path: JSON taxonomy file; defaults to taxonomy_path()
+        """
+        with open(path or taxonomy_path(), 'rb') as f:
+            raw = f.read()
+        return cls(json.loads(raw), digest=hashlib.sha256(raw).hexdigest())
+
+def file_digest(path: Optional[str] = None) -> str:
+    """SHA-256 of a taxonomy file, to tell whether a compiled snapshot is still current"""
+    with open(path or taxonomy_path(), 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
@@ -1,24 +1,272 @@
-import boto3
+import io
 import os
-from typing import Optional, Dict, Any
-from botocore.exceptions import ClientError, NoCredentialsError
+import json
+import time
+import sqlite3
+import hashlib
+import random
+import threading
+import re
+import uuid
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
+from botocore.exceptions import ClientError, ConnectionError as BotocoreConnectionError, HTTPClientError, NoCredentialsError
 import logging
 from dotenv import load_dotenv
+from utils.extraction_backends import ExtractionBackend, PdfTextLayerBackend
+from utils.metrics import OCR_CACHE_LOOKUPS, TEXTRACT_ERRORS, TEXTRACT_THROTTLE_RETRIES
+from utils.rate_limiter import TokenBucket
 
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
-class TextractService:
-    def __init__(self):
+# Synchronous detect_document_text only accepts single-page PDFs up to 10MB
+SYNC_MAX_BYTES = 10 * 1024 * 1024
+
+# Error codes Textract uses when a request exceeds the account's rate quota
+THROTTLING_ERROR_CODES = ('ThrottlingException', 'ProvisionedThroughputExceededException', 'LimitExceededException')
+
+# Error codes for server-side failures that usually succeed when retried
+TRANSIENT_ERROR_CODES = ('InternalServerError', 'InternalFailure', 'ServiceUnavailable',
+                         'ServiceUnavailableException', 'RequestTimeout', 'RequestTimeoutException')
+
+# Connection failures, resets and timeouts raised before Textract answers
+TRANSIENT_EXCEPTIONS = (BotocoreConnectionError, HTTPClientError)
+
+PDF_PAGE_PATTERN = re.compile(rb'/Type\s*/Page(?![a-zA-Z])')
+PDF_PAGE_COUNT_PATTERN = re.compile(rb'/Type\s*/Pages\b[^>]*?/Count\s+(\d+)')
+
+def pdf_page_count(document_bytes: bytes) -> int:
+    """
+    Count the pages of a PDF
+    
+    Pages are counted with pypdf, which also reads page objects held in
+    compressed object streams (PDF 1.5+). Without pypdf, or for PDFs it
+    cannot open, the count is estimated from the raw bytes.
+    
+    Args:
+        document_bytes: Document content as bytes
+        
+    Returns:
+        Page count, 0 if the document is not a PDF
+    """
+    if not document_bytes.startswith(b'%PDF'):
+        return 0
+    try:
+        from pypdf import PdfReader
+        return len(PdfReader(io.BytesIO(document_bytes)).pages) or 1
+    except Exception:
+        pass
+    page_objects = len(PDF_PAGE_PATTERN.findall(document_bytes))
+    page_tree_counts = [int(count) for count in PDF_PAGE_COUNT_PATTERN.findall(document_bytes)]
+    return max([page_objects] + page_tree_counts) or 1
+
+class OCRResultCache:
+    def __init__(self, max_entries: int = 256, max_bytes: int = 64 * 1024 * 1024,
+                 ttl_seconds: float = 86400, db_path: Optional[str] = None, max_db_rows: int = 10000):
+        """
+        Content-addressed cache for parsed Textract results
+        
+        Args:
+            max_entries: Maximum number of results held in memory
+            max_bytes: Maximum approximate size of results held in memory
+            ttl_seconds: Time after which a cached result is considered stale
+            db_path: Optional SQLite file used to persist results across restarts
+            max_db_rows: Maximum number of results kept in the SQLite file
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path
+        self.max_db_rows = max_db_rows
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+        self._db = None
+        
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS ocr_results ('
+                'document_hash TEXT PRIMARY KEY, created_at REAL NOT NULL, payload TEXT NOT NULL)'
+            )
+            self._db.execute('CREATE INDEX IF NOT EXISTS ocr_results_created_at ON ocr_results (created_at)')
+            self._db.commit()
+    
+    @staticmethod
+    def hash_document(document_bytes: bytes) -> str:
+        """Return the cache key for a document"""
+        return hashlib.sha256(document_bytes).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for a key, or None if missing or expired"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                created_at, size, result = entry
+                if now - created_at <= self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return result
+                self._remove(key)
+            
+            if self._db is not None:
+                row = self._db.execute(
+                    'SELECT created_at, payload FROM ocr_results WHERE document_hash = ?', (key,)
+                ).fetchone()
+                if row is not None:
+                    created_at, payload = row
+                    if now - created_at <= self.ttl_seconds:
+                        result = json.loads(payload)
+                        self._store(key, created_at, result, len(payload))
+                        self.hits += 1
+                        return result
+                    self._db.execute('DELETE FROM ocr_results WHERE document_hash = ?', (key,))
+                    self._db.commit()
+            
+            self.misses += 1
+            return None
+    
+    def set(self, key: str, result: Dict[str, Any]):
+        """Store a parsed result under a key"""
+        created_at = time.time()
+        payload = json.dumps(result)
+        with self._lock:
+            self._store(key, created_at, result, len(payload))
+            if self._db is not None:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO ocr_results (document_hash, created_at, payload) VALUES (?, ?, ?)',
+                    (key, created_at, payload)
+                )
+                self._prune_db(created_at)
+                self._db.commit()
+    
+    def clear(self):
+        """Remove all cached results"""
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+            if self._db is not None:
+                self._db.execute('DELETE FROM ocr_results')
+                self._db.commit()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'entries': len(self._entries),
+                'bytes': self._current_bytes,
+                'persistent': self._db is not None
+            }
+    
+    def _prune_db(self, now: float):
+        # Writes follow a Textract call, so pruning here costs little in comparison
+        self._db.execute('DELETE FROM ocr_results WHERE created_at < ?', (now - self.ttl_seconds,))
+        excess = self._db.execute('SELECT COUNT(*) FROM ocr_results').fetchone()[0] - self.max_db_rows
+        if excess > 0:
+            self._db.execute(
+                'DELETE FROM ocr_results WHERE document_hash IN '
+                '(SELECT document_hash FROM ocr_results ORDER BY created_at LIMIT ?)', (excess,)
+            )
+    
+    def _store(self, key: str, created_at: float, result: Dict[str, Any], size: int):
+        if key in self._entries:
+            self._remove(key)
+        # Results larger than the whole budget are only kept on disk
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (created_at, size, result)
+        self._current_bytes += size
+        while len(self._entries) > self.max_entries or self._current_bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+    
+    def _remove(self, key: str):
+        _, size, _ = self._entries.pop(key)
+        self._current_bytes -= size
+
+class TextractService(ExtractionBackend):
+    name = 'textract'
+    
+    def __init__(self, textract_client=None, s3_client=None):
         """
         Initialize AWS Textract service with proper credential handling
+        
+        Args:
+            textract_client: Optional pre-built Textract client (e.g. a local stand-in)
+            s3_client: Optional pre-built S3 client used by the asynchronous path
         """
         # Try to get region from environment, fallback to ap-southeast-2
         self.region = os.getenv('AWS_DEFAULT_REGION', 'ap-southeast-2')
-        self.textract_client = None
-        self._initialize_client()
+        self.textract_client = textract_client
+        self.s3_client = s3_client
+        
+        # Large and multi-page documents go through S3 and the job-based API
+        self.s3_bucket = os.getenv('TEXTRACT_S3_BUCKET') or None
+        self.s3_prefix = os.getenv('TEXTRACT_S3_PREFIX', 'textract-uploads/')
+        self.sync_max_bytes = int(os.getenv('TEXTRACT_SYNC_MAX_BYTES', str(SYNC_MAX_BYTES)))
+        self.poll_interval = float(os.getenv('TEXTRACT_POLL_INTERVAL_SECONDS', '1'))
+        self.job_timeout = float(os.getenv('TEXTRACT_JOB_TIMEOUT_SECONDS', '300'))
+        
+        self.cache = OCRResultCache(
+            max_entries=int(os.getenv('TEXTRACT_CACHE_MAX_ENTRIES', '256')),
+            max_bytes=int(os.getenv('TEXTRACT_CACHE_MAX_BYTES', str(64 * 1024 * 1024))),
+            ttl_seconds=float(os.getenv('TEXTRACT_CACHE_TTL_SECONDS', '86400')),
+            db_path=os.getenv('TEXTRACT_CACHE_PATH') or None,
+            max_db_rows=int(os.getenv('TEXTRACT_CACHE_MAX_ROWS', '10000'))
+        )
+        # Connection pool sized to the threads that call Textract at once
+        self.max_pool_connections = int(os.getenv(
+            'TEXTRACT_MAX_POOL_CONNECTIONS', os.getenv('ANALYZE_MAX_WORKERS', '8')
+        ))
+        # Throttling is retried once, by _call_textract, which also feeds the
+        # rate limiters; botocore's own retries would multiply its attempts
+        self.retry_mode = os.getenv('TEXTRACT_RETRY_MODE', 'standard')
+        self.max_attempts = int(os.getenv('TEXTRACT_MAX_ATTEMPTS', '1'))
+        self.connect_timeout = float(os.getenv('TEXTRACT_CONNECT_TIMEOUT_SECONDS', '5'))
+        self.read_timeout = float(os.getenv('TEXTRACT_READ_TIMEOUT_SECONDS', '60'))
+        
+        # Optional client-side rate limits (calls per second, 0 disables) per
+        # Textract operation. Quotas differ per account and region, so there is
+        # no safe default; set them just below the account's quotas (see
+        # LAMBDA_DEPLOYMENT_GUIDE.md)
+        self.rate_limiters = {}
+        for operation, variable in (
+            ('detect_document_text', 'TEXTRACT_DETECT_MAX_TPS'),
+            ('start_document_text_detection', 'TEXTRACT_START_MAX_TPS'),
+            ('get_document_text_detection', 'TEXTRACT_GET_MAX_TPS'),
+        ):
+            rate = float(os.getenv(variable, '0'))
+            if rate > 0:
+                self.rate_limiters[operation] = TokenBucket(rate)
+        # Throttled and transient failures are retried with backoff before
+        # failing the request. This is the only retry layer (botocore makes one attempt)
+        self.throttle_retries = int(os.getenv('TEXTRACT_THROTTLE_RETRIES', '3'))
+        self.throttle_backoff = float(os.getenv('TEXTRACT_THROTTLE_BACKOFF_SECONDS', '0.5'))
+        self.throttle_max_backoff = float(os.getenv('TEXTRACT_THROTTLE_MAX_BACKOFF_SECONDS', '8'))
+        
+        # Clients are created on first use so importing the app (and a Lambda
+        # cold start) does not pay for boto3 or any AWS round-trip
+        self._client_lock = threading.Lock()
+    
+    def _get_textract_client(self):
+        if self.textract_client is None:
+            with self._client_lock:
+                if self.textract_client is None:
+                    self._initialize_client()
+        return self.textract_client
     
     def _initialize_client(self):
         """
@@ -26,13 +274,7 @@ class TextractService:
         """
         try:
             # Try to create client with credentials from environment
-            self.textract_client = boto3.client(
-                'textract',
-                region_name=self.region
-            )
-            
-            # Test the connection
-            self._test_connection()
+            self.textract_client = self._create_client('textract')
             logger.info(f"Textract client initialized successfully in region: {self.region}")
             
         except NoCredentialsError:
@@ -45,20 +287,61 @@ class TextractService:
             logger.error(f"Failed to initialize Textract client: {e}")
             raise Exception(f"Failed to initialize AWS Textract: {e}")
     
-    def _test_connection(self):
+    def _create_client(self, service_name: str):
+        # boto3 takes a few hundred milliseconds to import, so defer it until a
+        # client is actually needed
+        import boto3
+        from botocore.config import Config
+        config = Config(
+            max_pool_connections=self.max_pool_connections,
+            # total_max_attempts counts the first call too (max_attempts would only count retries)
+            retries={'mode': self.retry_mode, 'total_max_attempts': self.max_attempts},
+            connect_timeout=self.connect_timeout,
+            read_timeout=self.read_timeout
+        )
+        return boto3.client(service_name, region_name=self.region, config=config)
+    
+    def _call_textract(self, operation: str, **kwargs) -> Dict[str, Any]:
         """
-        Test the connection to AWS Textract
+        Call a Textract operation within its rate limit, retrying throttled
+        calls, server errors and dropped connections
+        
+        Args:
+            operation: Name of the client method, e.g. 'detect_document_text'
+            **kwargs: Arguments for the call
+            
+        Returns:
+            Textract API response
         """
-        try:
-            # Make a simple call to test credentials
-            sts_client = boto3.client('sts', region_name=self.region)
-            sts_client.get_caller_identity()
-        except ClientError as e:
-            error_code = e.response.get('Error', {}).get('Code', '')
-            if error_code in ('AccessDenied', 'AccessDeniedException'):
-                logger.warning("AWS credentials are valid but may not have required permissions")
+        client = self._get_textract_client()
+        limiter = self.rate_limiters.get(operation)
+        for attempt in range(self.throttle_retries + 1):
+            if limiter:
+                limiter.acquire()
+            try:
+                response = getattr(client, operation)(**kwargs)
+            except ClientError as e:
+                error_code = e.response.get('Error', {}).get('Code', '')
+                throttled = error_code in THROTTLING_ERROR_CODES
+                if not (throttled or error_code in TRANSIENT_ERROR_CODES) or attempt == self.throttle_retries:
+                    raise
+                if throttled:
+                    if limiter:
+                        limiter.throttled()
+                    TEXTRACT_THROTTLE_RETRIES.inc(operation=operation)
+                else:
+                    logger.warning(f"Retrying {operation} after {error_code}")
+            except TRANSIENT_EXCEPTIONS as e:
+                if attempt == self.throttle_retries:
+                    raise
+                logger.warning(f"Retrying {operation} after connection error: {e}")
             else:
-                logger.warning(f"AWS connection test failed: {error_code}")
+                if limiter:
+                    limiter.succeeded()
+                return response
+            # Exponential backoff with jitter so queued callers spread out
+            delay = min(self.throttle_max_backoff, self.throttle_backoff * 2 ** attempt)
+            time.sleep(delay * random.uniform(0.5, 1.0))
     
     def extract_text_from_document(self, document_bytes: bytes) -> str:
         """
@@ -73,11 +356,44 @@ class TextractService:
         Raises:
             Exception: If text extraction fails
         """
+        return self.analyze_document(document_bytes)['text']
+    
+    def analyze_document(self, document_bytes: bytes, use_cache: bool = True,
+                         page_count: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Extract text and document information with a single Textract call
+        
+        Args:
+            document_bytes: Document content as bytes
+            use_cache: Whether to look up and store the result in the OCR cache;
+                when False the result is neither read from nor written to it
+            page_count: Pages in the document, when the caller has already parsed it
+            
+        Returns:
+            Dictionary with 'text' and 'document_info' keys
+            
+        Raises:
+            Exception: If text extraction fails
+        """
+        cache_key = self.cache.hash_document(document_bytes)
+        if use_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                OCR_CACHE_LOOKUPS.inc(result='hit')
+                logger.info(f"OCR cache hit for document {cache_key[:12]}")
+                return cached
+            OCR_CACHE_LOOKUPS.inc(result='miss')
+        
         try:
-            # Use detect_document_text for synchronous processing
-            response = self.textract_client.detect_document_text(
-                Document={'Bytes': document_bytes}
-            )
+            if self._should_use_async(document_bytes, page_count):
+                response = self._detect_document_text_async(document_bytes, cache_key)
+                processing_mode = 'async'
+            else:
+                # Use detect_document_text for synchronous processing
+                response = self._call_textract(
+                    'detect_document_text', Document={'Bytes': document_bytes}
+                )
+                processing_mode = 'sync'
             
             # Extract text from response
             extracted_text = self._parse_textract_response(response)
@@ -86,11 +402,23 @@ class TextractService:
                 raise Exception("No text could be extracted from the document")
             
             logger.info(f"Successfully extracted {len(extracted_text)} characters from document")
-            return extracted_text
+            document_info = self._build_document_info(response)
+            document_info['processing_mode'] = processing_mode
+            document_info['backend'] = self.name
+            page_count = document_info['document_metadata'].get('Pages', 1)
+            document_info['page_backends'] = [self.name] * max(page_count, 1)
+            result = {
+                'text': extracted_text,
+                'document_info': document_info
+            }
+            if use_cache:
+                self.cache.set(cache_key, result)
+            return result
             
         except ClientError as e:
             error_code = e.response['Error']['Code']
             error_message = e.response['Error']['Message']
+            TEXTRACT_ERRORS.inc(code=error_code)
             
             if error_code == 'InvalidParameterException':
                 raise Exception(f"Invalid document format: {error_message}")
@@ -103,10 +431,105 @@ class TextractService:
             else:
                 raise Exception(f"AWS Textract error: {error_message}")
                 
+        except NoCredentialsError:
+            TEXTRACT_ERRORS.inc(code='NoCredentials')
+            logger.error("AWS credentials not found. Please check your environment variables.")
+            raise Exception("AWS credentials not configured. Please set AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY")
         except Exception as e:
             logger.error(f"Text extraction failed: {e}")
             raise Exception(f"Failed to extract text: {e}")
     
+    @property
+    def accepts_multipage_documents(self) -> bool:
+        """Multi-page PDFs need the job-based API, which reads them from S3"""
+        return self.s3_bucket is not None
+    
+    def _should_use_async(self, document_bytes: bytes, page_count: Optional[int] = None) -> bool:
+        """
+        Decide whether a document needs the job-based Textract API
+        
+        Args:
+            document_bytes: Document content as bytes
+            page_count: Known page count; counted from the PDF when omitted
+            
+        Returns:
+            True for documents that are too large or have too many pages for detect_document_text
+        """
+        if len(document_bytes) > self.sync_max_bytes:
+            needs_async = True
+        else:
+            needs_async = (page_count if page_count is not None else pdf_page_count(document_bytes)) > 1
+        if needs_async and not self.s3_bucket:
+            logger.warning("Document needs asynchronous Textract processing but TEXTRACT_S3_BUCKET is not set")
+            return False
+        return needs_async
+    
+    def _get_s3_client(self):
+        if self.s3_client is None:
+            with self._client_lock:
+                if self.s3_client is None:
+                    self.s3_client = self._create_client('s3')
+        return self.s3_client
+    
+    def _detect_document_text_async(self, document_bytes: bytes, document_hash: str) -> Dict[str, Any]:
+        """
+        Run text detection through S3 and start/get_document_text_detection
+        
+        Args:
+            document_bytes: Document content as bytes
+            document_hash: Content hash used in the uploaded object's name
+            
+        Returns:
+            Textract-style response with the blocks of all pages merged in order
+            
+        Raises:
+            Exception: If the job fails or does not finish in time
+        """
+        s3_client = self._get_s3_client()
+        # Unique per call: concurrent uploads of the same document must not
+        # delete each other's object while a job is still reading it
+        object_key = f"{self.s3_prefix}{document_hash}-{uuid.uuid4().hex}"
+        s3_client.put_object(Bucket=self.s3_bucket, Key=object_key, Body=document_bytes)
+        
+        try:
+            job = self._call_textract(
+                'start_document_text_detection', DocumentLocation={'S3Object': {'Bucket': self.s3_bucket, 'Name': object_key}}
+            )
+            job_id = job['JobId']
+            logger.info(f"Started Textract job {job_id} for document {document_hash[:12]}")
+            
+            # Wait for the job to finish
+            deadline = time.monotonic() + self.job_timeout
+            response = self._call_textract('get_document_text_detection', JobId=job_id)
+            while response.get('JobStatus') == 'IN_PROGRESS':
+                if time.monotonic() > deadline:
+                    raise Exception(f"Textract job {job_id} did not finish within {self.job_timeout:.0f} seconds")
+                time.sleep(self.poll_interval)
+                response = self._call_textract('get_document_text_detection', JobId=job_id)
+            
+            if response.get('JobStatus') == 'FAILED':
+                raise Exception(f"Textract job failed: {response.get('StatusMessage', 'unknown error')}")
+            if response.get('JobStatus') == 'PARTIAL_SUCCESS':
+                logger.warning(f"Textract job {job_id} only partially succeeded")
+            
+            # Collect every result page
+            blocks = list(response.get('Blocks', []))
+            document_metadata = response.get('DocumentMetadata', {})
+            next_token = response.get('NextToken')
+            while next_token:
+                response = self._call_textract('get_document_text_detection', JobId=job_id, NextToken=next_token)
+                blocks.extend(response.get('Blocks', []))
+                next_token = response.get('NextToken')
+            
+            # Result pages are not guaranteed to follow document page order
+            blocks.sort(key=lambda block: block.get('Page', 1))
+            return {'Blocks': blocks, 'DocumentMetadata': document_metadata}
+        finally:
+            try:
+                s3_client.delete_object(Bucket=self.s3_bucket, Key=object_key)
+            except Exception as e:
+                logger.warning(f"Failed to delete uploaded document {object_key}: {e}")
+    
     def _parse_textract_response(self, response: Dict[str, Any]) -> str:
         """
         Parse Textract response to extract text
@@ -142,27 +565,38 @@ class TextractService:
             Document information dictionary
         """
         try:
-            response = self.textract_client.detect_document_text(
-                Document={'Bytes': document_bytes}
+            response = self._call_textract(
+                'detect_document_text', Document={'Bytes': document_bytes}
             )
-            
-            # Count different types of blocks
-            block_counts = {}
-            for block in response.get('Blocks', []):
-                block_type = block.get('BlockType', 'UNKNOWN')
-                block_counts[block_type] = block_counts.get(block_type, 0) + 1
-            
-            return {
-                'total_blocks': len(response.get('Blocks', [])),
-                'block_types': block_counts,
-                'confidence_scores': self._get_confidence_scores(response),
-                'document_metadata': response.get('DocumentMetadata', {})
-            }
+            return self._build_document_info(response)
             
         except Exception as e:
             logger.warning(f"Failed to get document info: {e}")
             return {}
     
+    def _build_document_info(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build document information from a Textract response
+        
+        Args:
+            response: Textract API response
+            
+        Returns:
+            Document information dictionary
+        """
+        # Count different types of blocks
+        block_counts = {}
+        for block in response.get('Blocks', []):
+            block_type = block.get('BlockType', 'UNKNOWN')
+            block_counts[block_type] = block_counts.get(block_type, 0) + 1
+        
+        return {
+            'total_blocks': len(response.get('Blocks', [])),
+            'block_types': block_counts,
+            'confidence_scores': self._get_confidence_scores(response),
+            'document_metadata': response.get('DocumentMetadata', {})
+        }
+    
     def _get_confidence_scores(self, response: Dict[str, Any]) -> Dict[str, float]:
         """
         Extract confidence scores from Textract response
@@ -197,8 +631,7 @@ class TextractService:
             True if service is available, False otherwise
         """
         try:
-            sts_client = boto3.client('sts', region_name=self.region)
-            sts_client.get_caller_identity()
+            self._create_client('sts').get_caller_identity()
             return True
         except Exception:
             return False
@@ -206,14 +639,24 @@ class TextractService:
 # Global instance
 textract_service = None
 
-def get_textract_service() -> TextractService:
+def get_textract_service() -> ExtractionBackend:
     """
-    Get or create Textract service instance
+    Get or create the document extraction backend
+    
+    EXTRACTION_BACKEND selects 'textract' to send every document to Textract,
+    or 'auto' (default) to read born-digital PDFs locally and only use
+    Textract for scanned pages and images.
     
     Returns:
-        TextractService instance
+        ExtractionBackend instance backed by TextractService
     """
     global textract_service
     if textract_service is None:
-        textract_service = TextractService()
+        backend = TextractService()
+        if os.getenv('EXTRACTION_BACKEND', 'auto') == 'auto':
+            if PdfTextLayerBackend.is_available():
+                backend = PdfTextLayerBackend(backend)
+            else:
+                logger.warning("pypdf is not installed; sending every document to Textract")
+        textract_service = backend
     return textract_service
@@ -0,0 +1,141 @@
+import json
+from typing import Dict, Optional, Tuple
+
+# Leading bytes of every accepted document type
+DOCUMENT_SIGNATURES = (
+    (b'%PDF-', 'pdf'),
+    (b'\x89PNG\r\n\x1a\n', 'png'),
+    (b'\xff\xd8\xff', 'jpeg'),
+    (b'II*\x00', 'tiff'),
+    (b'MM\x00*', 'tiff'),
+)
+
+# Uploads are read in chunks of this size when their length is not known up front
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+class UploadTooLarge(Exception):
+    """Raised when an upload exceeds its size limit"""
+
+def sniff_document_type(content: bytes) -> Optional[str]:
+    """
+    Identify a document by its magic bytes
+
+    Args:
+        content: Document content, or at least its first few bytes
+
+    Returns:
+        'pdf', 'png', 'jpeg' or 'tiff', or None for anything else
+    """
+    for signature, document_type in DOCUMENT_SIGNATURES:
+        if content.startswith(signature):
+            return document_type
+    return None
+
+async def read_upload(file, max_bytes: int, chunk_size: int = UPLOAD_CHUNK_SIZE) -> bytes:
+    """
+    Read an uploaded file, giving up as soon as it exceeds a size limit
+
+    Uploads whose size is already known are rejected without being read,
+    and otherwise read in one piece; the rest are read chunk by chunk.
+
+    Args:
+        file: Starlette UploadFile
+        max_bytes: Largest accepted size
+        chunk_size: Bytes read at a time when the size is unknown
+
+    Returns:
+        File content
+
+    Raises:
+        UploadTooLarge: If the file is larger than max_bytes
+    """
+    size = getattr(file, 'size', None)
+    if size is not None:
+        if size > max_bytes:
+            raise UploadTooLarge(f"Upload of {size} bytes exceeds {max_bytes} bytes")
+        return await file.read()
+    chunks = []
+    total = 0
+    while True:
+        chunk = await file.read(chunk_size)
+        if not chunk:
+            break
+        total += len(chunk)
+        if total > max_bytes:
+            raise UploadTooLarge(f"Upload exceeds {max_bytes} bytes")
+        chunks.append(chunk)
+    return chunks[0] if len(chunks) == 1 else b''.join(chunks)
+
+class UploadLimitMiddleware:
+    def __init__(self, app, limits: Dict[str, Tuple[int, str]]):
+        """
+        ASGI middleware rejecting oversized request bodies before they are parsed
+
+        Requests announcing a larger Content-Length are answered with 413
+        without reading the body; bodies without one are counted as they
+        stream in and cut off once they pass the limit, so an oversized
+        upload is never spooled in full.
+
+        Args:
+            app: ASGI application
+            limits: (maximum body size in bytes, error message) by POST path
+        """
+        self.app = app
+        self.limits = {
+            path: (limit, json.dumps({"error": error}).encode('utf-8')) for path, (limit, error) in limits.items()
+        }
+
+    async def __call__(self, scope, receive, send):
+        entry = self.limits.get(scope.get('path')) if scope['type'] == 'http' and scope['method'] == 'POST' else None
+        if entry is None:
+            await self.app(scope, receive, send)
+            return
+        limit, body = entry
+
+        content_length = dict(scope['headers']).get(b'content-length', b'')
+        if content_length.isdigit() and int(content_length) > limit:
+            await self._reject(send, body)
+            return
+
+        received = 0
+        rejected = False
+        response_started = False
+
+        async def limited_receive():
+            nonlocal received, rejected
+            message = await receive()
+            if message['type'] == 'http.request':
+                received += len(message.get('body', b''))
+                if received > limit:
+                    rejected = True
+                    raise UploadTooLarge(f"Request body exceeds {limit} bytes")
+            return message
+
+        async def guarded_send(message):
+            nonlocal response_started
+            # Whatever the application answers to the aborted body is replaced by the 413
+            if rejected:
+                return
+            response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            if not rejected:
+                raise
+        if rejected and not response_started:
+            await self._reject(send, body)
+
+    @staticmethod
+    async def _reject(send, body: bytes):
+        await send({
+            'type': 'http.response.start',
+            'status': 413,
+            'headers': [
+                (b'content-type', b'application/json'),
+                (b'content-length', str(len(body)).encode('ascii')),
+                (b'connection', b'close'),
+            ],
+        })
+        await send({'type': 'http.response.body', 'body': body})